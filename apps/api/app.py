@@ -0,0 +1,118 @@
+"""
+WHAT THIS FILE DOES:
+    Defines the Swarm HTTP API (FastAPI): submit Goals and stream their judged Results
+    as NDJSON, fetch trends, and expose health and metrics.
+
+WHY IT EXISTS:
+    Clients should see each Task's Result the moment the Judge has ruled on it rather
+    than wait for the whole Goal, and one process should hold thousands of open Goals.
+    Every handler is async and the pipeline's blocking stages run off the event loop,
+    so an open Goal costs a suspended coroutine, not a thread.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - POST /goals -> apps.orchestrator.service.SwarmService (one shared pipeline).
+      Response: application/x-ndjson, one TaskOutcome per line; X-Goal-Ids header.
+    - GET /trends -> skills.trend_fetcher (specs/technical.md contract: a JSON array
+      of trends). Live sources when TREND_SOURCE_URLS is set, else the cached skill;
+      `query` filters and ranks them (skills.trend_fetcher.search).
+    - GET /metrics -> core.metrics in Prometheus text format. GET /health.
+    - Served by apps.api.main (uvicorn).
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from core.metrics import CONTENT_TYPE, default_metrics
+from apps.api.schemas import SubmitGoalsRequest
+from apps.orchestrator.service import ServiceBusy, SwarmService
+from skills.trend_fetcher import skill as trend_skill
+from skills.trend_fetcher.search import QueryError, TrendIndex
+
+NDJSON = "application/x-ndjson"
+
+
+def create_app(service: Optional[SwarmService] = None) -> FastAPI:
+    """
+    WHY: To build the API around a SwarmService (a custom one in tests).
+    WHEN: At import (module-level `app`) or by tests.
+    WHO CALLS: apps.api.main via uvicorn, tests.
+    """
+    swarm = service or SwarmService()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await swarm.start()
+        try:
+            yield
+        finally:
+            await swarm.stop()
+
+    app = FastAPI(title="Project Chimera Swarm API", lifespan=lifespan)
+    app.state.swarm = swarm
+
+    @app.post("/goals")
+    async def submit_goals(request: SubmitGoalsRequest) -> StreamingResponse:
+        goals = [goal.to_goal() for goal in request.goals]
+        try:
+            outcomes = swarm.submit(goals)
+        except ServiceBusy as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+        async def lines() -> AsyncIterator[str]:
+            try:
+                async for outcome in outcomes:
+                    yield outcome.model_dump_json() + "\n"
+            except Exception as e:
+                # The status line is already sent, so the failure is reported in-band.
+                yield json.dumps({"error": str(e)}) + "\n"
+            finally:
+                await outcomes.aclose()
+
+        goal_ids = ",".join(g.id for g in goals)
+        return StreamingResponse(lines(), media_type=NDJSON, headers={"X-Goal-Ids": goal_ids})
+
+    @app.get("/trends")
+    async def get_trends(
+        platform: Optional[str] = None,
+        region: Optional[str] = None,
+        query: Optional[str] = None,
+        limit: int = Query(20, ge=1, le=100),
+    ) -> List[Dict[str, Any]]:
+        input_data: Dict[str, Any] = {"limit": limit}
+        if platform:
+            input_data["platform"] = platform
+            input_data["sources"] = [platform]
+        if region:
+            input_data["region"] = region
+        if query:
+            input_data["query"] = query
+
+        if trend_skill.SOURCE_ENDPOINTS:
+            output = await trend_skill.fetch_trends_async(input_data)
+        else:
+            output = await asyncio.to_thread(trend_skill.fetch_trends_cached, input_data)
+        if not query:
+            return output["trends"][:limit]
+        # Rank what was fetched against the query (BM25; see TrendIndex for the syntax).
+        try:
+            return [trend for trend, _ in TrendIndex(output["trends"]).search(query, limit)]
+        except QueryError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    @app.get("/metrics")
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(default_metrics.render(), media_type=CONTENT_TYPE)
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "ok" if swarm.running else "stopped", "open_goals": swarm.open_goals}
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,37 @@
+"""
+WHAT THIS FILE DOES:
+    Entrypoint for the Swarm HTTP API.
+    It serves apps.api.app with uvicorn.
+
+WHY IT EXISTS:
+    To allows the API to be run as a standalone process (e.g., via Docker or CLI).
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Serves apps.api.app:app on API_HOST:API_PORT (default 0.0.0.0:8000).
+    - One process, one event loop, one shared SwarmPipeline; scale out with more
+      processes behind a load balancer.
+"""
+
+import sys
+import os
+
+# Add the project root to sys.path so we can import 'core' and 'apps'
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+def main():
+    import uvicorn
+
+    print("🌐 Starting Swarm API...")
+    uvicorn.run(
+        "apps.api.app:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        # Results are streamed; keep connections open while Goals run.
+        timeout_keep_alive=int(os.getenv("API_KEEP_ALIVE", "30")),
+    )
+
+if __name__ == "__main__":
+    main()
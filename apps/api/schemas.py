@@ -0,0 +1,38 @@
+"""
+WHAT THIS FILE DOES:
+    Defines the request bodies of the Swarm HTTP API.
+
+WHY IT EXISTS:
+    Clients send plain descriptions; IDs and timestamps are assigned server-side so
+    they cannot collide with Goals already in flight.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Consumed by apps.api.app.
+    - Each GoalRequest becomes a core.task_models.Goal.
+"""
+
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from core.task_models import Goal
+
+
+class GoalRequest(BaseModel):
+    """
+    One Goal as submitted over HTTP.
+    """
+    description: str = Field(..., min_length=1, description="What needs to be achieved.")
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Contextual data for the goal."
+    )
+
+    def to_goal(self) -> Goal:
+        return Goal(description=self.description, metadata=self.metadata)
+
+
+class SubmitGoalsRequest(BaseModel):
+    """
+    Body of POST /goals.
+    """
+    goals: List[GoalRequest] = Field(..., min_length=1)
@@ -8,10 +8,13 @@ WHY IT EXISTS:
     It enables testing input variations and seeing immediate results.
 
 HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
-    - Imports PlannerService, WorkerExecutor, JudgeValidator.
-    - Captures user input (Goal).
-    - Orchestrates the full execution flow.
-    - Displays outputs from each stage.
+    - Live mode (default): submits Goals to a BackgroundSwarm (apps.frontend.live),
+      which runs the shared SwarmService on its own thread, and draws each judged
+      Task as it lands, with its measured per-stage latency.
+    - Step-by-step mode: plans one Goal with PlannerService, then runs its Tasks one
+      at a time in dependency order (live.run_step_by_step, i.e. DagScheduler, with
+      upstream output wired in), judging each with JudgeValidator as it lands.
+    - Services are built once per process (st.cache_resource), not on every rerun.
 """
 
 import streamlit as st
@@ -28,10 +31,31 @@ current_dir = os.path.dirname(os.path.abspath(__file__)) # .../apps/frontend
 root_dir = os.path.dirname(os.path.dirname(current_dir)) # .../Project-Chimera-TRP1
 sys.path.append(root_dir)
 
-from core.task_models import Goal, Task, Result
-from apps.planner.service import PlannerService
-from apps.worker.executor import WorkerExecutor
-from apps.judge.validator import JudgeValidator
+from core.task_models import Goal  # noqa: E402
+from apps.planner.service import PlannerService  # noqa: E402
+from apps.worker.executor import WorkerExecutor  # noqa: E402
+from apps.judge.validator import JudgeValidator  # noqa: E402
+from apps.frontend.live import STAGES, BackgroundSwarm, run_step_by_step  # noqa: E402
+
+LIVE = "Live (background swarm)"
+STEP_BY_STEP = "Step-by-step (single Goal)"
+POLL_SECONDS = float(os.getenv("FRONTEND_POLL_SECONDS", "0.25"))
+# Results drawn in full; the rest are only counted.
+MAX_FEED = int(os.getenv("FRONTEND_MAX_FEED", "200"))
+
+
+# ------------------------------------------------------------------
+# SHARED SERVICES (built once per process, kept across reruns)
+# ------------------------------------------------------------------
+@st.cache_resource
+def get_swarm() -> BackgroundSwarm:
+    return BackgroundSwarm()
+
+
+@st.cache_resource
+def get_services():
+    return PlannerService(), WorkerExecutor(), JudgeValidator()
+
 
 # ------------------------------------------------------------------
 # UI LAYOUT
@@ -58,6 +82,12 @@ with st.sidebar:
     st.divider()
     model_choice = st.selectbox("LLM Model (Simulation)", ["mock-model", "gpt-4", "claude-3-opus"])
     st.caption("Currently using Mock Logic.")
+    st.divider()
+    mode = st.radio("Run Mode", [LIVE, STEP_BY_STEP])
+    copies = st.number_input(
+        "Goals to submit", min_value=1, max_value=1000, value=1, disabled=mode != LIVE
+    )
+    st.caption("Latencies are measured, per stage: plan, queue wait, execute, judge.")
 
 # ------------------------------------------------------------------
 # INPUT SECTION
@@ -75,69 +105,162 @@ with col2:
     st.write("## ")
     run_btn = st.button("🚀 EXECUTE SWARM", type="primary", use_container_width=True)
 
+
+def timings_caption(timings_ms):
+    return " · ".join(f"{stage}: {timings_ms.get(stage, 0.0):.2f}ms" for stage in STAGES)
+
+
+def render_outcome(outcome):
+    task, result = outcome.task, outcome.result
+    col_worker, col_judge = st.columns(2)
+    with col_worker:
+        st.markdown(f"**✅ {task.type}** · Goal `{outcome.goal_id[:8]}`")
+        st.json(result.output_data, expanded=False)
+        st.caption(timings_caption(outcome.timings_ms))
+    with col_judge:
+        if outcome.is_valid:
+            st.success("✅ **APPROVED**")
+            st.write(result.validation_notes)
+        else:
+            st.error("❌ **REJECTED**")
+            st.error(result.validation_notes)
+
+
+def render_feed(outcomes, feed, shown):
+    """Draws outcomes into the feed up to MAX_FEED; returns how many have arrived in total."""
+    with feed:
+        for outcome in outcomes:
+            if shown < MAX_FEED:
+                render_outcome(outcome)
+                st.divider()
+            shown += 1
+    return shown
+
+
+def render_summary(run, placeholder):
+    with placeholder.container():
+        judged = len(run.outcomes)
+        approved = sum(1 for outcome in run.outcomes if outcome.is_valid)
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Goals complete", f"{run.goals_complete}/{len(run.goals)}")
+        m2.metric("Tasks judged", judged)
+        m3.metric("Approved", f"{approved}/{judged}")
+        m4.metric("Elapsed", f"{run.elapsed_seconds:.2f}s")
+        st.progress(run.goals_complete / len(run.goals))
+
+        totals = run.stage_totals_ms()
+        st.dataframe(
+            [
+                {
+                    "stage": stage,
+                    "total ms": round(totals[stage], 2),
+                    "mean ms / task": round(totals[stage] / judged, 3) if judged else 0.0,
+                }
+                for stage in STAGES
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+# ------------------------------------------------------------------
+# EXECUTION LOGIC: LIVE (background swarm, results stream in)
+# ------------------------------------------------------------------
+if mode == LIVE:
+    if run_btn and goal_text:
+        goals = [Goal(description=goal_text) for _ in range(copies)]
+        st.session_state["live_run"] = get_swarm().submit(goals)
+        st.session_state["celebrated"] = False
+
+    run = st.session_state.get("live_run")
+    if run is not None:
+        st.divider()
+        st.subheader("📈 Live Swarm Run")
+        summary = st.empty()
+        st.subheader("🛠️ Worker & ⚖️ Judge Results")
+        feed = st.container()
+
+        # A rerun (any widget change) starts here again: redraw what has landed so far.
+        shown = render_feed(run.outcomes, feed, 0)
+        render_summary(run, summary)
+        while not run.done:
+            new = run.poll(timeout=POLL_SECONDS)
+            shown = render_feed(new, feed, shown)
+            render_summary(run, summary)
+
+        if shown > MAX_FEED:
+            st.caption(f"{shown - MAX_FEED} more results not shown.")
+        if run.error is not None:
+            st.error(f"Run failed: {run.error}")
+        elif not st.session_state.get("celebrated"):
+            st.session_state["celebrated"] = True
+            st.balloons()
+
 # ------------------------------------------------------------------
-# EXECUTION LOGIC
+# EXECUTION LOGIC: STEP-BY-STEP (one Goal, stage by stage)
 # ------------------------------------------------------------------
-if run_btn and goal_text:
+elif run_btn and goal_text:
     st.divider()
-    
+    planner, worker, judge = get_services()
+
     # containers for each stage
     planner_container = st.container()
     worker_container = st.container()
-    
+
     # 1. PLANNER
     with planner_container:
         st.subheader("1. 🧠 Planner Agent")
         with st.spinner("Analyzing goal..."):
-            time.sleep(0.5) # UX Loading
-            planner = PlannerService()
             goal = Goal(description=goal_text)
+            start = time.perf_counter()
             tasks = planner.create_plan(goal)
-            
-        st.success(f"Goal decomposed into **{len(tasks)} tasks**.")
-        
+            plan_ms = (time.perf_counter() - start) * 1000
+
+        st.success(f"Goal decomposed into **{len(tasks)} tasks** in {plan_ms:.2f}ms.")
+
         # Visualize Plan
         for i, task in enumerate(tasks, 1):
             with st.expander(f"Task {i}: {task.type}", expanded=True):
                 st.write(task.description)
                 st.caption(f"Input: {task.input_data}")
 
-    # 2. WORKER & JUDGE LOOP
+    # 2. WORKER & JUDGE LOOP (dependency order, upstream output wired in)
     with worker_container:
         st.subheader("2. 🛠️ Worker & ⚖️ Judge Execution")
-        
-        worker = WorkerExecutor()
-        judge = JudgeValidator()
-        
+
         progress_bar = st.progress(0)
-        
-        for i, task in enumerate(tasks):
+        number = {task.id: i for i, task in enumerate(tasks, 1)}
+        finished = []
+
+        def show_step(task, result):
             col_worker, col_judge = st.columns(2)
-            
+
             # WORKER STEP
             with col_worker:
-                with st.spinner(f"Executing Task {i+1}..."):
-                    time.sleep(0.8) # UX simulation
-                    result = worker.execute_task(task)
-                
-                st.markdown(f"**✅ Task {i+1} Complete**")
+                st.markdown(f"**✅ Task {number[task.id]} Complete** · {task.type}")
                 st.json(result.output_data)
-                st.caption(f"Time: {result.execution_time_ms:.2f}ms")
+                st.caption(f"Execute: {result.execution_time_ms:.2f}ms")
 
             # JUDGE STEP
             with col_judge:
                 with st.spinner("Validating..."):
-                    time.sleep(0.2)
-                    is_valid = judge.validate_result(result)
-                
+                    start = time.perf_counter()
+                    is_valid = judge.validate_result(result, None, task.type)
+                    judge_ms = (time.perf_counter() - start) * 1000
+
                 if is_valid:
                     st.success("✅ **APPROVED**")
                     st.write(result.validation_notes)
                 else:
                     st.error("❌ **REJECTED**")
                     st.error(result.validation_notes)
-            
+                st.caption(f"Judge: {judge_ms:.2f}ms")
+
             st.divider()
-            progress_bar.progress((i + 1) / len(tasks))
+            finished.append(task.id)
+            progress_bar.progress(len(finished) / len(tasks))
+
+        with st.spinner("Executing tasks..."):
+            run_step_by_step(tasks, worker.execute_task, show_step)
 
     st.balloons()
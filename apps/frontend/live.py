@@ -0,0 +1,176 @@
+"""
+WHAT THIS FILE DOES:
+    Runs a SwarmService on a background event loop thread and hands its TaskOutcomes
+    to synchronous code (the Streamlit script) as they land.
+
+WHY IT EXISTS:
+    Streamlit re-executes app.py top to bottom on every interaction, on its own
+    thread. Building the services and running Goals inline made every click pay
+    start-up cost and blocked the page until the last Task was judged. The swarm
+    now lives once per process and keeps running between reruns; the page only
+    polls for what has finished.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Wraps apps.orchestrator.service.SwarmService (the same switchboard as apps.api).
+    - apps.frontend.app keeps one BackgroundSwarm per process (st.cache_resource)
+      and one LiveRun per browser session.
+    - run_step_by_step drives the page's step-by-step mode through DagScheduler, the
+      pipeline's own scheduler, so Tasks run in dependency order with inputs wired.
+    - No Streamlit import here, so it can be tested on its own.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from core.task_models import Goal, Result, Task
+from apps.orchestrator.schemas import TaskOutcome
+from apps.orchestrator.scheduler import DagScheduler
+from apps.orchestrator.service import SwarmService
+
+STAGES = ("plan", "queue_wait", "execute", "judge")
+
+_DONE = object()
+
+
+class LiveRun:
+    """
+    ROLE IN SWARM:
+        The "Ticker": one submission's outcomes, filled from the swarm's thread and
+        read from the page's.
+    """
+
+    def __init__(self, goals: Sequence[Goal]):
+        self.goals = list(goals)
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.outcomes: List[TaskOutcome] = []
+        self.error: Optional[BaseException] = None
+        self._inbox: "queue.Queue" = queue.Queue()
+
+    @property
+    def done(self) -> bool:
+        return self.finished is not None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def goals_complete(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.goal_complete)
+
+    def poll(self, timeout: float = 0.0) -> List[TaskOutcome]:
+        """
+        WHY: To pick up outcomes that landed since the last call.
+        WHEN: In the page's render loop.
+        WHO CALLS: apps.frontend.app
+
+        Waits up to `timeout` seconds for the first one, then takes whatever else is
+        ready without waiting. Returns only the new outcomes (also added to
+        `outcomes`).
+        """
+        new: List[TaskOutcome] = []
+        block = timeout > 0
+        while not self.done:
+            try:
+                item = self._inbox.get(block=block, timeout=timeout if block else None)
+            except queue.Empty:
+                break
+            block = False
+            if item is _DONE:
+                self.finished = time.perf_counter()
+            elif isinstance(item, BaseException):
+                self.error = item
+            else:
+                new.append(item)
+        self.outcomes.extend(new)
+        return new
+
+    def stage_totals_ms(self) -> Dict[str, float]:
+        """Summed measured time per stage; plan is counted once per Goal."""
+        totals = dict.fromkeys(STAGES, 0.0)
+        for outcome in self.outcomes:
+            for stage, ms in outcome.timings_ms.items():
+                if stage == "plan" and not outcome.goal_complete:
+                    continue
+                totals[stage] = totals.get(stage, 0.0) + ms
+        return totals
+
+    # Called on the swarm's loop thread.
+    def _put(self, item) -> None:
+        self._inbox.put(item)
+
+
+class BackgroundSwarm:
+    """
+    ROLE IN SWARM:
+        The "Engine Room": a started SwarmService and the event loop it runs on,
+        shared by every session of the control panel.
+    """
+
+    def __init__(self, service: Optional[SwarmService] = None):
+        self.service = service or SwarmService()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="chimera-swarm-ui", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.service.start(), self.loop).result()
+
+    def submit(self, goals: Sequence[Goal]) -> LiveRun:
+        """
+        WHY: To run Goals without blocking the caller.
+        WHEN: When the user presses Execute.
+        WHO CALLS: apps.frontend.app
+
+        Returns at once; the LiveRun fills in as Tasks are judged and is done once
+        every Goal is complete (or the submission failed, see `LiveRun.error`).
+        """
+        run = LiveRun(goals)
+        asyncio.run_coroutine_threadsafe(self._consume(run), self.loop)
+        return run
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.service.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    async def _consume(self, run: LiveRun) -> None:
+        # submit() must run on the service's loop; ServiceBusy surfaces here too.
+        try:
+            async for outcome in self.service.submit(run.goals):
+                run._put(outcome)
+        except Exception as e:
+            run._put(e)
+        finally:
+            run._put(_DONE)
+
+
+def run_step_by_step(
+    tasks: List[Task],
+    execute_task: Callable[[Task], Result],
+    on_result: Callable[[Task, Result], None],
+) -> None:
+    """
+    WHY: The step-by-step page must run a plan the way the pipeline does: a Task
+         starts only once its depends_on are done, with their output_data in its
+         input_data.
+    WHEN: Once per step-by-step run, on the calling (Streamlit script) thread.
+    WHO CALLS: apps.frontend.app
+
+    Runs one Task at a time through DagScheduler.run; `execute_task` runs on a
+    worker thread, `on_result` on the calling thread as each Result lands
+    (dependents skipped after a failure included).
+    """
+
+    async def execute(task: Task) -> Result:
+        return await asyncio.to_thread(execute_task, task)
+
+    async def report(task: Task, result: Result) -> None:
+        on_result(task, result)
+
+    asyncio.run(DagScheduler(execute, 1, on_result=report).run(tasks))
@@ -10,6 +10,7 @@ HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
     - Instantiates JudgeValidator.
     - (Simulation) Receives a Result.
     - Validates it and prints the verdict.
+    - Serves Prometheus metrics on METRICS_PORT when set (core.metrics).
 """
 
 import sys
@@ -23,11 +24,13 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from core.task_models import Result
-from apps.judge.validator import JudgeValidator
+from core.task_models import Result  # noqa: E402
+from core.metrics import serve_metrics_from_env  # noqa: E402
+from apps.judge.validator import JudgeValidator  # noqa: E402
 
 def main():
     print("⚖️  Starting Judge Service...")
+    serve_metrics_from_env()
     
     # 1. Instantiate the Validator
     judge = JudgeValidator()
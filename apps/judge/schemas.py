@@ -0,0 +1,348 @@
+"""
+WHAT THIS FILE DOES:
+    Loads the JSON Schemas in specs/schemas, builds a validator for each one once per
+    process and hands them to the Judge by task type.
+
+WHY IT EXISTS:
+    The specs are the source of truth for output contracts, so the Judge should check
+    Results against them rather than re-implementing the rules by hand. Parsing a
+    schema and checking it against its metaschema is far more expensive than
+    validating one document, so that work is done once and the result is cached.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Source: specs/schemas/*.schema.json
+    - Consumer: apps.judge.validator.JudgeValidator
+"""
+
+import json
+import math
+import numbers
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+
+SCHEMA_DIR = Path(__file__).resolve().parents[2] / "specs" / "schemas"
+
+# Which contract each task type's output must satisfy.
+TASK_TYPE_SCHEMAS: Dict[str, str] = {
+    "fetch_trends": "trend.schema.json",
+}
+
+
+class CompiledSchema:
+    """
+    ROLE IN SWARM:
+        A ready-to-use validator for one schema id/version.
+    """
+
+    def __init__(self, schema: Dict[str, Any], schema_id: str, version: str):
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        self.schema = schema
+        self.schema_id = schema_id
+        self.version = version
+        self._validator = cls(schema)
+        self.fast_rules = FastRules.from_schema(schema)
+
+    def __reduce__(self):
+        # Ship the source, not the validator; the receiving process compiles it once.
+        return _compiled_from_source, (self.schema, self.schema_id, self.version)
+
+    def first_error(self, data: Any) -> Optional[ValidationError]:
+        """
+        Fast path: stops at the first violation (errors are produced lazily).
+        """
+        return next(self._validator.iter_errors(data), None)
+
+    def all_errors(self, data: Any) -> List[ValidationError]:
+        """
+        Full report: every violation, ordered by location in the document.
+        """
+        return sorted(
+            self._validator.iter_errors(data), key=lambda e: list(map(str, e.absolute_path))
+        )
+
+
+_compiled_in_process: Dict[Tuple[str, str], "CompiledSchema"] = {}
+
+
+def _compiled_from_source(schema: Dict[str, Any], schema_id: str, version: str) -> CompiledSchema:
+    compiled = _compiled_in_process.get((schema_id, version))
+    if compiled is None:
+        compiled = CompiledSchema(schema, schema_id, version)
+        _compiled_in_process[(schema_id, version)] = compiled
+    return compiled
+
+
+class UnsupportedSchema(ValueError):
+    """Raised when a schema uses keywords FastRules cannot check."""
+
+
+# Largest magnitude up to which every int converts to a float exactly.
+_FLOAT_EXACT_INT = 2**53
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return (isinstance(value, int) and not isinstance(value, bool)) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+# Same type semantics as jsonschema's default type checker.
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _any_of(checks: List[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    return lambda v: any(check(v) for check in checks)
+
+
+# Keywords that never affect validity.
+_ANNOTATIONS = {
+    "$id", "$schema", "$comment", "version", "title", "description", "examples", "default"
+}
+
+# (path below the checked value, text before the subject, text after the subject)
+_Failure = Tuple[Tuple[Union[str, int], ...], str, str]
+
+
+class FastRules:
+    """
+    A schema compiled into checks that run over a whole batch of documents at once.
+
+    Covers the keywords the specs use (type, required, properties, items, minItems of
+    1, minimum/maximum). Checks run in the schema's keyword order, exactly like
+    jsonschema, so for a supported schema `check` is a complete verdict: a document
+    passes iff it is valid, and a failing one gets the note describe_error gives for
+    its first error. `from_schema` returns None for schemas outside that subset.
+    """
+
+    def __init__(self, plan: List[tuple]):
+        self.plan = plan
+
+    @classmethod
+    def from_schema(cls, schema: Dict[str, Any]) -> Optional["FastRules"]:
+        try:
+            return cls(_compile_checks(schema))
+        except UnsupportedSchema:
+            return None
+
+    def check(self, documents: List[Any]) -> Dict[int, str]:
+        """
+        Returns {position in `documents`: note} for the invalid documents.
+        """
+        return {
+            position: before + location_of(path) + after
+            for position, (path, before, after) in _first_failures(self.plan, documents).items()
+        }
+
+
+def _compile_checks(schema: Any) -> List[tuple]:
+    if not isinstance(schema, dict):
+        raise UnsupportedSchema(f"schema {schema!r}")
+    plan: List[tuple] = []
+    for keyword, value in schema.items():
+        if keyword in _ANNOTATIONS:
+            continue
+        if keyword == "type":
+            names = value if isinstance(value, list) else [value]
+            if not all(name in _TYPE_CHECKS for name in names):
+                raise UnsupportedSchema(f"type {value!r}")
+            checks = [_TYPE_CHECKS[name] for name in names]
+            accepts = checks[0] if len(checks) == 1 else _any_of(checks)
+            plan.append(("type", ", ".join(repr(name) for name in names), accepts))
+        elif keyword == "required":
+            plan.append(("required", list(value)))
+        elif keyword == "minItems":
+            # describe_error only has its own wording for empty arrays.
+            if value > 1:
+                raise UnsupportedSchema("minItems > 1")
+            if value == 1:
+                plan.append(("min_items",))
+        elif keyword in ("minimum", "maximum"):
+            # One check for both bounds, at the position of the first one.
+            if not any(check[0] == "range" for check in plan):
+                low, high = schema.get("minimum", -math.inf), schema.get("maximum", math.inf)
+                plan.append(("range", low, high, f"[{low},{high}]"))
+        elif keyword == "properties":
+            properties = [(name, _compile_checks(sub)) for name, sub in value.items()]
+            plan.append(("properties", properties))
+        elif keyword == "items":
+            plan.append(("items", _compile_checks(value)))
+        else:
+            raise UnsupportedSchema(keyword)
+    return plan
+
+
+def _first_failures(plan: List[tuple], values: List[Any]) -> Dict[int, _Failure]:
+    """
+    Runs each check over every value at once (keywords, like jsonschema's, only apply
+    to values of their type) and keeps the first failure per value.
+    """
+    n = len(values)
+    failed: Dict[int, _Failure] = {}
+    for check in plan:
+        kind = check[0]
+        if kind == "type":
+            _, names, accepts = check
+            bad = ~np.fromiter(map(accepts, values), dtype=bool, count=n)
+            for p in np.flatnonzero(bad).tolist():
+                failed.setdefault(p, ((), "", f": {values[p]!r} is not of type {names}"))
+        elif kind == "required":
+            names = check[1]
+            bad = np.fromiter(
+                (isinstance(v, dict) and not all(name in v for name in names) for v in values),
+                dtype=bool,
+                count=n,
+            )
+            for p in np.flatnonzero(bad).tolist():
+                missing = [name for name in names if name not in values[p]]
+                failed.setdefault(p, ((), f"Missing {', '.join(missing)} in ", "."))
+        elif kind == "min_items":
+            bad = np.fromiter((isinstance(v, list) and not v for v in values), dtype=bool, count=n)
+            for p in np.flatnonzero(bad).tolist():
+                failed.setdefault(p, ((), "", " is empty."))
+        elif kind == "range":
+            _, low, high, bounds = check
+            # Non-numbers become NaN, which compares False: the range does not apply to them.
+            # Numbers a float cannot hold exactly (ints past 2**53, huge Decimals) are
+            # compared in Python instead, like jsonschema does.
+            as_float = np.full(n, np.nan)
+            exact = []
+            for p, v in enumerate(values):
+                if not _is_number(v):
+                    continue
+                if isinstance(v, int) and abs(v) > _FLOAT_EXACT_INT:
+                    exact.append(p)
+                    continue
+                try:
+                    as_float[p] = float(v)
+                except OverflowError:
+                    exact.append(p)
+            with np.errstate(invalid="ignore"):
+                bad = (as_float < float(low)) | (as_float > float(high))
+            out_of_range = np.flatnonzero(bad).tolist()
+            out_of_range += [p for p in exact if values[p] < low or values[p] > high]
+            for p in out_of_range:
+                failed.setdefault(p, ((), "", f" {values[p]} out of range {bounds}."))
+        elif kind == "properties":
+            for name, sub_plan in check[1]:
+                owners = [p for p, v in enumerate(values) if isinstance(v, dict) and name in v]
+                sub = _first_failures(sub_plan, [values[p][name] for p in owners])
+                for q, (path, before, after) in sub.items():
+                    failed.setdefault(owners[q], ((name,) + path, before, after))
+        elif kind == "items":
+            arrays = [v if isinstance(v, list) else [] for v in values]
+            sub = _first_failures(check[1], [item for array in arrays for item in array])
+            if not sub:
+                continue
+            lengths = np.fromiter(map(len, arrays), dtype=np.int64, count=n)
+            starts = np.cumsum(lengths) - lengths
+            bad = np.array(sorted(sub), dtype=np.int64)
+            # side="right" skips empty arrays, which share their start with the next one.
+            owners = np.searchsorted(starts, bad, side="right") - 1
+            first_owner, first_at = np.unique(owners, return_index=True)
+            for p, flat in zip(first_owner.tolist(), bad[first_at].tolist()):
+                path, before, after = sub[flat]
+                failed.setdefault(p, ((flat - int(starts[p]),) + path, before, after))
+    return failed
+
+
+class SchemaRegistry:
+    """
+    ROLE IN SWARM:
+        The Judge's "Rulebook".
+        Caches compiled schemas by file name and by (schema id, version).
+    """
+
+    def __init__(
+        self, schema_dir: Path = SCHEMA_DIR, task_type_schemas: Optional[Dict[str, str]] = None
+    ):
+        self.schema_dir = Path(schema_dir)
+        self.task_type_schemas = dict(
+            TASK_TYPE_SCHEMAS if task_type_schemas is None else task_type_schemas
+        )
+        self._by_file: Dict[str, CompiledSchema] = {}
+        self._by_id: Dict[Tuple[str, str], CompiledSchema] = {}
+        self._lock = threading.Lock()
+
+    def load(self, filename: str) -> CompiledSchema:
+        """
+        WHY: To get the compiled validator for a schema file.
+        WHEN: On every validation; only the first call per file touches disk.
+        WHO CALLS: SchemaRegistry.for_task_type, JudgeValidator.
+        """
+        compiled = self._by_file.get(filename)
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            compiled = self._by_file.get(filename)
+            if compiled is None:
+                schema = json.loads((self.schema_dir / filename).read_text())
+                key = (schema.get("$id", filename), str(schema.get("version", "0")))
+                # Two files declaring the same id/version share one validator.
+                compiled = self._by_id.get(key)
+                if compiled is None:
+                    compiled = CompiledSchema(schema, *key)
+                    self._by_id[key] = compiled
+                self._by_file[filename] = compiled
+        return compiled
+
+    def get(self, schema_id: str, version: str) -> Optional[CompiledSchema]:
+        return self._by_id.get((schema_id, version))
+
+    def for_task_type(self, task_type: str) -> Optional[CompiledSchema]:
+        filename = self.task_type_schemas.get(task_type)
+        return self.load(filename) if filename else None
+
+
+def location_of(path: Iterable[Union[str, int]]) -> str:
+    """
+    Renders a path in a document as it appears in notes: "trends[1].title", or
+    "output" for the document itself.
+    """
+    location = ""
+    for part in path:
+        if isinstance(part, int):
+            location += f"[{part}]"
+        else:
+            location += f".{part}" if location else str(part)
+    return location or "output"
+
+
+def describe_error(error: ValidationError) -> str:
+    """
+    Turns a jsonschema error into a short note for Result.validation_notes.
+    """
+    subject = location_of(error.absolute_path)
+
+    if error.validator in ("minimum", "maximum"):
+        low = error.schema.get("minimum", "-inf")
+        high = error.schema.get("maximum", "inf")
+        return f"{subject} {error.instance} out of range [{low},{high}]."
+    if error.validator == "minItems" and not error.instance:
+        return f"{subject} is empty."
+    if error.validator == "required":
+        missing = [name for name in error.validator_value if name not in error.instance]
+        return f"Missing {', '.join(missing)} in {subject}."
+    return f"{subject}: {error.message}"
+
+
+# Shared by every JudgeValidator in the process so each schema is compiled once.
+default_registry = SchemaRegistry()
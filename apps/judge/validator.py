@@ -13,10 +13,55 @@ HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
     - Output: Boolean (Valid/Invalid) + Feedback
     - Upstream: Receives Results from Worker.
     - Downstream: Approves completion or triggers feedback loop to Planner/Worker.
+
+BULK VALIDATION:
+    `validate_many` judges a burst of Results in one call. Empty outputs and worker
+    errors are found over the whole batch with NumPy, and so are schema violations for
+    schemas FastRules covers (all of specs/schemas). Other schemas, and full reports,
+    get the full JSON Schema validator, split into chunks and run on a pool. It returns
+    a BatchVerdict instead of mutating the Results (unless asked to).
 """
 
-from typing import Dict, Any, Optional
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Sequence
+
+import numpy as np
+
 from core.task_models import Result
+from core.metrics import default_metrics, stage_seconds, verdicts_total
+from apps.judge.schemas import (
+    CompiledSchema, SchemaRegistry, default_registry, describe_error,
+)
+
+GENERIC_NOTE = "Generic task completed successfully."
+
+
+class BatchVerdict:
+    """
+    Outcome of JudgeValidator.validate_many: one bool per Result (a NumPy bool
+    array, in input order) and notes for the failures only.
+    """
+    __slots__ = ("valid", "notes")
+
+    def __init__(self, valid: np.ndarray, notes: Dict[int, str]):
+        self.valid = valid
+        self.notes = notes
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.valid.tolist())
+
+    @property
+    def all_valid(self) -> bool:
+        return bool(self.valid.all())
+
+    def failures(self) -> List[int]:
+        return np.flatnonzero(~self.valid).tolist()
+
 
 class JudgeValidator:
     """
@@ -25,15 +70,47 @@ class JudgeValidator:
         It uses deterministic checks and (future) LLM evaluation to grade work.
     """
 
-    def validate_result(self, result: Result, criteria: Optional[Dict[str, Any]] = None) -> bool:
+    def __init__(
+        self,
+        schemas: Optional[SchemaRegistry] = None,
+        full_report: bool = False,
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = 256,
+    ):
+        self.schemas = schemas or default_registry
+        # False: stop at the first schema violation. True: list every violation.
+        self.full_report = full_report
+        # validate_many: batches with at least this many full schema checks use a pool.
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def validate_result(
+        self,
+        result: Result,
+        criteria: Optional[Dict[str, Any]] = None,
+        task_type: Optional[str] = None,
+    ) -> bool:
         """
         WHY: To assess whether the result is acceptable.
         WHEN: Called immediately after a Worker produces a Result.
-        WHO CALLS: apps.judge.main (Entrypoint)
+        WHO CALLS: apps.judge.main (Entrypoint), apps.orchestrator.pipeline
+
+        `task_type` selects the output schema. `criteria["full_report"]` overrides
+        the validator's default reporting mode for this call.
         """
         if criteria is None:
             criteria = {}
+        # Callers that do not know the task type fall back to inferring it from the data.
+        if task_type is None and result.output_data and "trends" in result.output_data:
+            task_type = "fetch_trends"
 
+        with default_metrics.span(stage_seconds, stage="judge", task_type=task_type or ""):
+            is_valid = self._judge(result, criteria, task_type)
+        verdicts_total.inc(task_type=task_type or "", verdict="valid" if is_valid else "invalid")
+        return is_valid
+
+    def _judge(self, result: Result, criteria: Dict[str, Any], task_type: Optional[str]) -> bool:
         # 1. Basic structural validation
         if not result.output_data:
             result.mark_invalid("Result output is empty.")
@@ -43,44 +120,187 @@ class JudgeValidator:
              result.mark_invalid(f"Worker reported error: {result.output_data['error']}")
              return False
 
-        # 2. Specific validation logic based on content
-        # In a real system, we might look up the Task type to know which rules to apply.
-        # Here we infer from data structure for the skeleton.
-        
-        is_trend_result = "trends" in result.output_data
-        
-        if is_trend_result:
-            return self._validate_trends(result)
+        # 2. Contract validation against specs/schemas, chosen by task type.
+        schema = self.schemas.for_task_type(task_type) if task_type else None
+        if schema is not None:
+            full_report = criteria.get("full_report", self.full_report)
+            return self._validate_schema(result, schema, full_report)
             
         # Default pass for generic tasks if no error
-        result.mark_valid("Generic task completed successfully.")
+        result.mark_valid(GENERIC_NOTE)
         return True
 
-    def _validate_trends(self, result: Result) -> bool:
+    def validate_many(
+        self,
+        results: Sequence[Result],
+        criteria: Optional[Dict[str, Any]] = None,
+        task_types: Optional[Sequence[Optional[str]]] = None,
+        executor: Optional[Executor] = None,
+        mark: bool = False,
+    ) -> BatchVerdict:
         """
-        Validates trend fetch results against the schema constraints.
+        WHY: To keep up with bursts of Results without paying per-call overhead.
+        WHEN: When the Judge receives many Results at once (queue batches, replays).
+        WHO CALLS: Batch consumers of the Judge.
+
+        Gives the same verdicts as calling `validate_result` on each Result.
+        `task_types` (one per Result) selects schemas as in `validate_result`.
+        Full schema checks run on `executor` if given; otherwise on the validator's
+        own process pool once there are at least `parallel_threshold` of them, and
+        inline below that. Results are only updated (mark_valid/mark_invalid) when
+        `mark` is True.
         """
-        trends = result.output_data.get("trends", [])
-        
-        if not isinstance(trends, list):
-            result.mark_invalid("Trends must be a list.")
-            return False
-            
-        if len(trends) == 0:
-            result.mark_invalid("Trend list is empty.")
-            return False
+        start = time.perf_counter()
+        criteria = criteria or {}
+        full_report = criteria.get("full_report", self.full_report)
+        outputs = [result.output_data for result in results]
+        n = len(outputs)
+        if task_types is None:
+            task_types = [None] * n
+        resolved: List[str] = list(task_types)
 
-        for trend in trends:
-            # Check for required fields
-            if "engagement_score" not in trend:
-                result.mark_invalid("Missing engagement_score in trend.")
-                return False
-            
-            # Check value constraints
-            score = trend["engagement_score"]
-            if not (0 <= score <= 1):
-                result.mark_invalid(f"Engagement score {score} out of range [0,1].")
-                return False
+        notes: Dict[int, str] = {}
+        valid = np.ones(n, dtype=bool)
+
+        # 1. Structural checks over the whole batch.
+        empty = np.fromiter((not output for output in outputs), dtype=bool, count=n)
+        errored = ~empty & np.fromiter(
+            ("error" in output for output in outputs), dtype=bool, count=n
+        )
+        for i in np.flatnonzero(empty).tolist():
+            notes[i] = "Result output is empty."
+        for i in np.flatnonzero(errored).tolist():
+            notes[i] = f"Worker reported error: {outputs[i]['error']}"
+        valid &= ~(empty | errored)
+
+        # 2. Group the rest by contract schema.
+        groups: Dict[str, List[int]] = {}
+        schemas: Dict[str, CompiledSchema] = {}
+        schema_of: Dict[int, CompiledSchema] = {}
+        for i in np.flatnonzero(valid).tolist():
+            task_type = task_types[i]
+            if task_type is None and "trends" in outputs[i]:
+                task_type = resolved[i] = "fetch_trends"
+            schema = self.schemas.for_task_type(task_type) if task_type else None
+            if schema is not None:
+                key = f"{schema.schema_id}@{schema.version}"
+                schemas[key] = schema
+                schema_of[i] = schema
+                groups.setdefault(key, []).append(i)
+
+        # 3. Schemas FastRules covers are decided over the whole group at once;
+        #    the rest (and full reports) need the full validator.
+        full_checks: List[tuple] = []
+        for key, indexes in groups.items():
+            schema = schemas[key]
+            if full_report or schema.fast_rules is None:
+                full_checks.extend((schema, i) for i in indexes)
+                continue
+            for position, note in schema.fast_rules.check([outputs[i] for i in indexes]).items():
+                notes[indexes[position]] = note
+                valid[indexes[position]] = False
+
+        # 4. Full schema validation, chunked over a pool when it is worth it.
+        for i, note in self._run_full_checks(full_checks, outputs, full_report, executor).items():
+            notes[i] = note
+            valid[i] = False
+
+        self._record_batch(resolved, valid, time.perf_counter() - start)
+        if mark:
+            for i, result in enumerate(results):
+                if valid[i]:
+                    schema = schema_of.get(i)
+                    result.mark_valid(
+                        f"Output matches {schema.schema_id} v{schema.version}."
+                        if schema else GENERIC_NOTE
+                    )
+                else:
+                    result.mark_invalid(notes[i])
+        return BatchVerdict(valid, notes)
+
+    @staticmethod
+    def _record_batch(task_types: List[Optional[str]], valid: np.ndarray, seconds: float) -> None:
+        # Per task type: verdict counts, and the batch time shared out per Result so
+        # the judge stage's sum stays comparable with validate_result.
+        if not default_metrics.enabled or not len(valid):
+            return
+        names = np.array([t or "" for t in task_types], dtype=object)
+        share = seconds / len(valid)
+        for task_type in set(names.tolist()):
+            of_type = names == task_type
+            passed = int(np.count_nonzero(valid & of_type))
+            failed = int(np.count_nonzero(of_type)) - passed
+            stage_seconds.observe_many(share, passed + failed, stage="judge", task_type=task_type)
+            if passed:
+                verdicts_total.inc(passed, task_type=task_type, verdict="valid")
+            if failed:
+                verdicts_total.inc(failed, task_type=task_type, verdict="invalid")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        WHY: To release the validate_many process pool.
+        WHEN: On judge stop.
+        WHO CALLS: apps.judge.main, tests.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
 
-        result.mark_valid(f"Validated {len(trends)} trends successfully.")
+    def _run_full_checks(self, checks: List[tuple], outputs: List[Dict[str, Any]],
+                         full_report: bool, executor: Optional[Executor]) -> Dict[int, str]:
+        if not checks:
+            return {}
+        if executor is None and len(checks) >= self.parallel_threshold:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            executor = self._pool
+        if executor is None:
+            return _check_chunk([(schema, i, outputs[i]) for schema, i in checks], full_report)
+
+        workers = getattr(executor, "_max_workers", None) or self.max_workers
+        size = max(1, -(-len(checks) // (workers * 4)))
+        # CompiledSchema pickles as its source, so process workers compile each schema once.
+        futures = [
+            executor.submit(
+                _check_chunk,
+                [(schema, i, outputs[i]) for schema, i in checks[start:start + size]],
+                full_report,
+            )
+            for start in range(0, len(checks), size)
+        ]
+        failed: Dict[int, str] = {}
+        for future in futures:
+            failed.update(future.result())
+        return failed
+
+    def _validate_schema(self, result: Result, schema: CompiledSchema, full_report: bool) -> bool:
+        """
+        Validates the output against a compiled contract schema.
+        """
+        if full_report:
+            errors = schema.all_errors(result.output_data)
+        else:
+            first = schema.first_error(result.output_data)
+            errors = [first] if first is not None else []
+
+        if errors:
+            result.mark_invalid(" ".join(describe_error(e) for e in errors))
+            return False
+
+        result.mark_valid(f"Output matches {schema.schema_id} v{schema.version}.")
         return True
+
+
+def _check_chunk(items: List[tuple], full_report: bool) -> Dict[int, str]:
+    """Full schema validation of (schema, index, output) items. Returns notes for failures."""
+    failed: Dict[int, str] = {}
+    for schema, i, output in items:
+        if full_report:
+            errors = schema.all_errors(output)
+        else:
+            first = schema.first_error(output)
+            errors = [first] if first is not None else []
+        if errors:
+            failed[i] = " ".join(describe_error(e) for e in errors)
+    return failed
+
@@ -0,0 +1,64 @@
+"""
+WHAT THIS FILE DOES:
+    Entrypoint for the Swarm Orchestrator.
+    It demonstrates how to push several Goals through the concurrent pipeline.
+
+WHY IT EXISTS:
+    To allows the orchestrator to be run as a standalone process.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Instantiates SwarmPipeline with the default Planner, Worker and Judge.
+    - (Simulation) Submits a batch of Goals.
+    - Prints each verdict as soon as it is produced, then where the time went.
+    - Serves Prometheus metrics on METRICS_PORT when set (core.metrics).
+    - Persists Goals, Tasks and Results when CHIMERA_DB_PATH is set (core.store),
+      closing the store before exit.
+"""
+
+import sys
+import os
+import asyncio
+
+# Add the project root to sys.path so we can import 'core' and 'apps'
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from core.task_models import Goal  # noqa: E402
+from core.metrics import serve_metrics_from_env, stage_seconds  # noqa: E402
+from apps.orchestrator.pipeline import SwarmPipeline  # noqa: E402
+from apps.orchestrator.schemas import PipelineConfig  # noqa: E402
+
+async def main():
+    print("🎼 Starting Swarm Orchestrator...")
+    serve_metrics_from_env()
+
+    # 1. Instantiate the Pipeline
+    pipeline = SwarmPipeline(config=PipelineConfig(worker_concurrency=4, judge_concurrency=2))
+
+    # 2. Receive Goals (Mocking a burst of API calls)
+    goals = [
+        Goal(description="Fetch and analyze latest TikTok trends in the US."),
+        Goal(description="Fetch YouTube trends about Python."),
+        Goal(description="Write a poem about agents."),
+    ]
+    print(f"📝 Received {len(goals)} goals.")
+
+    # 3. Stream outcomes as they are judged
+    async for outcome in pipeline.stream(goals):
+        status = "✅ APPROVED" if outcome.is_valid else "❌ REJECTED"
+        print(f"   [{outcome.task.type}] goal={outcome.goal_id[:8]} "
+              f"{outcome.result.execution_time_ms:.2f}ms {status}")
+    if pipeline.store is not None:
+        pipeline.store.close()
+        print(f"💾 Saved to {pipeline.store.path}")
+
+    # 4. Latency breakdown per stage and task type
+    print("\n⏱️  Time by stage:")
+    for (stage, task_type), (count, total) in sorted(stage_seconds.totals().items()):
+        print(f"   {stage:<10} {task_type or '-':<16} n={count:<3} total={total * 1000:8.2f}ms "
+              f"mean={total * 1000 / count:7.2f}ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,256 @@
+"""
+WHAT THIS FILE DOES:
+    Implements the Swarm Orchestrator: an asyncio pipeline that links the Planner,
+    Worker and Judge with bounded queues.
+
+WHY IT EXISTS:
+    Running each Task to completion before starting the next one means a single slow
+    Task delays every Goal queued behind it. Here each stage has its own pool of
+    coroutines, so many Goals and Tasks are in flight at once and throughput grows
+    with the configured concurrency.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Input: Iterable (or async iterable, for long-running services) of core.task_models.Goal
+    - Stage 1: PlannerService.create_plan (Goal -> Tasks)
+    - Stage 2: WorkerExecutor.execute_task (Task -> Result), scheduled by
+      apps.orchestrator.scheduler.DagScheduler so each Task starts as soon as the
+      Tasks it depends on have finished, with their outputs wired into its inputs.
+    - Stage 3: JudgeValidator.validate_result (Result -> Verdict)
+    - Output: apps.orchestrator.schemas.TaskOutcome, streamed as soon as each is judged.
+    - Persistence (optional): each Goal with its planned Tasks, then each judged Task
+      and Result, is queued to core.store.SwarmStore (CHIMERA_DB_PATH).
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar,
+    Union,
+)
+
+from core.task_models import Goal, Task, Result
+from core.store import SwarmStore, default_store, failed_rows_total
+from apps.planner.service import PlannerService
+from apps.worker.executor import WorkerExecutor
+from apps.worker.schemas import ExecutionMode
+from apps.judge.validator import JudgeValidator
+from apps.orchestrator.schemas import PipelineConfig, TaskOutcome
+from apps.orchestrator.scheduler import DagScheduler, TaskGraph
+
+T = TypeVar("T")
+
+# Marker placed on a queue to tell the consuming stage that no more items will arrive.
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+
+class _StageFailure:
+    """Carries an unexpected exception from a stage coroutine to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class SwarmPipeline:
+    """
+    ROLE IN SWARM:
+        The "Conductor".
+        It keeps every stage busy: Goals are planned, Tasks are executed and Results
+        are judged concurrently, each stage bounded by PipelineConfig.
+    """
+
+    def __init__(
+        self,
+        planner: Optional[PlannerService] = None,
+        worker: Optional[WorkerExecutor] = None,
+        judge: Optional[JudgeValidator] = None,
+        config: Optional[PipelineConfig] = None,
+        store: Optional[SwarmStore] = None,
+    ):
+        self.planner = planner or PlannerService()
+        self.worker = worker or WorkerExecutor()
+        self.judge = judge or JudgeValidator()
+        self.config = config or PipelineConfig()
+        self.store = store or default_store
+
+    async def run(self, goals: Iterable[Goal]) -> List[TaskOutcome]:
+        """
+        WHY: Convenience wrapper for callers that want every outcome at once.
+        WHEN: Batch jobs and scripts (e.g. scripts/verify_swarm.py).
+        WHO CALLS: Entrypoints that do not need incremental results.
+        """
+        return [outcome async for outcome in self.stream(goals)]
+
+    async def stream(
+        self, goals: Union[Iterable[Goal], AsyncIterable[Goal]]
+    ) -> AsyncIterator[TaskOutcome]:
+        """
+        WHY: To hand each judged Task back the moment it is ready, in completion order.
+        WHEN: Called once per batch of Goals.
+        WHO CALLS: apps.orchestrator.main and any async front end.
+
+        The Planner, Worker and Judge are synchronous, so their calls run on a thread
+        pool sized to the total stage concurrency; the event loop only moves items
+        between queues. Task types the Worker pins to THREAD or PROCESS mode go to
+        the Worker's own pools instead.
+
+        `goals` may be an async iterable that keeps yielding (see
+        apps.orchestrator.service.SwarmService); the last outcome of each Goal has
+        `goal_complete` set.
+        """
+        cfg = self.config
+        goal_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        plan_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        result_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+        out_q: asyncio.Queue = asyncio.Queue(maxsize=cfg.queue_size)
+
+        pool = ThreadPoolExecutor(
+            max_workers=cfg.planner_concurrency + cfg.worker_concurrency + cfg.judge_concurrency,
+            thread_name_prefix="chimera-swarm",
+        )
+        loop = asyncio.get_running_loop()
+        # goal id -> Tasks not judged yet
+        remaining: Dict[str, int] = {}
+        # goal id -> planning time (ms)
+        plan_ms: Dict[str, float] = {}
+
+        def offload(fn: Callable[..., T], *args) -> Awaitable[T]:
+            return loop.run_in_executor(pool, fn, *args)
+
+        async def feed_goals() -> None:
+            if isinstance(goals, AsyncIterable):
+                async for goal in goals:
+                    await goal_q.put(goal)
+            else:
+                for goal in goals:
+                    await goal_q.put(goal)
+            for _ in range(cfg.planner_concurrency):
+                await goal_q.put(_STOP)
+
+        async def plan() -> None:
+            while (goal := await goal_q.get()) is not _STOP:
+                start = time.perf_counter()
+                tasks = await offload(self.planner.create_plan, goal)
+                plan_ms[goal.id] = (time.perf_counter() - start) * 1000
+                remaining[goal.id] = remaining.get(goal.id, 0) + len(tasks)
+                if self.store is not None:
+                    await offload(self._persist, [goal], tasks, [])
+                await plan_q.put(TaskGraph(tasks))
+
+        async def execute(task: Task) -> Result:
+            if self.worker.mode_for(task.type) == ExecutionMode.INLINE:
+                return await offload(self.worker.execute_task, task)
+            return await self.worker.execute_task_async(task)
+
+        async def forward(task: Task, result: Result) -> None:
+            waited = scheduler.queue_waits.pop(task.id, 0.0)
+            await result_q.put((task, result, waited * 1000))
+
+        # One dispatcher; worker_concurrency bounds the Tasks it runs at once.
+        scheduler = DagScheduler(execute, cfg.worker_concurrency, on_result=forward)
+
+        async def work() -> None:
+            try:
+                # watch(): if the scheduler fails, fail the stage now rather than at
+                # drain(), which a long-lived pipeline (SwarmService) never reaches.
+                while (graph := await scheduler.watch(plan_q.get())) is not _STOP:
+                    await scheduler.watch(scheduler.submit(graph))
+                await scheduler.drain()
+            finally:
+                scheduler.cancel()
+
+        async def judge() -> None:
+            while (item := await result_q.get()) is not _STOP:
+                task, result, queue_wait_ms = item
+                start = time.perf_counter()
+                is_valid = await offload(self.judge.validate_result, result, None, task.type)
+                judge_ms = (time.perf_counter() - start) * 1000
+                remaining[task.goal_id] -= 1
+                goal_complete = remaining[task.goal_id] == 0
+                if goal_complete:
+                    del remaining[task.goal_id]
+                if self.store is not None:
+                    await offload(self._persist, [], [task], [result])
+                timings = {
+                    "plan": (
+                        plan_ms.pop(task.goal_id, 0.0) if goal_complete
+                        else plan_ms.get(task.goal_id, 0.0)
+                    ),
+                    "queue_wait": queue_wait_ms,
+                    "execute": result.execution_time_ms,
+                    "judge": judge_ms,
+                }
+                await out_q.put(TaskOutcome(
+                    goal_id=task.goal_id, task=task, result=result, is_valid=is_valid,
+                    goal_complete=goal_complete, timings_ms=timings,
+                ))
+
+        stages = [
+            ([feed_goals], None),
+            ([plan] * cfg.planner_concurrency, (plan_q, 1)),
+            ([work], (result_q, cfg.judge_concurrency)),
+            ([judge] * cfg.judge_concurrency, (out_q, 1)),
+        ]
+
+        running: List[asyncio.Task] = []
+        for coros, downstream in stages:
+            running.extend(self._start_stage(coros, downstream, out_q))
+
+        try:
+            while (item := await out_q.get()) is not _STOP:
+                if isinstance(item, _StageFailure):
+                    raise item.error
+                yield item
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _persist(self, goals: List[Goal], tasks: List[Task], results: List[Result]) -> None:
+        """
+        Queues rows to the store. Runs on the stage thread pool: serializing large
+        outputs and waiting out the store's backpressure must not stall the event
+        loop. A failed save is logged and counted, never allowed to stop the stage.
+        """
+        for table, save, rows in (
+            ("goals", self.store.save_goals, goals),
+            ("tasks", self.store.save_tasks, tasks),
+            ("results", self.store.save_results, results),
+        ):
+            if not rows:
+                continue
+            try:
+                save(rows)
+            except Exception:
+                logger.exception("Could not save %d %s to the SwarmStore", len(rows), table)
+                failed_rows_total.inc(len(rows), table=table)
+
+    @staticmethod
+    def _start_stage(coros, downstream, out_q: asyncio.Queue) -> List[asyncio.Task]:
+        """
+        Launches one stage and arranges for the last coroutine to finish to send
+        the stop markers to the next stage. Failures are forwarded to out_q so the
+        consumer sees them instead of hanging.
+        """
+        remaining = len(coros)
+
+        async def supervised(coro_fn) -> None:
+            nonlocal remaining
+            try:
+                await coro_fn()
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await out_q.put(_StageFailure(e))
+                return
+            remaining -= 1
+            if remaining == 0 and downstream is not None:
+                queue, consumers = downstream
+                for _ in range(consumers):
+                    await queue.put(_STOP)
+
+        return [asyncio.create_task(supervised(fn)) for fn in coros]
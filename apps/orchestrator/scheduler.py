@@ -0,0 +1,267 @@
+"""
+WHAT THIS FILE DOES:
+    Implements dependency-aware scheduling of a plan's Tasks: a TaskGraph that tracks
+    which Tasks are ready, and a DagScheduler that runs ready Tasks concurrently.
+
+WHY IT EXISTS:
+    Plans are graphs, not lists: `analyze_trends` needs the output of `fetch_trends`,
+    while unrelated steps can run side by side. Running each Task as soon as its
+    inputs exist (and no sooner) keeps goal latency close to the plan's critical path.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Input: Tasks from PlannerService.create_plan, linked by Task.depends_on.
+    - Used by apps.orchestrator.pipeline.SwarmPipeline for its Worker stage.
+    - Output passing: before a Task runs, each upstream Result.output_data entry is put
+      into its input_data (explicit inputs win). Values are shared, not copied, so large
+      payloads such as trend lists are handed over for free; treat them as read-only.
+    - Failure: a Task whose executor raises gets a FAILED Result like any other failed
+      Task, and its dependents are skipped (FAILED) at once, so its Goal still
+      completes. Errors of the scheduler itself (e.g. in on_result) are raised by
+      drain() and, while a caller waits on watch(), straight away.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from core.task_models import Task, Result, TaskStatus
+from core.records import ResultRecord
+from core.metrics import stage_seconds
+
+Executor = Callable[[Task], Awaitable[Result]]
+ResultCallback = Callable[[Task, Result], Awaitable[None]]
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """
+    ROLE IN SWARM:
+        The "Dependency Map" of one plan. Pure bookkeeping: it never runs anything.
+    """
+
+    def __init__(self, tasks: List[Task]):
+        self.tasks: Dict[str, Task] = {task.id: task for task in tasks}
+        # When the starting Tasks became ready (perf_counter), for queue-wait timing.
+        self.created = time.perf_counter()
+        self.results: Dict[str, Result] = {}
+        self._waiting_on: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, List[str]] = {task.id: [] for task in tasks}
+
+        for task in tasks:
+            unknown = [dep for dep in task.depends_on if dep not in self.tasks]
+            if unknown:
+                raise ValueError(
+                    f"Task {task.id} depends on unknown task(s): {', '.join(unknown)}"
+                )
+            self._waiting_on[task.id] = set(task.depends_on)
+            for dep in task.depends_on:
+                self._dependents[dep].append(task.id)
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        remaining = {task_id: len(deps) for task_id, deps in self._waiting_on.items()}
+        frontier = [task_id for task_id, count in remaining.items() if count == 0]
+        visited = 0
+        while frontier:
+            task_id = frontier.pop()
+            visited += 1
+            for child in self._dependents[task_id]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    frontier.append(child)
+        if visited != len(self.tasks):
+            raise ValueError("Task dependencies contain a cycle")
+
+    def ready(self) -> List[Task]:
+        """Tasks with no dependencies (the starting points of the plan)."""
+        return [self.tasks[task_id] for task_id, deps in self._waiting_on.items() if not deps]
+
+    def complete(
+        self, task: Task, result: Result
+    ) -> Tuple[List[Task], List[Tuple[Task, Result]]]:
+        """
+        WHY: To release the Tasks that were waiting on `task`.
+        WHEN: Each time a Task of this graph finishes.
+        WHO CALLS: DagScheduler
+
+        Returns (newly ready Tasks with their inputs wired in, skipped Tasks with their
+        Results). If `task` failed, everything downstream of it is skipped.
+        """
+        self.results[task.id] = result
+        if task.status == TaskStatus.FAILED:
+            return [], self._skip_dependents(task)
+
+        ready = []
+        for child_id in self._dependents[task.id]:
+            waiting = self._waiting_on[child_id]
+            waiting.discard(task.id)
+            if not waiting and child_id not in self.results:
+                child = self.tasks[child_id]
+                self._wire_inputs(child)
+                ready.append(child)
+        return ready, []
+
+    def _wire_inputs(self, task: Task) -> None:
+        for dep in task.depends_on:
+            for key, value in self.results[dep].output_data.items():
+                task.input_data.setdefault(key, value)
+
+    def _skip_dependents(self, failed: Task) -> List[Tuple[Task, Result]]:
+        skipped = []
+        stack = [(failed.id, child) for child in self._dependents[failed.id]]
+        while stack:
+            cause, task_id = stack.pop()
+            if task_id in self.results:
+                continue
+            task = self.tasks[task_id]
+            task.status = TaskStatus.FAILED
+            error = f"Skipped: dependency {cause} failed"
+            result = ResultRecord(task.id, {"error": error}, 0.0).to_model()
+            self.results[task_id] = result
+            skipped.append((task, result))
+            stack.extend((task_id, child) for child in self._dependents[task_id])
+        return skipped
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.tasks)
+
+
+class DagScheduler:
+    """
+    ROLE IN SWARM:
+        The "Dispatcher": runs every ready Task of every submitted graph, at most
+        `max_concurrency` at a time, and reports each Result as it lands.
+    """
+
+    def __init__(
+        self, execute: Executor, max_concurrency: int, on_result: Optional[ResultCallback] = None
+    ):
+        self.execute = execute
+        self.on_result = on_result
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._inflight: Set[asyncio.Task] = set()
+        self._errors: List[BaseException] = []
+        # Set when the first error lands, so watch() need not wait for drain().
+        self._failed = asyncio.Event()
+        # task id -> seconds between becoming ready and starting. Callers that report
+        # it per Task pop their entries (see SwarmPipeline).
+        self.queue_waits: Dict[str, float] = {}
+
+    async def submit(self, graph: TaskGraph) -> None:
+        """
+        WHY: To start a plan.
+        WHEN: Once per plan; returns once its starting Tasks have been given a slot,
+              which is what gives upstream stages backpressure.
+        WHO CALLS: SwarmPipeline, DagScheduler.run
+        """
+        for task in graph.ready():
+            await self._launch(graph, task, graph.created)
+
+    async def drain(self) -> None:
+        """Wait until every submitted graph has finished. Re-raises the first error."""
+        while self._inflight:
+            batch = list(self._inflight)
+            await asyncio.gather(*batch, return_exceptions=True)
+            # Finished tasks may launch children, so go round until nothing is left.
+            # (Don't rely on the done callbacks here: gathering already-finished tasks
+            # does not yield to the loop, so they would not have run yet.)
+            self._inflight.difference_update(batch)
+        if self._errors:
+            raise self._errors[0]
+
+    async def watch(self, awaitable: Awaitable[T]) -> T:
+        """
+        WHY: A long-lived caller (SwarmPipeline's Worker stage, fed by SwarmService)
+             never reaches drain(), so a failed scheduler would otherwise go unnoticed
+             while its Goals wait forever.
+        WHEN: Around whatever the caller waits on between submits.
+        WHO CALLS: SwarmPipeline
+
+        Returns what `awaitable` returns, unless the scheduler fails first: then its
+        first error is raised (and `awaitable` cancelled).
+        """
+        waiting = asyncio.ensure_future(awaitable)
+        failed = asyncio.ensure_future(self._failed.wait())
+        try:
+            await asyncio.wait({waiting, failed}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            failed.cancel()
+        if waiting.done():
+            return waiting.result()
+        waiting.cancel()
+        raise self._errors[0]
+
+    def cancel(self) -> None:
+        for running in self._inflight:
+            running.cancel()
+
+    async def run(self, tasks: List[Task]) -> List[Tuple[Task, Result]]:
+        """
+        WHY: Convenience for running one plan to completion.
+        WHEN: Scripts and tests.
+        WHO CALLS: Callers that do not need a full pipeline.
+
+        Returns (Task, Result) pairs in completion order.
+        """
+        collected: List[Tuple[Task, Result]] = []
+        previous = self.on_result
+
+        async def collect(task: Task, result: Result) -> None:
+            collected.append((task, result))
+            if previous is not None:
+                await previous(task, result)
+
+        self.on_result = collect
+        try:
+            await self.submit(TaskGraph(tasks))
+            await self.drain()
+        finally:
+            self.on_result = previous
+        return collected
+
+    async def _launch(self, graph: TaskGraph, task: Task, ready_at: float) -> None:
+        await self._slots.acquire()
+        running = asyncio.create_task(self._execute(graph, task, ready_at))
+        self._inflight.add(running)
+        running.add_done_callback(self._inflight.discard)
+
+    async def _execute(self, graph: TaskGraph, task: Task, ready_at: float) -> None:
+        try:
+            try:
+                # Ready until now: waiting for a slot (and, for starting Tasks, in plan_q).
+                waited = self.queue_waits[task.id] = time.perf_counter() - ready_at
+                stage_seconds.observe(waited, stage="queue_wait", task_type=task.type)
+                result = await self.execute(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Fail the Task, not the scheduler: its dependents are skipped below
+                # and its Goal completes with the error in the Result.
+                logger.exception("Task %s (%s) raised", task.id, task.type)
+                task.status = TaskStatus.FAILED
+                result = ResultRecord(task.id, {"error": f"{type(e).__name__}: {e}"}, 0.0)
+                result = result.to_model()
+            finally:
+                self._slots.release()
+
+            ready, skipped = graph.complete(task, result)
+            ready_at = time.perf_counter()
+            await self._report(task, result)
+            for skipped_task, skipped_result in skipped:
+                await self._report(skipped_task, skipped_result)
+            for child in ready:
+                await self._launch(graph, child, ready_at)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            self._errors.append(e)
+            self._failed.set()
+            raise
+
+    async def _report(self, task: Task, result: Result) -> None:
+        if self.on_result is not None:
+            await self.on_result(task, result)
@@ -0,0 +1,47 @@
+"""
+WHAT THIS FILE DOES:
+    Defines the data structures used by the Swarm Orchestrator.
+
+WHY IT EXISTS:
+    The pipeline needs a typed way to describe how much concurrency each stage gets
+    and what it hands back to callers once a Task has been worked and judged.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - PipelineConfig is passed to apps.orchestrator.pipeline.SwarmPipeline.
+    - TaskOutcome bundles the core Task/Result pair with the Judge's verdict.
+"""
+
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from core.task_models import Task, Result
+
+
+class PipelineConfig(BaseModel):
+    """
+    ROLE IN SWARM:
+        Tuning knobs for the Planner -> Worker -> Judge pipeline.
+        Each stage runs this many coroutines in parallel, and the queues between
+        stages are bounded so a fast stage cannot flood a slow one.
+    """
+    planner_concurrency: int = Field(default=2, ge=1, description="Goals planned in parallel.")
+    worker_concurrency: int = Field(default=8, ge=1, description="Tasks executed in parallel.")
+    judge_concurrency: int = Field(default=4, ge=1, description="Results validated in parallel.")
+    queue_size: int = Field(default=100, ge=1, description="Capacity of each inter-stage queue.")
+
+
+class TaskOutcome(BaseModel):
+    """
+    ROLE IN SWARM:
+        The final record for one Task after it has passed through every stage.
+    """
+    goal_id: str = Field(..., description="Reference to the Goal the Task belongs to.")
+    task: Task
+    result: Result
+    is_valid: bool = Field(..., description="Verdict returned by the Judge.")
+    goal_complete: bool = Field(default=False, description="True on the last outcome of its Goal.")
+    timings_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Measured time per stage: plan (its Goal's), queue_wait, execute, judge.",
+    )
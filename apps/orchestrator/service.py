@@ -0,0 +1,158 @@
+"""
+WHAT THIS FILE DOES:
+    Runs one long-lived SwarmPipeline that Goals can be submitted to at any time, and
+    routes each TaskOutcome back to whoever submitted its Goal.
+
+WHY IT EXISTS:
+    SwarmPipeline.stream starts its own stage coroutines and thread pool per batch.
+    A server with many concurrent requests should share one pipeline (bounded by
+    PipelineConfig) instead, so an open Goal costs a queue entry, not a thread pool.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Wraps apps.orchestrator.pipeline.SwarmPipeline, feeding it from an inbox queue.
+    - Used by apps.api (HTTP/NDJSON) and apps.frontend (Streamlit).
+    - Must be started and used on one event loop.
+"""
+
+import asyncio
+import os
+from typing import AsyncIterator, Dict, Optional, Sequence, Set
+
+from core.task_models import Goal
+from apps.orchestrator.pipeline import SwarmPipeline
+from apps.orchestrator.schemas import TaskOutcome
+
+MAX_OPEN_GOALS = int(os.getenv("SWARM_MAX_OPEN_GOALS", "10000"))
+
+
+class ServiceBusy(Exception):
+    """Raised by SwarmService.submit when accepting the Goals would exceed max_open_goals."""
+
+
+class SwarmService:
+    """
+    ROLE IN SWARM:
+        The "Switchboard": one pipeline for the whole process, with a line back to
+        each caller.
+    """
+
+    def __init__(
+        self, pipeline: Optional[SwarmPipeline] = None, max_open_goals: int = MAX_OPEN_GOALS
+    ):
+        self.pipeline = pipeline or SwarmPipeline()
+        self.max_open_goals = max_open_goals
+        self._inbox: Optional[asyncio.Queue] = None
+        self._subscribers: Dict[str, asyncio.Queue] = {}
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def open_goals(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._runner is not None and not self._runner.done()
+
+    async def start(self) -> None:
+        """
+        WHY: To start the shared pipeline.
+        WHEN: On application start-up (idempotent).
+        WHO CALLS: apps.api.app lifespan, apps.frontend
+        """
+        if not self.running:
+            self._inbox = asyncio.Queue()
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the pipeline and waits for what it queued to its store, if any, to be
+        committed. Goals still open, including those still queued, get a RuntimeError.
+        """
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+        if self._inbox is not None:
+            self._drain_inbox()
+        self._fail_open_goals(RuntimeError("SwarmService stopped"))
+        if self.pipeline.store is not None:
+            try:
+                await asyncio.to_thread(self.pipeline.store.flush)
+            except RuntimeError:
+                pass  # a failed batch was logged and counted when it failed
+
+    def submit(self, goals: Sequence[Goal]) -> AsyncIterator[TaskOutcome]:
+        """
+        WHY: To run Goals on the shared pipeline and get their outcomes as they land.
+        WHEN: Once per request.
+        WHO CALLS: apps.api.app, apps.frontend
+
+        Returns an async iterator of the Goals' TaskOutcomes, in completion order,
+        that ends once every Goal is complete. The Goals are accepted (or ServiceBusy
+        raised) immediately, before iteration starts. Closing the iterator early
+        stops delivery; the Goals' remaining Tasks still run.
+        """
+        if not self.running:
+            raise RuntimeError("SwarmService is not started")
+        if self.open_goals + len(goals) > self.max_open_goals:
+            raise ServiceBusy(f"{self.open_goals} goals open; limit is {self.max_open_goals}")
+        if any(goal.id in self._subscribers for goal in goals):
+            raise ValueError("Goal already submitted")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for goal in goals:
+            self._subscribers[goal.id] = queue
+        for goal in goals:
+            self._inbox.put_nowait(goal)
+        return self._outcomes(queue, {goal.id for goal in goals})
+
+    async def _outcomes(
+        self, queue: asyncio.Queue, pending: Set[str]
+    ) -> AsyncIterator[TaskOutcome]:
+        try:
+            while pending:
+                item = await queue.get()
+                if isinstance(item, BaseException):
+                    raise item
+                if item.goal_complete:
+                    pending.discard(item.goal_id)
+                yield item
+        finally:
+            for goal_id in pending:
+                self._subscribers.pop(goal_id, None)
+
+    async def _goal_source(self) -> AsyncIterator[Goal]:
+        while True:
+            yield await self._inbox.get()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async for outcome in self.pipeline.stream(self._goal_source()):
+                    queue = self._subscribers.get(outcome.goal_id)
+                    if queue is None:
+                        continue  # the caller stopped listening
+                    if outcome.goal_complete:
+                        del self._subscribers[outcome.goal_id]
+                    queue.put_nowait(outcome)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A stage failed: fail the Goals in flight and those still queued behind
+                # them, then serve new ones on a fresh pipeline.
+                self._drain_inbox()
+                self._fail_open_goals(e)
+
+    def _drain_inbox(self) -> None:
+        # Goals still queued were accepted by the failed pipeline's submitters; their
+        # subscribers get the error below, so they must not run on the next pipeline.
+        while True:
+            try:
+                self._inbox.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+    def _fail_open_goals(self, error: BaseException) -> None:
+        for queue in {id(q): q for q in self._subscribers.values()}.values():
+            queue.put_nowait(error)
+        self._subscribers.clear()
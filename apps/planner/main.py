@@ -10,6 +10,7 @@ HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
     - Instantiates PlannerService.
     - (Simulation) Creates a Goal.
     - (Simulation) Prints the resulting Plan.
+    - Serves Prometheus metrics on METRICS_PORT when set (core.metrics).
 """
 
 import sys
@@ -23,11 +24,13 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from core.task_models import Goal
-from apps.planner.service import PlannerService
+from core.task_models import Goal  # noqa: E402
+from core.metrics import serve_metrics_from_env  # noqa: E402
+from apps.planner.service import PlannerService  # noqa: E402
 
 def main():
     print("🚀 Starting Planner Service...")
+    serve_metrics_from_env()
     
     # 1. Instantiate the Service
     planner = PlannerService()
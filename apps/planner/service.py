@@ -12,10 +12,91 @@ HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
     - Input: core.task_models.Goal
     - Output: List[core.task_models.Task]
     - Downstream: The generated Tasks are sent to the Worker Queue (future state).
+
+PLAN CACHE:
+    Planning (eventually an LLM call) blocks every downstream stage, and many Goals
+    recur with only the platform or region changed. `create_plan` therefore reduces a
+    Goal to a GoalSignature, plans the first Goal of each signature, compiles the plan
+    into a PlanTemplate with the parameters lifted out, and caches it (with a TTL).
+    Later Goals with the same signature get their Tasks by filling in the template.
 """
 
-from typing import List
+import os
+import re
+from typing import Dict, List, Optional, Union
+
+from core.cache import CacheStats, TTLCache
+from core.metrics import default_metrics, stage_seconds
 from core.task_models import Goal, Task, TaskStatus
+from apps.planner.shemas import GoalSignature, PlanTemplate, TaskTemplate
+
+# Recognized goal parameters. Platform names match case-insensitively; region codes
+# only in capitals, so "help us" is not read as the US.
+PLATFORMS = ("tiktok", "twitter", "instagram", "youtube", "reddit", "linkedin", "newsapi")
+REGION_CODES = ("US", "UK", "EU", "CA", "IN", "BR", "DE", "FR", "JP")
+REGION_NAMES = ("global",)
+DEFAULT_PARAMS = {"platform": "tiktok", "region": "US"}
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+
+
+def goal_signature(goal: Goal) -> GoalSignature:
+    """
+    Reduce a Goal description to its shape and its parameters.
+
+    Punctuation, case and spacing are dropped; the first platform and region
+    mentioned become the `platform` and `region` params.
+    """
+    words: List[str] = []
+    params: Dict[str, str] = {}
+    for word in _WORD.findall(goal.description):
+        lower = word.lower()
+        if lower in PLATFORMS and "platform" not in params:
+            params["platform"] = lower
+            words.append("{platform}")
+        elif (word in REGION_CODES or lower in REGION_NAMES) and "region" not in params:
+            params["region"] = word if word in REGION_CODES else lower
+            words.append("{region}")
+        else:
+            words.append(lower)
+    return GoalSignature(key=" ".join(words), params=params)
+
+
+def compile_plan(
+    signature: GoalSignature, tasks: List[Task], params: Dict[str, str]
+) -> PlanTemplate:
+    """
+    Turn a concrete plan into a template by replacing each param value with its slot.
+
+    An input value equal to a param value becomes bound to that param; occurrences in
+    descriptions become `{name}` format fields. Everything else is kept as is.
+    Dependencies are stored as positions in the plan, which must list every Task
+    after the Tasks it depends on.
+    """
+    by_value = {value: name for name, value in params.items()}
+    position = {task.id: i for i, task in enumerate(tasks)}
+    templates = []
+    for i, task in enumerate(tasks):
+        if any(position.get(dep, i) >= i for dep in task.depends_on):
+            raise ValueError(f"Plan step {i} ({task.type}) depends on a later or unknown step")
+        description = task.description.replace("{", "{{").replace("}", "}}")
+        for value, name in sorted(by_value.items(), key=lambda item: -len(item[0])):
+            escaped = value.replace("{", "{{").replace("}", "}}")
+            description = re.sub(rf"(?<!\w){re.escape(escaped)}(?!\w)", f"{{{name}}}", description)
+
+        static_input, bound_input = {}, {}
+        for key, value in task.input_data.items():
+            if isinstance(value, str) and value in by_value:
+                bound_input[key] = by_value[value]
+            else:
+                static_input[key] = value
+        templates.append(TaskTemplate(
+            type=task.type, description=description,
+            static_input=static_input, bound_input=bound_input,
+            depends_on=[position[dep] for dep in task.depends_on],
+        ))
+    return PlanTemplate(signature=signature.key, tasks=templates)
+
 
 class PlannerService:
     """
@@ -24,35 +105,81 @@ class PlannerService:
         It analyzes the goal and generates a list of steps (Tasks).
     """
 
+    def __init__(self, plan_cache: Optional[TTLCache] = None):
+        self.plan_cache = plan_cache or TTLCache(
+            maxsize=int(os.getenv("PLAN_CACHE_SIZE", "512")),
+            ttl=float(os.getenv("PLAN_CACHE_TTL", "3600")),
+        )
+
     def create_plan(self, goal: Goal) -> List[Task]:
         """
         WHY: To transform a user's intent into actionable machine instructions.
         WHEN: Triggered when a new Goal is submitted to the system.
         WHO CALLS: apps.planner.main (Entrypoint) or an API endpoint.
-        
+
+        Served from the plan cache when a Goal with the same signature was planned
+        within the TTL; only the first Goal of a signature runs `_plan`.
+        """
+        with default_metrics.span(stage_seconds, stage="plan", task_type=""):
+            return self._create_plan(goal)
+
+    def _create_plan(self, goal: Goal) -> List[Task]:
+        signature = goal_signature(goal)
+        # The full description is a param too, so text copied from it into a task
+        # follows each Goal's own wording (which may differ in case or punctuation).
+        params = {**DEFAULT_PARAMS, **signature.params, "goal": goal.description}
+
+        def plan_and_compile() -> PlanTemplate:
+            return compile_plan(signature, self._plan(goal, params), params)
+
+        template = self.plan_cache.get_or_compute(signature.key, plan_and_compile)
+        return template.instantiate(goal.id, params)
+
+    def invalidate(self, goal: Union[Goal, str]) -> None:
+        """
+        WHY: To force re-planning after planning logic or skills change.
+        WHEN: On deploys, skill updates, or when a cached plan proves wrong.
+        WHO CALLS: Operators / admin endpoints.
+
+        Accepts a Goal or a signature key.
+        """
+        key = goal if isinstance(goal, str) else goal_signature(goal).key
+        self.plan_cache.invalidate(key)
+
+    def clear_plan_cache(self) -> None:
+        self.plan_cache.clear()
+
+    def cache_stats(self) -> CacheStats:
+        return self.plan_cache.stats()
+
+    def _plan(self, goal: Goal, params: Dict[str, str]) -> List[Task]:
+        """
+        The actual planning step, run once per goal signature.
+
         Note: This is a skeleton implementation. In a real scenario, this would likely
         call an LLM to generate the plan dynamically.
         """
         tasks = []
-        
+
         # Skeleton logic: Create a simple default plan based on description
         # In the future, this will be AI-driven.
         if "trend" in goal.description.lower():
             # Example planning logic for trend fetching
-            tasks.append(
-                Task(
-                    goal_id=goal.id,
-                    type="fetch_trends",
-                    description="Fetch latest trends from platforms",
-                    input_data={"platform": "tiktok", "region": "US"}
-                )
+            fetch = Task(
+                goal_id=goal.id,
+                type="fetch_trends",
+                description="Fetch latest trends from platforms",
+                input_data={"platform": params["platform"], "region": params["region"]}
             )
+            tasks.append(fetch)
+            # Runs after the fetch and receives its output (the `trends` list) as input.
             tasks.append(
                 Task(
                     goal_id=goal.id,
                     type="analyze_trends",
                     description="Analyze engagement of fetched trends",
-                    input_data={"min_engagement": 0.5}
+                    input_data={"min_engagement": 0.5},
+                    depends_on=[fetch.id]
                 )
             )
         else:
@@ -0,0 +1,79 @@
+"""
+WHAT THIS FILE DOES:
+    Defines the data types the Planner uses to cache plans: a normalized goal
+    signature and parameterized plan templates.
+
+WHY IT EXISTS:
+    Recurring goals ("latest TikTok trends in the US", "... Instagram trends in the UK")
+    differ only in a few parameters. Planning them once and re-filling the parameters
+    is much cheaper than planning each one from scratch.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Produced and consumed by apps.planner.service.PlannerService.
+    - A PlanTemplate instantiates into core.task_models.Task objects.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from core.task_models import Task
+
+
+class GoalSignature(BaseModel):
+    """
+    A Goal reduced to its shape: parameter values are replaced by `{name}` slots.
+    "Fetch TikTok trends in the US" -> key "fetch {platform} trends in the {region}",
+    params {"platform": "tiktok", "region": "US"}.
+    """
+    key: str = Field(..., description="Normalized description with parameter slots.")
+    params: Dict[str, str] = Field(
+        default_factory=dict, description="Values extracted from the Goal."
+    )
+
+
+class TaskTemplate(BaseModel):
+    """
+    One step of a plan with its goal-specific values lifted out.
+    """
+    type: str
+    description: str = Field(..., description="str.format template over the goal params.")
+    static_input: Dict[str, Any] = Field(
+        default_factory=dict, description="Inputs that never vary."
+    )
+    bound_input: Dict[str, str] = Field(
+        default_factory=dict, description="input key -> goal param name."
+    )
+    depends_on: List[int] = Field(
+        default_factory=list, description="Positions of upstream steps in the plan."
+    )
+
+    def instantiate(self, goal_id: str, params: Dict[str, str], upstream_ids: List[str]) -> Task:
+        input_data = dict(self.static_input)
+        for key, param in self.bound_input.items():
+            input_data[key] = params[param]
+        return Task(
+            goal_id=goal_id,
+            type=self.type,
+            description=self.description.format(**params),
+            input_data=input_data,
+            depends_on=[upstream_ids[i] for i in self.depends_on],
+        )
+
+
+class PlanTemplate(BaseModel):
+    """
+    ROLE IN SWARM:
+        A compiled plan, reusable for every Goal with the same signature.
+    """
+    signature: str
+    tasks: List[TaskTemplate] = Field(default_factory=list)
+    compiled_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def instantiate(self, goal_id: str, params: Dict[str, str]) -> List[Task]:
+        # Steps are stored in dependency order, so upstream IDs always exist already.
+        tasks: List[Task] = []
+        for template in self.tasks:
+            tasks.append(template.instantiate(goal_id, params, [t.id for t in tasks]))
+        return tasks
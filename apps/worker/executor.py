@@ -8,17 +8,40 @@ WHY IT EXISTS:
     It isolates execution complexity (API calls, data processing) from decision making.
 
 HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
-    - Input: core.task_models.Task
+    - Input: core.task_models.Task (or core.records.TaskRecord on internal hops)
     - Output: core.task_models.Result
     - Upstream: Receives Tasks from Planner (via queue).
     - Downstream: Sends Results to Judge.
+
+EXECUTION MODES:
+    Each task type can be pinned to an ExecutionMode. INLINE runs in the caller's
+    thread, THREAD uses a thread pool and PROCESS uses a ProcessPoolExecutor so
+    CPU-bound handlers can use every core. Only the handler's import route (see
+    SkillRegistry.route) and (type, description, input_data) cross the process
+    boundary, and only (output, elapsed, ok) comes back; the Task and Result models
+    themselves never get pickled. A skill's batch form (execute_batch) follows its
+    type's mode too: one call per group, on the same pool.
+
+TIMING:
+    Handlers are timed with time.perf_counter (monotonic). Each outcome is recorded in
+    core.metrics (stage "execute" and tasks_total) by the parent process, so PROCESS
+    mode tasks are counted too.
 """
 
+import asyncio
+import os
 import time
-from datetime import datetime
-from typing import Dict, Any
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 
 from core.task_models import Task, Result, TaskStatus
+from core.records import ResultRecord
+from core.metrics import stage_seconds, tasks_total
+from apps.worker.schemas import ExecutionMode
+from apps.worker.registry import SkillRegistry
+
+# (output_data, execution_time_ms, succeeded)
+Outcome = Tuple[Dict[str, Any], float, bool]
 
 class WorkerExecutor:
     """
@@ -27,6 +50,20 @@ class WorkerExecutor:
         It routes tasks to specific handlers (skills) based on task type.
     """
 
+    def __init__(
+        self,
+        execution_modes: Optional[Dict[str, ExecutionMode]] = None,
+        max_processes: Optional[int] = None,
+        max_threads: Optional[int] = None,
+        registry: Optional[SkillRegistry] = None,
+    ):
+        self.registry = registry or SkillRegistry.default()
+        self.execution_modes = dict(execution_modes or {})
+        self.max_processes = max_processes or os.cpu_count() or 1
+        self.max_threads = max_threads
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
     def execute_task(self, task: Task) -> Result:
         """
         WHY: To perform the actual work described in the task.
@@ -34,24 +71,9 @@ class WorkerExecutor:
         WHO CALLS: apps.worker.main (Entrypoint)
         """
         task.mark_in_progress()
-        start_time = time.time()
-        
-        try:
-            # Routing logic to find the right skill/function
-            if task.type == "fetch_trends":
-                output = self._handle_fetch_trends(task.input_data)
-            elif task.type == "analyze_trends":
-                output = self._handle_analyze_trends(task.input_data)
-            else:
-                output = self._handle_generic_task(task)
-            
-            task.status = TaskStatus.COMPLETED
-            
-        except Exception as e:
-            task.status = TaskStatus.FAILED
-            output = {"error": str(e)}
-
-        execution_time = (time.time() - start_time) * 1000 # ms
+        output, execution_time, ok = self._run(task.type, task.description, task.input_data)
+        task.status = TaskStatus.COMPLETED if ok else TaskStatus.FAILED
+        _record(task.type, execution_time, ok)
 
         return Result(
             task_id=task.id,
@@ -59,35 +81,290 @@ class WorkerExecutor:
             execution_time_ms=execution_time
         )
 
-    def _handle_fetch_trends(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_batch(self, tasks: Sequence[Task]) -> List[Result]:
+        """
+        WHY: To amortize per-call overhead when many small tasks arrive together.
+        WHEN: Called with a batch of Tasks.
+        WHO CALLS: Callers that want Result models (see execute_batch_records).
+        """
+        return [
+            r if isinstance(r, Result) else r.to_model()
+            for r in self.execute_batch_records(tasks)
+        ]
+
+    def execute_batch_records(self, tasks: Sequence[Task]) -> List[Union[Result, ResultRecord]]:
+        """
+        WHY: Same as `execute_batch` without building a Result model per task, for
+            internal hops that go straight to the wire (TaskQueue.publish_results).
+        WHEN: Called with a batch claimed from the queue.
+        WHO CALLS: apps.worker.main
+
+        Tasks are grouped by type, and every group goes by its type's ExecutionMode.
+        A group whose skill has a batch form is one unit of work (one call, each task
+        charged an equal share of its time); other groups are one unit per task.
+        THREAD and PROCESS units are sent to their pool first, so they run while the
+        INLINE units are handled in the calling thread. A PROCESS group whose batch
+        form cannot be imported by name in a child falls back to one task per unit.
+        Results come back in input order (ResultRecords, or Results for tasks sent
+        through `submit`), and a failure only marks the tasks it belongs to as FAILED.
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, task in enumerate(tasks):
+            task.status = TaskStatus.IN_PROGRESS
+            groups.setdefault(task.type, []).append(i)
+
+        outcomes: List[Optional[Outcome]] = [None] * len(tasks)
+        pooled: List[Tuple[int, "Future[Result]"]] = []
+        pooled_batches: List[Tuple[List[int], "Future[List[Outcome]]"]] = []
+        inline: List[Tuple[str, List[int], bool]] = []
+        for task_type, indexes in groups.items():
+            mode = self.mode_for(task_type)
+            has_batch = self.registry.get_batch(task_type) is not None
+            if mode == ExecutionMode.INLINE:
+                inline.append((task_type, indexes, has_batch))
+                continue
+            if has_batch:
+                inputs = [tasks[i].input_data for i in indexes]
+                future = self._submit_batch(task_type, mode, inputs)
+                if future is not None:
+                    pooled_batches.append((indexes, future))
+                    continue
+            for i in indexes:
+                try:
+                    pooled.append((i, self.submit(tasks[i])))
+                except ValueError as e:  # handler cannot be sent to a process
+                    outcomes[i] = ({"error": str(e)}, 0.0, False)
+
+        for task_type, indexes, has_batch in inline:
+            if has_batch:
+                inputs = [tasks[i].input_data for i in indexes]
+                for i, outcome in zip(indexes, self._run_batch(task_type, inputs)):
+                    outcomes[i] = outcome
+                continue
+            for i in indexes:
+                outcomes[i] = self._run(task_type, tasks[i].description, tasks[i].input_data)
+
+        for indexes, future in pooled_batches:
+            try:
+                batch_outcomes = future.result()
+            except Exception as e:  # e.g. BrokenProcessPool
+                batch_outcomes = [({"error": str(e)}, 0.0, False)] * len(indexes)
+            for i, outcome in zip(indexes, batch_outcomes):
+                outcomes[i] = outcome
+
+        # submit() already set status and recorded metrics for pooled tasks.
+        results: List[Optional[Union[Result, ResultRecord]]] = [None] * len(tasks)
+        for i, future in pooled:
+            results[i] = future.result()
+        for i, (task, outcome) in enumerate(zip(tasks, outcomes)):
+            if results[i] is not None:
+                continue
+            output, execution_time, ok = outcome
+            task.status = TaskStatus.COMPLETED if ok else TaskStatus.FAILED
+            _record(task.type, execution_time, ok)
+            results[i] = ResultRecord(task.id, output, execution_time)
+        return results
+
+    def mode_for(self, task_type: str) -> ExecutionMode:
+        return self.execution_modes.get(task_type, ExecutionMode.INLINE)
+
+    def submit(self, task: Task) -> "Future[Result]":
+        """
+        WHY: To run a task according to its ExecutionMode without blocking the caller.
+        WHEN: Called by concurrent consumers (orchestrator, queue consumers).
+        WHO CALLS: apps.orchestrator.pipeline.SwarmPipeline
+
+        INLINE tasks are executed immediately and returned as an already-completed future.
+
+        Raises:
+            ValueError: For a PROCESS-mode task whose handler cannot be imported by
+                name in a child process (e.g. a lambda or closure).
+        """
+        mode = self.mode_for(task.type)
+        if mode == ExecutionMode.INLINE:
+            future: Future = Future()
+            future.set_result(self.execute_task(task))
+            return future
+
+        if mode == ExecutionMode.PROCESS:
+            route = self.registry.route(task.type)
+            if route is None and task.type in self.registry:
+                raise ValueError(
+                    f"Handler for {task.type} cannot run in PROCESS mode: "
+                    "it is not importable by name"
+                )
+            task.mark_in_progress()
+            raw = self._get_process_pool().submit(
+                _run_in_subprocess, route, task.type, task.description, task.input_data
+            )
+        else:
+            task.mark_in_progress()
+            raw = self._get_thread_pool().submit(
+                self._run, task.type, task.description, task.input_data
+            )
+
+        result_future: Future = Future()
+
+        def _finish(done: Future) -> None:
+            try:
+                output, execution_time, ok = done.result()
+            except Exception as e:  # e.g. BrokenProcessPool
+                output, execution_time, ok = {"error": str(e)}, 0.0, False
+            task.status = TaskStatus.COMPLETED if ok else TaskStatus.FAILED
+            _record(task.type, execution_time, ok)
+            # The output was produced by our own handler, so skip re-validation.
+            result_future.set_result(ResultRecord(task.id, output, execution_time).to_model())
+
+        raw.add_done_callback(_finish)
+        return result_future
+
+    def _submit_batch(
+        self, task_type: str, mode: ExecutionMode, inputs: List[Dict[str, Any]]
+    ) -> Optional["Future[List[Outcome]]"]:
         """
-        Specific handler for trend fetching.
-        In a real app, this would call the 'TrendFetchSkill'.
+        Sends one batch-form call to the pool of `mode` (THREAD or PROCESS).
+        Returns None when the batch form cannot be imported by name in a child.
         """
-        # Mocking the Trend Fetch behavior based on specs/api/trend_fetch.yaml
-        return {
-            "trends": [
-                {
-                    "title": "AI Agents 101",
-                    "engagement_score": 0.95,
-                    "source_url": "https://tiktok.com/@ai/123"
-                },
-                {
-                    "title": "Python vs Rust",
-                    "engagement_score": 0.82,
-                    "source_url": "https://youtube.com/watch?v=abc"
-                }
-            ]
-        }
+        if mode == ExecutionMode.PROCESS:
+            route = self.registry.batch_route(task_type)
+            if route is None:
+                return None
+            return self._get_process_pool().submit(
+                _run_batch_in_subprocess, route, task_type, inputs
+            )
+        return self._get_thread_pool().submit(self._run_batch, task_type, inputs)
 
-    def _handle_analyze_trends(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_task_async(self, task: Task) -> Result:
         """
-        handler for analysis
+        WHY: Awaitable form of `submit` for asyncio callers.
+        WHEN: Inside an event loop, for THREAD/PROCESS task types.
+        WHO CALLS: Async services.
         """
-        return {"analysis_report": "High engagement detected for AI topics."}
+        return await asyncio.wrap_future(self.submit(task))
 
-    def _handle_generic_task(self, task: Task) -> Dict[str, Any]:
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        WHY: To release pool threads and child processes.
+        WHEN: On worker stop.
+        WHO CALLS: apps.worker.main, tests.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+
+    def __enter__(self) -> "WorkerExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.max_processes)
+        return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_threads, thread_name_prefix="chimera-worker"
+            )
+        return self._thread_pool
+
+    def _run(self, task_type: str, description: str, input_data: Dict[str, Any]) -> Outcome:
+        """
+        Runs the handler for `task_type` and times it.
+        Works on plain values so the same code path serves every ExecutionMode.
+        """
+        start_time = time.perf_counter()
+
+        try:
+            output = self._route(task_type, description, input_data)
+            ok = True
+        except Exception as e:
+            output = {"error": str(e)}
+            ok = False
+
+        execution_time = (time.perf_counter() - start_time) * 1000 # ms
+        return output, execution_time, ok
+
+    def _run_batch(self, task_type: str, inputs: List[Dict[str, Any]]) -> List[Outcome]:
+        """
+        Runs the batch form for `task_type` once over `inputs` and charges each input
+        an equal share of the call's time. A failing call fails every input; an
+        Exception in the returned list fails only its own input.
+        """
+        batch_handler = self.registry.get_batch(task_type)
+        start_time = time.perf_counter()
+        try:
+            outputs = batch_handler(inputs)
+            if len(outputs) != len(inputs):
+                raise RuntimeError(
+                    f"Batch handler for {task_type} returned {len(outputs)} outputs"
+                    f" for {len(inputs)} tasks"
+                )
+        except Exception as e:
+            outputs = [e] * len(inputs)
+        share = (time.perf_counter() - start_time) * 1000 / len(inputs) # ms
+
+        return [
+            ({"error": str(output)}, share, False) if isinstance(output, Exception)
+            else (output, share, True)
+            for output in outputs
+        ]
+
+    def _route(
+        self, task_type: str, description: str, input_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Routing: skills from the registry, then the generic fallback.
+        handler = self.registry.get(task_type)
+        if handler is None:
+            return self._handle_generic_task(description)
+        return handler(input_data)
+
+    def _handle_generic_task(self, description: str) -> Dict[str, Any]:
         """
         Fallback handler.
         """
-        return {"message": f"Executed generic task: {task.description}"}
+        return {"message": f"Executed generic task: {description}"}
+
+
+def _record(task_type: str, execution_time_ms: float, ok: bool) -> None:
+    stage_seconds.observe(execution_time_ms / 1000, stage="execute", task_type=task_type)
+    tasks_total.inc(task_type=task_type, status="completed" if ok else "failed")
+
+
+# One executor per child process, created on first use and reused for every task
+# the pool sends to that process. Its registry only holds the routes the parent
+# sent, so the child runs the parent's handler or fails; it never falls back to
+# another skill. A type the parent has no handler for (route None) runs the
+# generic fallback, as it would in the parent.
+_subprocess_executor: Optional[WorkerExecutor] = None
+
+def _run_in_subprocess(
+    route: Optional[Tuple[str, str]], task_type: str, description: str, input_data: Dict[str, Any]
+) -> Outcome:
+    global _subprocess_executor
+    if _subprocess_executor is None:
+        _subprocess_executor = WorkerExecutor(registry=SkillRegistry())
+    registry = _subprocess_executor.registry
+    if registry.route(task_type) != route:
+        if route is None:
+            registry.unregister(task_type)
+        else:
+            registry.register_lazy(task_type, *route)
+    return _subprocess_executor._run(task_type, description, input_data)
+
+
+def _run_batch_in_subprocess(
+    route: Tuple[str, str], task_type: str, inputs: List[Dict[str, Any]]
+) -> List[Outcome]:
+    global _subprocess_executor
+    if _subprocess_executor is None:
+        _subprocess_executor = WorkerExecutor(registry=SkillRegistry())
+    registry = _subprocess_executor.registry
+    if registry.batch_route(task_type) != route:
+        registry.register_batch_lazy(task_type, *route)
+    return _subprocess_executor._run_batch(task_type, inputs)
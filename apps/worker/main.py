@@ -7,38 +7,126 @@ WHY IT EXISTS:
     To allows the service to be run as a standalone process.
 
 HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
-    - Instantiates WorkerExecutor.
-    - (Simulation) Receives tasks (from 'queue').
-    - Processes them and prints results.
+    - Instantiates WorkerExecutor, with per-type ExecutionModes from
+      WORKER_EXECUTION_MODES (e.g. "analyze_trends=process,fetch_trends=thread").
+    - Claims batches of Tasks from the TaskQueue (Redis when REDIS_URL is set,
+      otherwise an in-process queue seeded with a mock Task).
+    - Processes them, publishes Results and acknowledges the batch, then polls again;
+      empty polls back off from WORKER_POLL_MIN_SECONDS to WORKER_POLL_MAX_SECONDS.
+    - Runs until Ctrl-C or SIGTERM, which stop it after the batch in hand.
+    - Closes pooled connections (core.clients.default_clients) on stop.
+    - Serves Prometheus metrics on METRICS_PORT when set (core.metrics).
 """
 
+import os
+import signal
+import threading
+from typing import Dict
+
 from core.task_models import Task
+from core.clients import default_clients
+from core.metrics import serve_metrics_from_env
 from apps.worker.executor import WorkerExecutor
+from apps.worker.schemas import ExecutionMode
+from apps.worker.queue import TaskQueue, RedisQueueBackend
+
+def parse_execution_modes(spec: str) -> Dict[str, ExecutionMode]:
+    """Parses "type=mode,type=mode" (modes: inline, thread, process)."""
+    modes = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        task_type, _, mode = item.partition("=")
+        modes[task_type.strip()] = ExecutionMode(mode.strip().lower())
+    return modes
+
+def build_queue() -> TaskQueue:
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        return TaskQueue(RedisQueueBackend.from_url(redis_url))
+
+    # Offline mode: seed the in-process queue so the demo has something to do.
+    queue = TaskQueue()
+    queue.enqueue([
+        Task(
+            goal_id="mock-goal-123",
+            type="fetch_trends",
+            description="Fetch latest trends",
+            input_data={"platform": "tiktok"}
+        )
+    ])
+    return queue
+
+def run_once(worker: WorkerExecutor, queue: TaskQueue, batch_size: int = 10) -> int:
+    """
+    Claims one batch, executes it and acknowledges it.
+    Returns the number of Tasks processed.
+    """
+    tasks = queue.claim_records(batch_size)
+    if not tasks:
+        return 0
+
+    # Records end to end: claimed as TaskRecords, published as ResultRecords.
+    results = worker.execute_batch_records(tasks)
+    queue.publish_results(results)
+    queue.ack(tasks)
+
+    for task, result in zip(tasks, results):
+        print(f"   ✅ {task.id} ({task.type}) in {result.execution_time_ms:.2f}ms -> {task.status}")
+    return len(tasks)
+
+def poll(
+    worker: WorkerExecutor,
+    queue: TaskQueue,
+    stop: threading.Event,
+    batch_size: int = 10,
+    min_wait: float = 0.1,
+    max_wait: float = 5.0,
+) -> int:
+    """
+    Processes batches until `stop` is set. After an empty claim the Worker waits
+    before polling again, doubling the wait up to `max_wait`, so an idle fleet does
+    not hammer the broker; any work resets the wait to `min_wait`.
+    Returns the number of Tasks processed.
+    """
+    processed = 0
+    wait = min_wait
+    while not stop.is_set():
+        count = run_once(worker, queue, batch_size)
+        if count:
+            processed += count
+            wait = min_wait
+            default_clients.evict_idle()
+        else:
+            stop.wait(wait)
+            wait = min(wait * 2, max_wait)
+    return processed
 
 def main():
     print("🛠️  Starting Worker Service...")
+    serve_metrics_from_env()
     
-    # 1. Instantiate the Executor
-    worker = WorkerExecutor()
-    
-    # 2. Simulate pulling a task from queue
+    # 1. Instantiate the Executor and connect to the queue
+    modes = parse_execution_modes(os.getenv("WORKER_EXECUTION_MODES", ""))
+    worker = WorkerExecutor(execution_modes=modes)
+    queue = build_queue()
+    batch_size = int(os.getenv("WORKER_BATCH_SIZE", "10"))
+    min_wait = float(os.getenv("WORKER_POLL_MIN_SECONDS", "0.1"))
+    max_wait = float(os.getenv("WORKER_POLL_MAX_SECONDS", "5"))
+    # Ctrl-C / SIGTERM stop polling once the current batch is published and acked.
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    # 2. Poll the queue batch by batch until stopped
     print("📥 Polling Task Queue...")
-    mock_task = Task(
-        goal_id="mock-goal-123",
-        type="fetch_trends",
-        description="Fetch latest trends",
-        input_data={"platform": "tiktok"}
-    )
-    print(f"   Received Task: {mock_task.id} ({mock_task.type})")
-    
-    # 3. Execute Task
-    print("\n⚡ Executing Task...")
-    result = worker.execute_task(mock_task)
-    
-    # 4. Report Result
-    print(f"✅ Execution Completed in {result.execution_time_ms:.2f}ms")
-    print(f"   Output Keys: {list(result.output_data.keys())}")
-    print(f"   Status: {mock_task.status}")
+    try:
+        processed = poll(worker, queue, stop, batch_size, min_wait, max_wait)
+
+        # 3. Report
+        print(f"\n⚡ Processed {processed} tasks. Pending: {queue.pending_count()}")
+    finally:
+        # 4. Release executor pools and pooled connections
+        worker.shutdown()
+        default_clients.shutdown()
 
 if __name__ == "__main__":
     main()
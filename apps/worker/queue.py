@@ -0,0 +1,307 @@
+"""
+WHAT THIS FILE DOES:
+    Implements the Task Queue that sits between the Planner and the Workers.
+    Tasks are serialized to a compact JSON wire form, claimed in batches, acknowledged
+    explicitly and redelivered if the Worker that claimed them disappears.
+
+WHY IT EXISTS:
+    With dozens of Worker processes the cost that dominates is the number of
+    round trips to the broker, not the work itself. Claiming N Tasks in one call
+    (and acknowledging them in one call) keeps that cost flat per batch.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Upstream: The Planner (or orchestrator) calls TaskQueue.enqueue.
+    - Downstream: apps.worker.main claims Tasks, executes them and publishes Results.
+    - Backends: RedisQueueBackend for production, InMemoryQueueBackend for tests/offline use.
+
+DELIVERY SEMANTICS:
+    At-least-once. A claimed Task is invisible to other Workers until its visibility
+    timeout expires; if it is not acknowledged by then it goes back on the queue.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple, Union
+
+from core.task_models import Task, Result
+from core.records import TaskRecord, ResultRecord
+from core.metrics import stage_seconds
+
+# Redeliver expired Tasks, then pop a batch and mark it in flight, in one round trip.
+# KEYS: pending list, in-flight zset, payload hash
+# ARGV: batch size, now, visibility deadline
+_CLAIM_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[2])
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('LPUSH', KEYS[1], id)
+end
+local ids = redis.call('LPOP', KEYS[1], ARGV[1])
+if not ids then
+    return {}
+end
+local out = {}
+for _, id in ipairs(ids) do
+    local payload = redis.call('HGET', KEYS[3], id)
+    if payload then
+        redis.call('ZADD', KEYS[2], ARGV[3], id)
+        table.insert(out, id)
+        table.insert(out, payload)
+    end
+end
+return out
+"""
+
+
+def _dumps(wire: List) -> str:
+    return json.dumps(wire, separators=(",", ":"), default=str)
+
+
+class QueueBackend(Protocol):
+    """
+    Storage contract for TaskQueue. Backends only move opaque (id, payload) strings;
+    serialization is handled by TaskQueue.
+    """
+
+    def push(self, items: Sequence[Tuple[str, str]]) -> None: ...
+
+    def claim(self, count: int, now: float, deadline: float) -> List[Tuple[str, str]]: ...
+
+    def ack(self, ids: Sequence[str]) -> int: ...
+
+    def push_results(self, payloads: Sequence[str]) -> None: ...
+
+    def pop_results(self, count: int) -> List[str]: ...
+
+    def pending_count(self) -> int: ...
+
+
+class RedisQueueBackend:
+    """
+    ROLE IN SWARM:
+        Shared broker for all Worker processes.
+
+    Layout (under `namespace`):
+        <ns>:pending   LIST of task ids waiting to be claimed
+        <ns>:inflight  ZSET of claimed task ids scored by visibility deadline
+        <ns>:payload   HASH task id -> serialized Task
+        <ns>:results   LIST of serialized Results
+    """
+
+    def __init__(self, client, namespace: str = "chimera:tasks"):
+        self.client = client
+        self.pending_key = f"{namespace}:pending"
+        self.inflight_key = f"{namespace}:inflight"
+        self.payload_key = f"{namespace}:payload"
+        self.results_key = f"{namespace}:results"
+        self._claim = client.register_script(_CLAIM_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, namespace: str = "chimera:tasks") -> "RedisQueueBackend":
+        from core.clients import default_clients
+
+        return cls(default_clients.redis(url, decode_responses=True), namespace=namespace)
+
+    def push(self, items: Sequence[Tuple[str, str]]) -> None:
+        if not items:
+            return
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self.payload_key, mapping=dict(items))
+        pipe.rpush(self.pending_key, *[task_id for task_id, _ in items])
+        pipe.execute()
+
+    def claim(self, count: int, now: float, deadline: float) -> List[Tuple[str, str]]:
+        flat = self._claim(
+            keys=[self.pending_key, self.inflight_key, self.payload_key],
+            args=[count, now, deadline],
+        )
+        return list(zip(flat[0::2], flat[1::2]))
+
+    def ack(self, ids: Sequence[str]) -> int:
+        if not ids:
+            return 0
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self.inflight_key, *ids)
+        pipe.hdel(self.payload_key, *ids)
+        removed, _ = pipe.execute()
+        return removed
+
+    def push_results(self, payloads: Sequence[str]) -> None:
+        if payloads:
+            self.client.rpush(self.results_key, *payloads)
+
+    def pop_results(self, count: int) -> List[str]:
+        return self.client.lpop(self.results_key, count) or []
+
+    def pending_count(self) -> int:
+        return self.client.llen(self.pending_key)
+
+
+class InMemoryQueueBackend:
+    """
+    ROLE IN SWARM:
+        Offline stand-in for RedisQueueBackend with the same semantics.
+        Safe to share between threads of a single process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._inflight: Dict[str, float] = {}
+        self._payload: Dict[str, str] = {}
+        self._results: deque = deque()
+
+    def push(self, items: Sequence[Tuple[str, str]]) -> None:
+        with self._lock:
+            for task_id, payload in items:
+                self._payload[task_id] = payload
+                self._pending.append(task_id)
+
+    def claim(self, count: int, now: float, deadline: float) -> List[Tuple[str, str]]:
+        with self._lock:
+            expired = [task_id for task_id, due in self._inflight.items() if due <= now]
+            for task_id in expired:
+                del self._inflight[task_id]
+                self._pending.appendleft(task_id)
+
+            claimed = []
+            while self._pending and len(claimed) < count:
+                task_id = self._pending.popleft()
+                # A missing payload means the Task was acknowledged after being redelivered.
+                if task_id in self._payload:
+                    self._inflight[task_id] = deadline
+                    claimed.append((task_id, self._payload[task_id]))
+            return claimed
+
+    def ack(self, ids: Sequence[str]) -> int:
+        with self._lock:
+            removed = 0
+            for task_id in ids:
+                if self._inflight.pop(task_id, None) is not None:
+                    removed += 1
+                self._payload.pop(task_id, None)
+            return removed
+
+    def push_results(self, payloads: Sequence[str]) -> None:
+        with self._lock:
+            self._results.extend(payloads)
+
+    def pop_results(self, count: int) -> List[str]:
+        with self._lock:
+            return [self._results.popleft() for _ in range(min(count, len(self._results)))]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+class TaskQueue:
+    """
+    ROLE IN SWARM:
+        The "Conveyor Belt" between the Planner and the Workers.
+        Converts Tasks and Results to and from their wire form and delegates
+        storage to a QueueBackend.
+
+    The wire form is the positional list from core.records. Everything on the queue
+    was produced by our own services, so claimed Tasks and collected Results are
+    rebuilt without pydantic re-validation.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[QueueBackend] = None,
+        visibility_timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend if backend is not None else InMemoryQueueBackend()
+        self.visibility_timeout = visibility_timeout
+        self.clock = clock
+
+    def enqueue(self, tasks: Iterable[Task]) -> int:
+        """
+        WHY: To make Tasks available to any Worker.
+        WHEN: After the Planner has produced a plan.
+        WHO CALLS: apps.planner / apps.orchestrator, or tests.
+        """
+        # The enqueue time rides along after the record's fields (from_wire ignores it)
+        # so the claiming Worker, possibly on another host, can measure queue wait.
+        # It is wall-clock time because it crosses processes.
+        enqueued_us = int(self.clock() * 1_000_000)
+        items = [
+            (task.id, _dumps(TaskRecord.from_model(task).to_wire() + [enqueued_us]))
+            for task in tasks
+        ]
+        self.backend.push(items)
+        return len(items)
+
+    def claim(self, batch_size: int = 10) -> List[Task]:
+        """
+        WHY: To fetch up to `batch_size` Tasks in a single broker round trip.
+        WHEN: Each polling round of a Worker.
+        WHO CALLS: apps.worker.main
+
+        Claimed Tasks must be passed to `ack` before the visibility timeout expires,
+        otherwise they are handed to another Worker.
+        """
+        return [record.to_model() for record in self.claim_records(batch_size)]
+
+    def claim_records(self, batch_size: int = 10) -> List[TaskRecord]:
+        """
+        WHY: Same as `claim`, but skips building pydantic models.
+        WHEN: In worker loops that only read the Task's fields (WorkerExecutor accepts records).
+        WHO CALLS: apps.worker.main
+        """
+        now = self.clock()
+        claimed = self.backend.claim(batch_size, now, now + self.visibility_timeout)
+        records = []
+        for _, payload in claimed:
+            wire = json.loads(payload)
+            record = TaskRecord.from_wire(wire)
+            if len(wire) > 8:
+                # Includes earlier claims of a redelivered Task.
+                waited = max(0.0, now - wire[8] / 1_000_000)
+                stage_seconds.observe(waited, stage="queue_wait", task_type=record.type)
+            records.append(record)
+        return records
+
+    def ack(self, tasks: Iterable[Task]) -> int:
+        """
+        WHY: To remove finished Tasks so they are never redelivered.
+        WHEN: After the Worker has published the Results of a batch.
+        WHO CALLS: apps.worker.main
+        """
+        return self.backend.ack([task.id for task in tasks])
+
+    def publish_results(self, results: Iterable[Union[Result, ResultRecord]]) -> None:
+        """
+        WHY: To hand Results to the Judge without a round trip per Result.
+        WHEN: After a batch of Tasks has been executed.
+        WHO CALLS: apps.worker.main
+
+        Accepts Results or ResultRecords; records go to the wire as they are.
+        """
+        self.backend.push_results([
+            _dumps((r if isinstance(r, ResultRecord) else ResultRecord.from_model(r)).to_wire())
+            for r in results
+        ])
+
+    def collect_results(self, batch_size: int = 10) -> List[Result]:
+        """
+        WHY: To drain published Results in batches.
+        WHEN: Each polling round of a Judge.
+        WHO CALLS: apps.judge consumers, or tests.
+        """
+        return [record.to_model() for record in self.collect_result_records(batch_size)]
+
+    def collect_result_records(self, batch_size: int = 10) -> List[ResultRecord]:
+        """
+        WHY: Same as `collect_results`, but skips building pydantic models.
+        WHEN: In judge loops (JudgeValidator accepts records).
+        WHO CALLS: apps.judge consumers
+        """
+        return [ResultRecord.from_wire(json.loads(p)) for p in self.backend.pop_results(batch_size)]
+
+    def pending_count(self) -> int:
+        return self.backend.pending_count()
@@ -0,0 +1,231 @@
+"""
+WHAT THIS FILE DOES:
+    Implements the Skill Registry: a task type -> skill callable table used by the
+    WorkerExecutor to dispatch Tasks.
+
+WHY IT EXISTS:
+    Routing used to be a hard-coded if/elif chain that never reached the real skills.
+    The registry discovers skills from the `skills` package, routes with a single dict
+    lookup, and only imports a skill's module the first time one of its task types is
+    executed, so a worker pool that serves one task type never loads the others.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Discovery: reads TASK_TYPES (and optional BATCH_TASK_TYPES) from each sub-package
+      of `skills` (see skills/__init__.py).
+    - Consumer: apps.worker.executor.WorkerExecutor
+    - Observability: `report()` lists which skills are loaded and their import time.
+"""
+
+import importlib
+import pkgutil
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+SkillHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+# Takes many inputs, returns one output (or an Exception for that item) per input, in order.
+BatchSkillHandler = Callable[[List[Dict[str, Any]]], List[Any]]
+
+
+class SkillStatus(BaseModel):
+    """
+    Load state of one skill module, as reported by SkillRegistry.report().
+    """
+    module: str = Field(..., description="Dotted path of the skill module.")
+    task_types: List[str] = Field(default_factory=list)
+    loaded: bool = False
+    import_time_ms: Optional[float] = Field(
+        default=None, description="Set once the module is imported."
+    )
+
+
+class SkillRegistry:
+    """
+    ROLE IN SWARM:
+        The "Switchboard" between task types and skills.
+    """
+
+    _default: Optional["SkillRegistry"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._handlers: Dict[str, SkillHandler] = {}
+        self._routes: Dict[str, Tuple[str, str]] = {}
+        self._batch_handlers: Dict[str, BatchSkillHandler] = {}
+        self._batch_routes: Dict[str, Tuple[str, str]] = {}
+        self._import_times: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "SkillRegistry":
+        """
+        WHY: To share one registry (and its load state) across every executor in the process.
+        WHEN: When a WorkerExecutor is created without an explicit registry.
+        WHO CALLS: apps.worker.executor.WorkerExecutor
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+                cls._default.discover()
+            return cls._default
+
+    def discover(self, package: str = "skills") -> int:
+        """
+        WHY: To find every skill without importing its implementation.
+        WHEN: Once, when the registry is built.
+        WHO CALLS: SkillRegistry.default, tests.
+
+        Returns the number of task types registered.
+        """
+        root = importlib.import_module(package)
+        count = 0
+        for info in pkgutil.iter_modules(root.__path__, prefix=f"{package}."):
+            if not info.ispkg:
+                continue
+            skill_pkg = importlib.import_module(info.name)
+            for task_type, attr in getattr(skill_pkg, "TASK_TYPES", {}).items():
+                self.register_lazy(task_type, f"{info.name}.skill", attr)
+                count += 1
+            for task_type, attr in getattr(skill_pkg, "BATCH_TASK_TYPES", {}).items():
+                self._batch_routes[task_type] = (f"{info.name}.skill", attr)
+                self._batch_handlers.pop(task_type, None)
+        return count
+
+    def register(self, task_type: str, handler: SkillHandler) -> None:
+        """
+        Registers an already-imported callable (overrides any lazy route, and drops
+        any batch form so batches go through the new handler too).
+        """
+        self._handlers[task_type] = handler
+        self._batch_handlers.pop(task_type, None)
+        self._batch_routes.pop(task_type, None)
+
+    def register_batch(self, task_type: str, handler: BatchSkillHandler) -> None:
+        """
+        Registers the batch form of a skill (overrides any lazy batch route).
+        """
+        self._batch_handlers[task_type] = handler
+
+    def register_lazy(self, task_type: str, module: str, attr: str) -> None:
+        """
+        Registers `module.attr` as the handler for `task_type` without importing it.
+        """
+        self._routes[task_type] = (module, attr)
+        self._handlers.pop(task_type, None)
+
+    def register_batch_lazy(self, task_type: str, module: str, attr: str) -> None:
+        """
+        Registers `module.attr` as the batch form for `task_type` without importing it.
+        """
+        self._batch_routes[task_type] = (module, attr)
+        self._batch_handlers.pop(task_type, None)
+
+    def unregister(self, task_type: str) -> None:
+        """Removes every handler and route for `task_type`."""
+        for table in (self._handlers, self._routes, self._batch_handlers, self._batch_routes):
+            table.pop(task_type, None)
+
+    def get(self, task_type: str) -> Optional[SkillHandler]:
+        """
+        WHY: To resolve the handler for a task type.
+        WHEN: On every task execution.
+        WHO CALLS: apps.worker.executor.WorkerExecutor
+
+        The first call for a lazily registered type imports its module; after that
+        the lookup is a single dict access.
+        """
+        return self._resolve(task_type, self._handlers, self._routes)
+
+    def route(self, task_type: str) -> Optional[Tuple[str, str]]:
+        """
+        WHY: To name a handler so another process can import it.
+        WHEN: Before a task is sent to a PROCESS-mode pool.
+        WHO CALLS: apps.worker.executor.WorkerExecutor
+
+        Returns (module, attribute path) for lazily registered handlers and for
+        registered callables defined at module level (or nested in classes), and
+        None for lambdas, closures and unknown task types.
+        """
+        return self._route_of(task_type, self._handlers, self._routes)
+
+    def batch_route(self, task_type: str) -> Optional[Tuple[str, str]]:
+        """
+        WHY: Same as `route`, for the skill's batch form.
+        WHEN: Before a batch is sent to a PROCESS-mode pool.
+        WHO CALLS: apps.worker.executor.WorkerExecutor
+        """
+        return self._route_of(task_type, self._batch_handlers, self._batch_routes)
+
+    @staticmethod
+    def _route_of(
+        task_type: str, handlers: Dict[str, Any], routes: Dict[str, Tuple[str, str]]
+    ) -> Optional[Tuple[str, str]]:
+        if task_type in handlers:
+            handler = handlers[task_type]
+            module = getattr(handler, "__module__", None)
+            qualname = getattr(handler, "__qualname__", "")
+            if not module or not qualname or "<" in qualname:
+                return None
+            return module, qualname
+        return routes.get(task_type)
+
+    def get_batch(self, task_type: str) -> Optional[BatchSkillHandler]:
+        """
+        WHY: To find a skill's batch form, if it has one.
+        WHEN: On every WorkerExecutor.execute_batch group.
+        WHO CALLS: apps.worker.executor.WorkerExecutor
+        """
+        return self._resolve(task_type, self._batch_handlers, self._batch_routes)
+
+    def _resolve(
+        self, task_type: str, handlers: Dict[str, Any], routes: Dict[str, Tuple[str, str]]
+    ) -> Any:
+        handler = handlers.get(task_type)
+        if handler is not None or task_type not in routes:
+            return handler
+
+        with self._lock:
+            handler = handlers.get(task_type)
+            if handler is None:
+                module, attr = routes[task_type]
+                handler = self._import(module)
+                for name in attr.split("."):
+                    handler = getattr(handler, name)
+                handlers[task_type] = handler
+        return handler
+
+    def __contains__(self, task_type: str) -> bool:
+        return task_type in self._handlers or task_type in self._routes
+
+    def task_types(self) -> List[str]:
+        return sorted(set(self._handlers) | set(self._routes))
+
+    def report(self) -> List[SkillStatus]:
+        """
+        WHY: To show which skills a worker has actually paid to load.
+        WHEN: On demand (health endpoints, debugging cold starts).
+        WHO CALLS: Operators / tests.
+        """
+        modules: Dict[str, List[str]] = {}
+        for task_type, (module, _) in self._routes.items():
+            modules.setdefault(module, []).append(task_type)
+
+        return [
+            SkillStatus(
+                module=module,
+                task_types=sorted(task_types),
+                loaded=module in self._import_times,
+                import_time_ms=self._import_times.get(module),
+            )
+            for module, task_types in sorted(modules.items())
+        ]
+
+    def _import(self, module: str) -> Any:
+        if module in self._import_times:
+            return importlib.import_module(module)
+        start = time.perf_counter()
+        imported = importlib.import_module(module)
+        self._import_times[module] = (time.perf_counter() - start) * 1000
+        return imported
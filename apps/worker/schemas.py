@@ -0,0 +1,22 @@
+"""
+WHAT THIS FILE DOES:
+    Defines configuration types specific to the Worker Service.
+
+WHY IT EXISTS:
+    Different task types have very different resource profiles. CPU-heavy analysis
+    needs its own core, while API calls spend their time waiting on the network.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - ExecutionMode is assigned per task type in apps.worker.executor.WorkerExecutor.
+"""
+
+from enum import Enum
+
+
+class ExecutionMode(str, Enum):
+    """
+    Where a task type's handler runs.
+    """
+    INLINE = "inline"    # In the calling thread (default, lowest overhead).
+    THREAD = "thread"    # In a thread pool; suited to I/O-bound skills.
+    PROCESS = "process"  # In a process pool; suited to CPU-bound skills.
@@ -0,0 +1,119 @@
+"""
+WHAT THIS FILE DOES:
+    Measures construction cost and memory per object for the pydantic Task/Result
+    models versus the compact records in core.records.
+
+WHY IT EXISTS:
+    To show what each internal hop saves by using trusted construction and slotted
+    records instead of validating pydantic models. The "hop" cases are the worker's
+    publish step: a Result built and shipped (via a model, or as a record end to end).
+
+HOW TO RUN:
+    python -m benchmarks.bench_records [--count N]
+
+    Exits with status 1 when the records no longer beat the validated models (see
+    `check`).
+"""
+
+import argparse
+import gc
+import sys
+import os
+import timeit
+import tracemalloc
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.task_models import Task, Result
+from core.records import TaskRecord, ResultRecord
+
+INPUT = {"platform": "tiktok", "region": "US"}
+OUTPUT = {"trends": [{"title": "t", "engagement_score": 0.5, "source_url": "u"}]}
+
+CASES = {
+    "Task (validated)": lambda: Task(
+        goal_id="g", type="fetch_trends", description="d", input_data=INPUT
+    ),
+    "Task.model_construct": lambda: Task.model_construct(
+        goal_id="g", type="fetch_trends", description="d", input_data=INPUT
+    ),
+    "TaskRecord": lambda: TaskRecord("g", "fetch_trends", "d", INPUT),
+    "TaskRecord.to_model": lambda: TaskRecord("g", "fetch_trends", "d", INPUT).to_model(),
+    "Result (validated)": lambda: Result(task_id="t", output_data=OUTPUT, execution_time_ms=1.0),
+    "Result.model_construct": lambda: Result.model_construct(
+        task_id="t", output_data=OUTPUT, execution_time_ms=1.0
+    ),
+    "ResultRecord": lambda: ResultRecord("t", OUTPUT, 1.0),
+    "ResultRecord.to_model": lambda: ResultRecord("t", OUTPUT, 1.0).to_model(),
+    "Result hop (validated)": lambda: ResultRecord.from_model(
+        Result(task_id="t", output_data=OUTPUT, execution_time_ms=1.0)
+    ).to_wire(),
+    "ResultRecord hop": lambda: ResultRecord("t", OUTPUT, 1.0).to_wire(),
+}
+
+
+def construction_ns(factory, count: int) -> float:
+    timer = timeit.Timer(factory)
+    best = min(timer.repeat(repeat=5, number=count))
+    return best / count * 1e9
+
+
+def bytes_per_object(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # The list holding the objects is not part of the per-object cost.
+    size -= sys.getsizeof(objects)
+    del objects
+    return size / count
+
+
+def run(count: int) -> dict:
+    return {
+        name: {
+            "construct_ns": round(construction_ns(factory, count), 1),
+            "bytes_per_object": round(bytes_per_object(factory, count), 1),
+        }
+        for name, factory in CASES.items()
+    }
+
+
+def check(results: dict) -> List[str]:
+    """
+    The gains the records must keep, as failure messages (empty when all hold):
+    trusted models use less memory than validated ones, and a Result hop done with
+    records end to end takes at most half the time of one through a model.
+    """
+    failures = []
+    for model, record in (("Task (validated)", "TaskRecord.to_model"),
+                          ("Result (validated)", "ResultRecord.to_model")):
+        if results[record]["bytes_per_object"] >= results[model]["bytes_per_object"]:
+            failures.append(f"{record} uses no less memory than {model}")
+    validated = results["Result hop (validated)"]["construct_ns"]
+    if results["ResultRecord hop"]["construct_ns"] > validated / 2:
+        failures.append("ResultRecord hop is not at least twice as fast as a validated Result hop")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task/Result construction benchmark.")
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'case':<24}{'ns/object':>12}{'bytes/object':>14}")
+    results = run(args.count)
+    for name, row in results.items():
+        print(f"{name:<24}{row['construct_ns']:>12}{row['bytes_per_object']:>14}")
+    failures = check(results)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+WHAT THIS FILE DOES:
+    Measurement primitives for the benchmark suite: timing loops, latency percentiles,
+    peak memory, and comparison against a saved baseline.
+
+WHY IT EXISTS:
+    Every optimization needs a reference point. Keeping the measuring code separate
+    from the cases keeps the numbers comparable between runs and between cases.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Used by benchmarks.suite to measure the Planner, Worker, Judge and the pipeline.
+"""
+
+import asyncio
+import gc
+import math
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BenchResult(BaseModel):
+    """
+    Measurements for one benchmark case.
+    """
+    name: str
+    params: Dict[str, Any] = Field(default_factory=dict)
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_memory_kb: float
+
+    @property
+    def key(self) -> str:
+        suffix = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{suffix}]" if suffix else self.name
+
+
+class Regression(BaseModel):
+    """
+    A metric that got worse than the baseline by more than the allowed tolerance.
+    """
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change: float = Field(..., description="Relative change; positive means worse.")
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _summarize(name: str, params: Dict[str, Any], latencies_ns: List[int], total_ns: int,
+               ops: int, peak_bytes: int) -> BenchResult:
+    latencies_ms = sorted(ns / 1e6 for ns in latencies_ns)
+    return BenchResult(
+        name=name,
+        params=params,
+        iterations=len(latencies_ns),
+        ops_per_sec=round(ops / (total_ns / 1e9), 2) if total_ns else 0.0,
+        p50_ms=round(percentile(latencies_ms, 50), 4),
+        p95_ms=round(percentile(latencies_ms, 95), 4),
+        p99_ms=round(percentile(latencies_ms, 99), 4),
+        peak_memory_kb=round(peak_bytes / 1024, 1),
+    )
+
+
+def _peak_memory(run_once: Callable[[], Any]) -> int:
+    """
+    Peak bytes allocated during one call. Measured in a separate pass because
+    tracemalloc slows allocation down and would distort the timings.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_once()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(name: str, fn: Callable[[], Any], iterations: int = 100, warmup: int = 5,
+            params: Optional[Dict[str, Any]] = None, ops_per_call: int = 1) -> BenchResult:
+    """
+    WHY: To time a synchronous operation.
+    WHEN: For single-call cases (create_plan, execute_task, validate_result).
+    WHO CALLS: benchmarks.suite
+
+    `ops_per_call` lets a call that does N units of work report N ops.
+    """
+    for _ in range(warmup):
+        fn()
+
+    latencies: List[int] = []
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        t0 = time.perf_counter_ns()
+        fn()
+        latencies.append(time.perf_counter_ns() - t0)
+    total = time.perf_counter_ns() - started
+
+    return _summarize(name, params or {}, latencies, total, iterations * ops_per_call,
+                      _peak_memory(fn))
+
+
+def measure_async(name: str, fn: Callable[[], Awaitable[Any]], iterations: int = 10,
+                  warmup: int = 1, params: Optional[Dict[str, Any]] = None,
+                  ops_per_call: int = 1) -> BenchResult:
+    """
+    WHY: Same as `measure`, for coroutines (the pipeline).
+    WHEN: For end-to-end cases.
+    WHO CALLS: benchmarks.suite
+    """
+    return measure(name, lambda: asyncio.run(fn()), iterations, warmup, params, ops_per_call)
+
+
+def compare(current: List[BenchResult], baseline: List[BenchResult],
+            tolerance: float = 0.2) -> List[Regression]:
+    """
+    WHY: To catch performance regressions automatically.
+    WHEN: After a run, if a baseline file exists.
+    WHO CALLS: benchmarks.suite
+
+    Flags throughput drops and p95 latency increases larger than `tolerance`
+    (0.2 = 20%). Cases missing from either side are ignored.
+    """
+    base_by_key = {b.key: b for b in baseline}
+    regressions: List[Regression] = []
+    for result in current:
+        base = base_by_key.get(result.key)
+        if base is None:
+            continue
+        if base.ops_per_sec > 0:
+            drop = (base.ops_per_sec - result.ops_per_sec) / base.ops_per_sec
+            if drop > tolerance:
+                regressions.append(Regression(key=result.key, metric="ops_per_sec",
+                                              baseline=base.ops_per_sec, current=result.ops_per_sec,
+                                              change=round(drop, 4)))
+        if base.p95_ms > 0:
+            rise = (result.p95_ms - base.p95_ms) / base.p95_ms
+            if rise > tolerance:
+                regressions.append(Regression(key=result.key, metric="p95_ms",
+                                              baseline=base.p95_ms, current=result.p95_ms,
+                                              change=round(rise, 4)))
+    return regressions
@@ -0,0 +1,212 @@
+"""
+WHAT THIS FILE DOES:
+    Throughput and latency benchmarks for the Planner, Worker, Judge and the full
+    swarm pipeline, across payload sizes and concurrency levels.
+
+WHY IT EXISTS:
+    The tests only check behaviour. This suite records ops/sec, p50/p95/p99 latency
+    and peak memory in a JSON file and compares them with a saved baseline, so
+    regressions show up before they reach production.
+
+HOW TO RUN:
+    python -m benchmarks.suite                                  # full run -> bench_results.json
+    python -m benchmarks.suite --sizes 1,1000 --concurrency 1,8 # smaller matrix
+    python -m benchmarks.suite --save-baseline                  # record the reference numbers
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --tolerance 0.25
+
+    Exits with status 1 when any case regresses beyond the tolerance.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.task_models import Goal, Task, Result
+from apps.planner.service import PlannerService
+from apps.worker.executor import WorkerExecutor
+from apps.judge.validator import JudgeValidator
+from apps.orchestrator.pipeline import SwarmPipeline
+from apps.orchestrator.schemas import PipelineConfig
+from benchmarks.harness import BenchResult, compare, measure, measure_async
+
+DEFAULT_SIZES = [1, 100, 10_000, 100_000]
+DEFAULT_CONCURRENCY = [1, 4, 16]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def make_trends(n: int) -> List[dict]:
+    sources = ("twitter", "newsapi", "tiktok", "youtube")
+    return [
+        {
+            "title": f"trend-{i}",
+            "engagement_score": (i * 7919 % 1000) / 1000,
+            "source": sources[i % len(sources)],
+            "source_url": f"https://example.com/{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def iterations_for(size: int, budget: int = 200_000, cap: int = 200) -> int:
+    """Fewer iterations for bigger payloads, so each case takes similar wall time."""
+    return max(3, min(cap, budget // max(size, 1)))
+
+
+class SimulatedIOWorker(WorkerExecutor):
+    """Adds a fixed sleep per task to stand in for upstream API latency."""
+
+    def __init__(self, io_ms: float):
+        super().__init__()
+        self.io_ms = io_ms
+
+    def execute_task(self, task: Task) -> Result:
+        time.sleep(self.io_ms / 1000)
+        return super().execute_task(task)
+
+
+def bench_planner() -> List[BenchResult]:
+    planner = PlannerService()
+    goal = Goal(description="Fetch and analyze latest TikTok trends in the US.")
+    return [measure("planner.create_plan", lambda: planner.create_plan(goal), iterations=1000)]
+
+
+def bench_worker(sizes: List[int]) -> List[BenchResult]:
+    worker = WorkerExecutor()
+    fetch = Task(goal_id="bench", type="fetch_trends", description="fetch",
+                 input_data={"query": "ai"})
+    results = [measure("worker.execute_task.fetch_trends", lambda: worker.execute_task(fetch),
+                       iterations=1000)]
+    for size in sizes:
+        trends = make_trends(size)
+
+        def run():
+            task = Task(goal_id="bench", type="analyze_trends", description="analyze",
+                        input_data={"trends": trends, "min_engagement": 0.5})
+            return worker.execute_task(task)
+
+        results.append(measure("worker.execute_task.analyze_trends", run,
+                               iterations=iterations_for(size), params={"trends": size}))
+    return results
+
+
+def bench_judge(sizes: List[int]) -> List[BenchResult]:
+    judge = JudgeValidator()
+    results = []
+    for size in sizes:
+        result = Result(task_id="bench", output_data={"trends": make_trends(size)},
+                        execution_time_ms=0)
+        results.append(measure("judge.validate_result.fetch_trends",
+                               lambda: judge.validate_result(result, task_type="fetch_trends"),
+                               iterations=iterations_for(size, budget=20_000),
+                               params={"trends": size}))
+
+    # Bursts of small Results, judged one by one vs in bulk (ops = Results judged).
+    burst = [Result(task_id=str(i), output_data={"trends": make_trends(10)}, execution_time_ms=0)
+             for i in range(1000)]
+    results.append(measure("judge.validate_result.burst",
+                           lambda: [judge.validate_result(r, task_type="fetch_trends")
+                                    for r in burst],
+                           iterations=5, ops_per_call=len(burst), params={"results": len(burst)}))
+    results.append(measure("judge.validate_many.burst", lambda: judge.validate_many(burst),
+                           iterations=5, ops_per_call=len(burst), params={"results": len(burst)}))
+    judge.shutdown()
+    return results
+
+
+def bench_pipeline(concurrency_levels: List[int], goals: int, io_ms: float) -> List[BenchResult]:
+    results = []
+    for level in concurrency_levels:
+        pipeline = SwarmPipeline(
+            worker=SimulatedIOWorker(io_ms),
+            config=PipelineConfig(planner_concurrency=min(level, 4), worker_concurrency=level,
+                                  judge_concurrency=min(level, 4)),
+        )
+        tasks_per_run = 2 * goals  # trend goals plan fetch + analyze
+
+        async def run():
+            return await pipeline.run(
+                [Goal(description=f"Fetch latest trends #{i}") for i in range(goals)]
+            )
+
+        results.append(measure_async("pipeline.run", run, iterations=5, ops_per_call=tasks_per_run,
+                                     params={"concurrency": level, "goals": goals, "io_ms": io_ms}))
+    return results
+
+
+def run_suite(sizes: List[int], concurrency: List[int], goals: int,
+              io_ms: float) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    results += bench_planner()
+    results += bench_worker(sizes)
+    results += bench_judge(sizes)
+    results += bench_pipeline(concurrency, goals, io_ms)
+    return results
+
+
+def load_results(path: Path) -> List[BenchResult]:
+    data = json.loads(path.read_text())
+    return [BenchResult.model_validate(r) for r in data["results"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chimera throughput and latency benchmarks.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated trend counts per payload.")
+    parser.add_argument("--concurrency", default=",".join(map(str, DEFAULT_CONCURRENCY)),
+                        help="Comma-separated worker concurrency levels for the pipeline.")
+    parser.add_argument("--goals", type=int, default=20, help="Goals per pipeline run.")
+    parser.add_argument("--io-ms", type=float, default=5.0,
+                        help="Simulated upstream latency per task.")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write this run to --baseline instead of comparing against it.")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    concurrency = [int(c) for c in args.concurrency.split(",") if c]
+    results = run_suite(sizes, concurrency, args.goals, args.io_ms)
+
+    print(f"{'case':<62}{'ops/s':>12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak KB':>11}")
+    for r in results:
+        print(f"{r.key:<62}{r.ops_per_sec:>12}{r.p50_ms:>10}{r.p95_ms:>10}{r.p99_ms:>10}{r.peak_memory_kb:>11}")
+
+    baseline_path = Path(args.baseline)
+    regressions = []
+    if not args.save_baseline and baseline_path.exists():
+        regressions = compare(results, load_results(baseline_path), args.tolerance)
+
+    report = {
+        "meta": {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [r.model_dump() for r in results],
+        "regressions": [r.model_dump() for r in regressions],
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"\n📄 Results written to {args.output}")
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"📌 Baseline saved to {baseline_path}")
+    elif regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for reg in regressions:
+            print(f"   {reg.key} {reg.metric}: {reg.baseline} -> {reg.current} ({reg.change:+.0%})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
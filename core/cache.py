@@ -0,0 +1,266 @@
+"""
+WHAT THIS FILE DOES:
+    Provides an in-process result cache with TTL expiry, an LRU size limit,
+    single-flight request coalescing and an optional on-disk tier.
+
+WHY IT EXISTS:
+    Skills that call slow or rate-limited upstreams (trend APIs, LLMs) are often asked
+    the same question by many Goals at once. Caching answers for a while, and letting
+    concurrent identical requests wait on one in-flight call instead of each making
+    their own, cuts both latency and upstream quota usage.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Used by skills (e.g. skills.trend_fetcher) in front of their upstream calls.
+    - Thread-safe, so it works under the Worker's THREAD execution mode and the
+      orchestrator's thread pool.
+
+NOTE:
+    Cached values are shared between callers. Treat them as read-only.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+V = TypeVar("V")
+
+
+class CacheStats(BaseModel):
+    """
+    Counters reported by TTLCache.stats().
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class _Flight:
+    """One in-progress computation that other callers for the same key can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        # Bumped by invalidate()/clear() while the computation runs: its value is
+        # still returned to the callers already waiting, but never stored.
+        self.generation = 0
+
+
+class DiskTier:
+    """
+    Second cache tier: one JSON file per key, written atomically, so entries
+    survive process restarts. Values must be JSON-serializable.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str, now: float) -> Tuple[bool, Any, float]:
+        """Returns (found, value, expires_at)."""
+        path = self._path(key)
+        try:
+            record = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False, None, 0.0
+        if record["expires_at"] <= now:
+            path.unlink(missing_ok=True)
+            return False, None, 0.0
+        return True, record["value"], record["expires_at"]
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"expires_at": expires_at, "value": value}, f)
+        os.replace(tmp, self._path(key))
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class TTLCache:
+    """
+    ROLE IN SWARM:
+        Shared memory for expensive, repeatable skill calls.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        disk_dir: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.disk = DiskTier(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get_or_compute(self, key: str, compute: Callable[[], V]) -> V:
+        """
+        WHY: To answer from cache when possible and otherwise compute exactly once.
+        WHEN: On every cached call.
+        WHO CALLS: Cached skill wrappers.
+
+        If another thread is already computing `key`, this call waits for and
+        returns that result (or re-raises its exception) instead of computing again.
+        A value whose key was invalidated while it was being computed is returned
+        but not cached.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return value
+                del self._entries[key]
+                self._stats.expirations += 1
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        generation = flight.generation
+        try:
+            found, value, expires_at = self.disk.get(key, now) if self.disk else (False, None, 0.0)
+            if found:
+                with self._lock:
+                    self._stats.disk_hits += 1
+            else:
+                with self._lock:
+                    self._stats.misses += 1
+                value = compute()
+                expires_at = self.clock() + self.ttl
+                if self.disk:
+                    self.disk.set(key, value, expires_at)
+            if not self._store(key, value, expires_at, flight, generation) and self.disk:
+                # invalidate() may have run before our disk write landed.
+                self.disk.delete(key)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        WHY: To check many keys before computing the missing ones together.
+        WHEN: In batch code paths that cannot use get_or_compute per key.
+        WHO CALLS: Batch skill entry points (e.g. skills.content_generator).
+
+        Returns (found, value), checking memory then disk. No single-flight:
+        pair with `put` once the value has been computed.
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return True, value
+                del self._entries[key]
+                self._stats.expirations += 1
+
+        found, value, expires_at = self.disk.get(key, now) if self.disk else (False, None, 0.0)
+        with self._lock:
+            if found:
+                self._stats.disk_hits += 1
+            else:
+                self._stats.misses += 1
+        if found:
+            self._store(key, value, expires_at)
+        return found, value
+
+    def put(self, key: str, value: Any) -> None:
+        expires_at = self.clock() + self.ttl
+        if self.disk:
+            self.disk.set(key, value, expires_at)
+        self._store(key, value, expires_at)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            flight = self._inflight.get(key)
+            if flight is not None:
+                flight.generation += 1
+        if self.disk:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for flight in self._inflight.values():
+                flight.generation += 1
+        if self.disk:
+            self.disk.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._entries)})
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        expires_at: float,
+        flight: Optional[_Flight] = None,
+        generation: int = 0,
+    ) -> bool:
+        """Stores the entry unless `flight` was invalidated since `generation`."""
+        with self._lock:
+            if flight is not None and flight.generation != generation:
+                return False
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            return True
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Stable cache key for JSON-like values (dict key order does not matter).
+    """
+    return json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
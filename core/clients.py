@@ -0,0 +1,573 @@
+"""
+WHAT THIS FILE DOES:
+    Provides a process-wide manager for outbound network clients: keep-alive HTTP
+    connection pools (sync and async httpx) and Redis connection pools, one per upstream.
+
+WHY IT EXISTS:
+    Opening a connection per call means a TCP (and usually TLS) handshake per call,
+    which is a large part of skill latency. Sharing one bounded pool per upstream keeps
+    connections warm, caps how hard we hit each upstream, and gives one place to see
+    pool pressure (wait time, active/idle counts) and to close everything on shutdown.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Used by skills (trend_fetcher, publisher, content_generator) for HTTP upstreams
+      and by apps.worker.queue for Redis.
+    - apps.worker.main calls `default_clients.shutdown()` when the worker stops;
+      `register_shutdown_hook` lets other components close their own resources then.
+    - `stats()` feeds health endpoints and metrics.
+
+POOL LIMITS:
+    Each pool gates requests with its own semaphore of `max_connections`, so time spent
+    waiting for a free connection is measured here rather than hidden inside httpx.
+    Idle keep-alive connections are dropped after `keepalive_expiry`, and a whole pool
+    that has not been used for `idle_timeout` is closed by `evict_idle()`.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from pydantic import BaseModel, Field
+
+
+class PoolLimits(BaseModel):
+    """
+    Size and lifetime limits applied to every pool the manager creates.
+    """
+    max_connections: int = Field(
+        default=20, ge=1, description="Concurrent connections per upstream."
+    )
+    max_keepalive: int = Field(
+        default=10, ge=0, description="Idle connections kept open per upstream."
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, gt=0, description="Seconds an idle connection is kept."
+    )
+    acquire_timeout: float = Field(
+        default=10.0, gt=0, description="Max seconds to wait for a connection."
+    )
+    idle_timeout: float = Field(
+        default=300.0, gt=0, description="Seconds before an unused pool is closed."
+    )
+    request_timeout: float = Field(default=10.0, gt=0, description="Default httpx timeout.")
+
+
+class PoolStats(BaseModel):
+    """
+    Snapshot of one pool, as reported by ClientManager.stats().
+    """
+    name: str = Field(..., description="'<kind>:<upstream>'")
+    kind: str = Field(..., description="'http', 'http-async' or 'redis'")
+    max_connections: int
+    active: int = Field(default=0, description="Connections currently checked out.")
+    idle: int = Field(default=0, description="Open connections waiting to be reused.")
+    acquired: int = 0
+    waited: int = Field(
+        default=0, description="Acquisitions that had to wait for a free connection."
+    )
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection frees up within `acquire_timeout`."""
+
+
+class _Meter:
+    """Thread-safe acquisition counters shared by every pool type."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.acquired = 0
+        self.waited = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.last_used = time.monotonic()
+
+    def acquired_after(self, wait_s: float) -> None:
+        wait_ms = wait_s * 1000
+        with self._lock:
+            self.active += 1
+            self.acquired += 1
+            self.last_used = time.monotonic()
+            # Anything under 0.1ms is the uncontended fast path, not a wait.
+            if wait_ms >= 0.1:
+                self.waited += 1
+                self.wait_ms_total += wait_ms
+                self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def released(self) -> None:
+        with self._lock:
+            self.active -= 1
+            self.last_used = time.monotonic()
+
+    def snapshot(self, **fields: Any) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                active=self.active,
+                acquired=self.acquired,
+                waited=self.waited,
+                wait_ms_total=round(self.wait_ms_total, 3),
+                wait_ms_max=round(self.wait_ms_max, 3),
+                **fields,
+            )
+
+
+def _idle_http_connections(transport: Any) -> int:
+    pool = getattr(transport, "_pool", None)
+    connections = getattr(pool, "connections", [])
+    return sum(1 for conn in connections if conn.is_idle())
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release:
+                release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release:
+                release()
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """
+    Sync transport that holds a pool slot from request start until the response
+    body is closed, and records how long each request waited for its slot.
+    """
+
+    def __init__(self, limits: PoolLimits, meter: _Meter):
+        self._inner = httpx.HTTPTransport(limits=_httpx_limits(limits))
+        self._slots = threading.BoundedSemaphore(limits.max_connections)
+        self._timeout = limits.acquire_timeout
+        self.meter = meter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self._timeout):
+            raise PoolTimeout(f"No connection to {request.url.host} within {self._timeout}s")
+        self.meter.acquired_after(time.perf_counter() - start)
+
+        def release() -> None:
+            self.meter.released()
+            self._slots.release()
+
+        try:
+            response = self._inner.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            response.status_code, headers=response.headers,
+            stream=_ReleasingStream(response.stream, release), extensions=response.extensions,
+        )
+
+    def idle(self) -> int:
+        return _idle_http_connections(self._inner)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _MeteredAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of _MeteredTransport. Bound to the event loop it was created on.
+    """
+
+    def __init__(self, limits: PoolLimits, meter: _Meter):
+        self._inner = httpx.AsyncHTTPTransport(limits=_httpx_limits(limits))
+        self._slots = asyncio.BoundedSemaphore(limits.max_connections)
+        self._timeout = limits.acquire_timeout
+        self.meter = meter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout(
+                f"No connection to {request.url.host} within {self._timeout}s"
+            ) from None
+        self.meter.acquired_after(time.perf_counter() - start)
+
+        def release() -> None:
+            self.meter.released()
+            self._slots.release()
+
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            response.status_code, headers=response.headers,
+            stream=_AsyncReleasingStream(response.stream, release), extensions=response.extensions,
+        )
+
+    def idle(self) -> int:
+        return _idle_http_connections(self._inner)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _httpx_limits(limits: PoolLimits) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive,
+        keepalive_expiry=limits.keepalive_expiry,
+    )
+
+
+def upstream_key(url: str) -> str:
+    """
+    Pool key for a URL: its scheme, host and port (paths share a pool).
+    """
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.hostname:
+        raise ValueError(f"Not an absolute URL: {url!r}")
+    port = parts.port or {"http": 80, "https": 443}.get(parts.scheme)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class ClientManager:
+    """
+    ROLE IN SWARM:
+        The "Switchboard" for outbound connections: every skill and service asks it
+        for a client instead of opening its own.
+    """
+
+    def __init__(self, limits: Optional[PoolLimits] = None):
+        self.limits = limits or PoolLimits()
+        self._lock = threading.Lock()
+        self._http: Dict[str, Tuple[httpx.Client, _MeteredTransport]] = {}
+        # Async clients are per (upstream, event loop): connections cannot cross loops.
+        # They are closed when their loop shuts down (see _close_with_loop).
+        self._http_async: Dict[
+            Tuple[str, asyncio.AbstractEventLoop],
+            Tuple[httpx.AsyncClient, _MeteredAsyncTransport, asyncio.AbstractEventLoop],
+        ] = {}
+        self._loop_watchers: Dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = {}
+        self._redis: Dict[str, Any] = {}
+        self._hooks: List[Callable[[], None]] = []
+        self._closed = False
+
+    def http(self, url: str) -> httpx.Client:
+        """
+        WHY: To reuse warm connections for synchronous HTTP calls.
+        WHEN: From sync skills and thread-pool code.
+        WHO CALLS: Skills.
+
+        Returns the shared client for `url`'s upstream. Pass full URLs to its methods.
+        """
+        key = upstream_key(url)
+        with self._lock:
+            self._check_open()
+            entry = self._http.get(key)
+            if entry is None or entry[0].is_closed:
+                transport = _MeteredTransport(self.limits, _Meter())
+                client = httpx.Client(transport=transport, timeout=self.limits.request_timeout)
+                entry = self._http[key] = (client, transport)
+            return entry[0]
+
+    def http_async(self, url: str) -> httpx.AsyncClient:
+        """
+        WHY: To reuse warm connections for asyncio HTTP calls.
+        WHEN: From async skills (e.g. skills.trend_fetcher.stream_trends).
+        WHO CALLS: Skills, async services.
+
+        Must be called from inside a running event loop. The loop's clients are closed
+        when it shuts down its async generators (asyncio.run does); clients of loops
+        closed without that are dropped the next time a client is created.
+        """
+        loop = asyncio.get_running_loop()
+        key = (upstream_key(url), loop)
+        with self._lock:
+            self._check_open()
+            entry = self._http_async.get(key)
+            if entry is None or entry[0].is_closed:
+                dead_watchers = self._forget_closed_loops()
+                transport = _MeteredAsyncTransport(self.limits, _Meter())
+                client = httpx.AsyncClient(transport=transport, timeout=self.limits.request_timeout)
+                entry = self._http_async[key] = (client, transport, loop)
+                if loop not in self._loop_watchers:
+                    watcher = self._loop_watchers[loop] = self._close_with_loop(loop)
+                    # Started here, so the loop tracks it and closes it on shutdown.
+                    asyncio.ensure_future(watcher.asend(None))
+            else:
+                dead_watchers = []
+        for watcher in dead_watchers:
+            _finish(watcher)
+        return entry[0]
+
+    async def _close_with_loop(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> AsyncGenerator[None, None]:
+        # Suspended until the loop's shutdown_asyncgens() closes it, while the loop can
+        # still run the clients' aclose().
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._loop_watchers.pop(loop, None)
+                mine = [k for k in self._http_async if k[1] is loop]
+                closing = [self._http_async.pop(k)[0] for k in mine]
+            if closing:
+                await asyncio.gather(*(c.aclose() for c in closing), return_exceptions=True)
+
+    def _forget_closed_loops(self) -> List[AsyncGenerator[None, None]]:
+        # Caller holds the lock. A closed loop cannot run aclose(); dropping the
+        # clients lets their sockets be collected. Returns the loops' watchers, for
+        # the caller to finish once the lock is released.
+        for key in [k for k in self._http_async if k[1].is_closed()]:
+            del self._http_async[key]
+        dead = [loop for loop in self._loop_watchers if loop.is_closed()]
+        return [self._loop_watchers.pop(loop) for loop in dead]
+
+    def redis(self, url: str, **kwargs: Any):
+        """
+        WHY: To share one bounded Redis connection pool per server.
+        WHEN: When a component needs Redis (task queue, caches).
+        WHO CALLS: apps.worker.queue.RedisQueueBackend.from_url
+
+        Extra keyword arguments (e.g. decode_responses) are passed to the connections;
+        each distinct combination gets its own pool.
+        """
+        import redis
+
+        key = f"{url}|{sorted(kwargs.items())}"
+        with self._lock:
+            self._check_open()
+            client = self._redis.get(key)
+            if client is None:
+                pool = _metered_redis_pool(redis).from_url(
+                    url,
+                    max_connections=self.limits.max_connections,
+                    timeout=self.limits.acquire_timeout,
+                    **kwargs,
+                )
+                client = self._redis[key] = redis.Redis(connection_pool=pool)
+            return client
+
+    def register_shutdown_hook(self, hook: Callable[[], None]) -> None:
+        """Run `hook` (after the pools are closed) when the manager shuts down."""
+        with self._lock:
+            self._hooks.append(hook)
+
+    def stats(self) -> List[PoolStats]:
+        """
+        WHY: To see whether callers are queuing for connections.
+        WHEN: On demand (health endpoints, metrics scrapes).
+        WHO CALLS: Operators / tests.
+        """
+        with self._lock:
+            http = list(self._http.items())
+            http_async = list(self._http_async.items())
+            redis_clients = list(self._redis.items())
+
+        limit = self.limits.max_connections
+        report = [
+            transport.meter.snapshot(name=f"http:{key}", kind="http",
+                                     max_connections=limit, idle=transport.idle())
+            for key, (_, transport) in http
+        ]
+        report += [
+            transport.meter.snapshot(name=f"http-async:{key}", kind="http-async",
+                                     max_connections=limit, idle=transport.idle())
+            for (key, _), (_, transport, _) in http_async
+        ]
+        for key, client in redis_clients:
+            pool = client.connection_pool
+            report.append(pool.meter.snapshot(
+                name=f"redis:{key.split('|')[0]}", kind="redis",
+                max_connections=limit, idle=pool.idle_count(),
+            ))
+        return sorted(report, key=lambda s: s.name)
+
+    def evict_idle(self) -> int:
+        """
+        WHY: To close pools for upstreams we stopped talking to.
+        WHEN: Periodically (e.g. between worker batches).
+        WHO CALLS: apps.worker.main
+
+        Closes every pool unused for `limits.idle_timeout` with nothing checked out.
+        Returns the number of pools closed.
+        """
+        cutoff = time.monotonic() - self.limits.idle_timeout
+        with self._lock:
+            stale_http = [k for k, (_, t) in self._http.items()
+                          if t.meter.active == 0 and t.meter.last_used < cutoff]
+            stale_async = [k for k, (_, t, _) in self._http_async.items()
+                           if t.meter.active == 0 and t.meter.last_used < cutoff]
+            stale_redis = [k for k, c in self._redis.items()
+                           if c.connection_pool.meter.active == 0
+                           and c.connection_pool.meter.last_used < cutoff]
+            closing_http = [self._http.pop(k)[0] for k in stale_http]
+            closing_async = [self._http_async.pop(k) for k in stale_async]
+            closing_redis = [self._redis.pop(k) for k in stale_redis]
+
+        for client in closing_http:
+            client.close()
+        for client, _, loop in closing_async:
+            _close_async_client(client, loop)
+        for client in closing_redis:
+            client.connection_pool.disconnect()
+        return len(closing_http) + len(closing_async) + len(closing_redis)
+
+    def shutdown(self) -> None:
+        """
+        WHY: To close every pooled connection cleanly.
+        WHEN: On worker/service stop (also registered with atexit for the default manager).
+        WHO CALLS: apps.worker.main, tests.
+
+        Async clients whose event loop is still running get their close scheduled on
+        that loop; clients of loops that already ended only have sockets to drop.
+        Safe to call more than once. The manager refuses new clients afterwards.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            http, self._http = list(self._http.values()), {}
+            http_async, self._http_async = list(self._http_async.values()), {}
+            redis_clients, self._redis = list(self._redis.values()), {}
+            hooks, self._hooks = self._hooks, []
+
+        for client, _ in http:
+            client.close()
+        for client, _, loop in http_async:
+            _close_async_client(client, loop)
+        for client in redis_clients:
+            client.connection_pool.disconnect()
+        for hook in hooks:
+            hook()
+
+    async def ashutdown(self) -> None:
+        """Async form of `shutdown` that awaits the close of this loop's async clients."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            own = [client for client, _, owner in self._http_async.values() if owner is loop]
+        await asyncio.gather(*(client.aclose() for client in own))
+        self.shutdown()
+
+    def reset(self) -> None:
+        """Shut down and accept new clients again (tests, worker restarts)."""
+        self.shutdown()
+        with self._lock:
+            self._closed = False
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("ClientManager has been shut down")
+
+
+# Close tasks scheduled on a running loop, kept so they are not garbage collected
+# before they finish.
+_closing: set = set()
+
+
+def _close_async_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    if loop.is_closed():
+        return
+    if loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _schedule_close(client, loop)
+        else:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running in this thread: the client's own loop can run the close.
+        loop.run_until_complete(client.aclose())
+    else:
+        # Called from async code (e.g. evict_idle in an async worker) about a client
+        # whose loop is stopped: blocking on another loop here would raise.
+        _schedule_close(client, running)
+
+
+def _finish(watcher: AsyncGenerator[None, None]) -> None:
+    """
+    Runs a loop watcher's cleanup here and now. Left to the garbage collector it
+    would be finalized through its (closed) loop, which fails.
+    """
+    closing = watcher.aclose()
+    try:
+        closing.send(None)
+    except StopIteration:
+        pass
+
+
+def _schedule_close(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    task = loop.create_task(client.aclose())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+_redis_pool_class: Optional[type] = None
+
+def _metered_redis_pool(redis_module: Any) -> type:
+    """
+    BlockingConnectionPool subclass that records how long get_connection waited
+    (including connecting, when the pool had to open a new connection). Built on
+    first use so redis stays an import-time-optional dependency here.
+    """
+    global _redis_pool_class
+    if _redis_pool_class is None:
+        class MeteredBlockingConnectionPool(redis_module.BlockingConnectionPool):
+            def __init__(self, *args: Any, **kwargs: Any):
+                super().__init__(*args, **kwargs)
+                self.meter = _Meter()
+
+            def get_connection(self, *args: Any, **kwargs: Any):
+                start = time.perf_counter()
+                connection = super().get_connection(*args, **kwargs)
+                self.meter.acquired_after(time.perf_counter() - start)
+                return connection
+
+            def release(self, connection: Any) -> None:
+                super().release(connection)
+                self.meter.released()
+
+            def idle_count(self) -> int:
+                return sum(1 for conn in self.pool.queue if conn is not None)
+
+        _redis_pool_class = MeteredBlockingConnectionPool
+    return _redis_pool_class
+
+
+default_clients = ClientManager()
+atexit.register(default_clients.shutdown)
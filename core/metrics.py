@@ -0,0 +1,317 @@
+"""
+WHAT THIS FILE DOES:
+    Provides in-process metrics: counters, histograms and timing spans, rendered in the
+    Prometheus text exposition format and optionally served over HTTP.
+
+WHY IT EXISTS:
+    `Result.execution_time_ms` only says how long a skill ran. To see where a Goal's
+    latency goes (planning, waiting in a queue, executing, judging), each stage is
+    timed with a monotonic high-resolution clock and aggregated by task type and
+    verdict, cheaply enough to leave on under load.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Planner, Worker, queue, scheduler and Judge record into `default_metrics`.
+    - Each service process exposes its own registry (METRICS_PORT -> GET /metrics);
+      Prometheus scrapes and sums them, which is how numbers cross processes.
+      Worker PROCESS-mode children report their timings back with each outcome, so
+      the parent records them.
+    - CHIMERA_METRICS=0 turns recording off; spans then become a shared no-op.
+"""
+
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+METRICS_ENABLED = os.getenv("CHIMERA_METRICS", "1").lower() not in ("0", "false", "no", "off")
+
+# Seconds. Covers sub-millisecond cache hits up to minute-long upstream calls.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self, registry: "MetricsRegistry", name: str, help: str, labelnames: Sequence[str]
+    ):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple([str(labels.get(name, "")) for name in self.labelnames])
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """A monotonically increasing count per label set. Name it `..._total`."""
+    kind = "counter"
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}{labels} {_format_number(value)}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Observations bucketed by upper bound, with their count and sum, per label set."""
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(*args)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][slot] += 1
+            series[1] += value
+
+    def observe_many(self, value: float, count: int, **labels: str) -> None:
+        """Records `count` observations of the same value (e.g. a batch's per-item share)."""
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][slot] += count
+            series[1] += value * count
+
+    def totals(self) -> Dict[Tuple[str, ...], Tuple[int, float]]:
+        """(count, sum) per label set, e.g. for a quick summary without Prometheus."""
+        with self._lock:
+            return {key: (sum(counts), total) for key, (counts, total) in self._series.items()}
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            series = sorted(
+                (key, list(counts), total) for key, (counts, total) in self._series.items()
+            )
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_number(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Span:
+    """
+    Times a block with time.perf_counter_ns and records it into a histogram (in
+    seconds) on exit. Labels may be added inside the block, once they are known.
+    """
+    __slots__ = ("histogram", "labels", "start_ns", "seconds")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+        self.start_ns = 0
+        self.seconds = 0.0
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.seconds = (time.perf_counter_ns() - self.start_ns) / 1e9
+        self.histogram.observe(self.seconds, **self.labels)
+
+
+class _NoopSpan:
+    """What `span` returns when metrics are off: no clock reads, no allocation."""
+    __slots__ = ()
+    labels: Dict[str, str] = {}
+    seconds = 0.0
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class MetricsRegistry:
+    """
+    ROLE IN SWARM:
+        The "Flight Recorder": every stage reports here, and `render` is what the
+        /metrics endpoint serves.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def span(self, histogram: Histogram, **labels: str):
+        """
+        WHY: To time a block without touching the clock when metrics are off.
+        WHEN: Around each stage of a Task's life.
+        WHO CALLS: Planner, Judge, and anything else with a block to time.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(histogram, labels)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clears recorded values (metric definitions stay). For tests."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def _get_or_create(
+        self, cls, name: str, help: str, labelnames: Sequence[str], **kwargs
+    ) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(self, name, help, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(
+                    f"Metric {name} is already registered with a different type or labels"
+                )
+        return metric
+
+
+def start_metrics_server(port: int, registry: Optional["MetricsRegistry"] = None,
+                         host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    WHY: So Prometheus can scrape a service that has no web framework of its own.
+    WHEN: At service start-up (see serve_metrics_from_env).
+    WHO CALLS: Service entrypoints (apps.*.main).
+
+    Serves GET /metrics from a daemon thread. Port 0 picks a free port; read it back
+    from `server.server_address`. Call `server.shutdown()` to stop.
+    """
+    registry = registry or default_metrics
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="chimera-metrics", daemon=True).start()
+    return server
+
+
+def serve_metrics_from_env() -> Optional[ThreadingHTTPServer]:
+    """Starts the /metrics server if METRICS_PORT is set (and metrics are enabled)."""
+    port = os.getenv("METRICS_PORT")
+    if not port or not default_metrics.enabled:
+        return None
+    return start_metrics_server(int(port))
+
+
+# Shared by every component in the process.
+default_metrics = MetricsRegistry(enabled=METRICS_ENABLED)
+
+stage_seconds = default_metrics.histogram(
+    "chimera_stage_duration_seconds",
+    "Time spent in each stage of a Task's life (plan, queue_wait, execute, judge).",
+    ("stage", "task_type"),
+)
+tasks_total = default_metrics.counter(
+    "chimera_tasks_total", "Tasks executed by the Worker, by outcome.", ("task_type", "status"),
+)
+verdicts_total = default_metrics.counter(
+    "chimera_judge_verdicts_total", "Results judged, by verdict.", ("task_type", "verdict"),
+)
@@ -0,0 +1,104 @@
+"""
+WHAT THIS FILE DOES:
+    Provides a thread-safe token-bucket rate limiter, and a registry that keeps one
+    bucket per key (e.g. per channel type).
+
+WHY IT EXISTS:
+    External platforms enforce request quotas. Once we call them concurrently, we
+    need to pace our own requests instead of finding out through 429 responses.
+    A token bucket allows short bursts up to `capacity` while holding the long-run
+    rate to `rate` requests per second.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - Used by skills.publisher before every delivery attempt to a channel.
+    - Any skill calling a quota-limited upstream can keep its own RateLimiter.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    ROLE IN SWARM:
+        The "Turnstile" in front of one rate-limited upstream.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes `tokens` if available. Returns 0.0 on success, otherwise the number of
+        seconds until enough tokens will have accumulated (nothing is taken).
+        """
+        with self._lock:
+            self._refill(self.clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> float:
+        """
+        WHY: To pace callers to the bucket's rate.
+        WHEN: Before each request to the rate-limited upstream.
+        WHO CALLS: Skills (e.g. skills.publisher).
+
+        Blocks until `tokens` are available. Returns the seconds spent waiting.
+        Raises TimeoutError if that would take longer than `timeout`.
+        """
+        start = self.clock()
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay == 0.0:
+                return self.clock() - start
+            if timeout is not None and self.clock() - start + delay > timeout:
+                raise TimeoutError(f"Rate limit: no token within {timeout}s")
+            self.sleep(delay)
+
+
+class RateLimiter:
+    """
+    One TokenBucket per key, created on first use from per-key limits or a default.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        default: Tuple[float, float] = (5.0, 5.0),
+    ):
+        self.limits = dict(limits or {})
+        self.default = default
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, capacity = self.limits.get(key, self.default)
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            return bucket
+
+    def acquire(self, key: str, timeout: Optional[float] = None) -> float:
+        return self.bucket(key).acquire(timeout=timeout)
@@ -0,0 +1,245 @@
+"""
+WHAT THIS FILE DOES:
+    Defines compact, slotted record types mirroring core.task_models.Task and Result,
+    plus a positional wire format for moving them between our own services.
+
+WHY IT EXISTS:
+    The pydantic models validate every field and eagerly create a uuid4 and a datetime
+    on construction. That is the right trade-off where data enters the system, but on
+    internal hops (queue -> worker -> judge) the data was already validated upstream,
+    and at millions of tasks per hour the construction cost shows up in profiles.
+    Records skip validation, generate their ID only when it is first read, and store
+    the creation time as an integer of microseconds until a datetime is asked for.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - External entry points keep using the pydantic models (full validation).
+    - apps.worker.queue uses the wire format to ship Tasks and Results; the worker
+      service claims TaskRecords and publishes ResultRecords, so the hop from queue
+      to queue builds no model at all (claim_records / execute_batch_records /
+      collect_result_records).
+    - `to_model()` converts back without re-validating (trusted construction). It
+      must produce the id and datetime the model holds, so its gain over validation
+      is smaller; benchmarks/bench_records.py checks both.
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from core.task_models import Task, Result, TaskStatus
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+# model class -> set of all its field names, shared by every trusted instance. Pydantic
+# only ever adds to an instance's fields set (on assignment), and these already hold
+# every field, so sharing is safe and saves a set allocation per object.
+_ALL_FIELDS: Dict[type, set] = {}
+
+
+# BaseModel's private slots, written by trusted_construct. Pydantic v2 internals:
+# pyproject pins pydantic below 3, and tests/core/test_records.py fails if they change.
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def trusted_construct(model_cls, values: Dict[str, Any]):
+    """
+    Build a pydantic model instance from already-validated values.
+
+    Does what `model_construct` does, minus its per-field default resolution (which
+    inspects default factories on every call and is slower than validating).
+    `values` must contain every field of the model.
+    """
+    fields_set = _ALL_FIELDS.get(model_cls)
+    if fields_set is None:
+        fields_set = _ALL_FIELDS[model_cls] = set(model_cls.model_fields)
+    obj = model_cls.__new__(model_cls)
+    object.__setattr__(obj, "__dict__", values)
+    # BaseModel's slot descriptors, called directly: about twice as fast as
+    # object.__setattr__, which looks them up by name each time.
+    _set_fields_set(obj, fields_set)
+    _set_extra(obj, None)
+    _set_private(obj, None)
+    return obj
+
+
+def _uuid4() -> str:
+    # Same format and randomness source (os.urandom) as str(uuid.uuid4()), at about
+    # half the cost: no UUID object in between.
+    value = int.from_bytes(os.urandom(16), "big") & _UUID_CLEAR | _UUID_V4
+    h = "%032x" % value
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_UUID_CLEAR = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_UUID_V4 = (0x4000 << 64) | (0x8000 << 48)  # version 4, RFC 4122 variant
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def _to_us(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_us(value: int) -> datetime:
+    # Naive UTC, matching datetime.utcnow() used by the pydantic models.
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class TaskRecord:
+    """
+    ROLE IN SWARM:
+        Lightweight stand-in for Task on internal hops.
+    """
+    __slots__ = (
+        "_id", "goal_id", "type", "description", "input_data", "status", "created_us", "depends_on"
+    )
+
+    def __init__(
+        self,
+        goal_id: str,
+        type: str,
+        description: str,
+        input_data: Optional[Dict[str, Any]] = None,
+        status: TaskStatus = TaskStatus.PENDING,
+        id: Optional[str] = None,
+        created_us: Optional[int] = None,
+        depends_on: Optional[List[str]] = None,
+    ):
+        self._id = id
+        self.goal_id = goal_id
+        self.type = type
+        self.description = description
+        self.input_data = input_data if input_data is not None else {}
+        self.status = status
+        self.created_us = created_us if created_us is not None else _now_us()
+        self.depends_on = depends_on if depends_on is not None else []
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = _uuid4()
+        return self._id
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_us(self.created_us)
+
+    def mark_in_progress(self) -> None:
+        self.status = TaskStatus.IN_PROGRESS
+
+    @classmethod
+    def from_model(cls, task: Task) -> "TaskRecord":
+        return cls(
+            task.goal_id, task.type, task.description, task.input_data,
+            task.status, task.id, _to_us(task.created_at), task.depends_on,
+        )
+
+    def to_model(self) -> Task:
+        """Trusted conversion: the record's fields were validated when it was created."""
+        return trusted_construct(Task, {
+            "id": self.id,
+            "goal_id": self.goal_id,
+            "type": self.type,
+            "description": self.description,
+            "input_data": self.input_data,
+            "depends_on": self.depends_on,
+            "status": self.status if type(self.status) is TaskStatus else TaskStatus(self.status),
+            "created_at": self.created_at,
+        })
+
+    def to_wire(self) -> List[Any]:
+        return [self.id, self.goal_id, self.type, self.description,
+                self.input_data, TaskStatus(self.status).value, self.created_us, self.depends_on]
+
+    @classmethod
+    def from_wire(cls, data: Sequence[Any]) -> "TaskRecord":
+        id, goal_id, type, description, input_data, status, created_us = data[:7]
+        # Payloads queued before depends_on existed have 7 fields.
+        depends_on = data[7] if len(data) > 7 else []
+        return cls(
+            goal_id, type, description, input_data, TaskStatus(status), id, created_us, depends_on
+        )
+
+
+class ResultRecord:
+    """
+    ROLE IN SWARM:
+        Lightweight stand-in for Result on internal hops.
+        Supports the same mark_valid/mark_invalid calls the Judge makes on Result.
+    """
+    __slots__ = ("_id", "task_id", "output_data", "execution_time_ms", "created_us",
+                 "is_valid", "validation_notes")
+
+    def __init__(
+        self,
+        task_id: str,
+        output_data: Dict[str, Any],
+        execution_time_ms: float,
+        id: Optional[str] = None,
+        created_us: Optional[int] = None,
+        is_valid: Optional[bool] = None,
+        validation_notes: Optional[str] = None,
+    ):
+        self._id = id
+        self.task_id = task_id
+        self.output_data = output_data
+        self.execution_time_ms = execution_time_ms
+        self.created_us = created_us if created_us is not None else _now_us()
+        self.is_valid = is_valid
+        self.validation_notes = validation_notes
+
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = _uuid4()
+        return self._id
+
+    @property
+    def created_at(self) -> datetime:
+        return _from_us(self.created_us)
+
+    def mark_valid(self, notes: str = "") -> None:
+        self.is_valid = True
+        self.validation_notes = notes
+
+    def mark_invalid(self, reason: str) -> None:
+        self.is_valid = False
+        self.validation_notes = reason
+
+    @classmethod
+    def from_model(cls, result: Result) -> "ResultRecord":
+        return cls(
+            result.task_id, result.output_data, result.execution_time_ms, result.id,
+            _to_us(result.created_at), result.is_valid, result.validation_notes,
+        )
+
+    def to_model(self) -> Result:
+        """Trusted conversion: the record's fields were validated when it was created."""
+        return trusted_construct(Result, {
+            "id": self.id,
+            "task_id": self.task_id,
+            "output_data": self.output_data,
+            "execution_time_ms": self.execution_time_ms,
+            "created_at": self.created_at,
+            "is_valid": self.is_valid,
+            "validation_notes": self.validation_notes,
+        })
+
+    def to_wire(self) -> List[Any]:
+        return [self.id, self.task_id, self.output_data, self.execution_time_ms,
+                self.created_us, self.is_valid, self.validation_notes]
+
+    @classmethod
+    def from_wire(cls, data: Sequence[Any]) -> "ResultRecord":
+        return cls(data[1], data[2], data[3], data[0], data[4], data[5], data[6])
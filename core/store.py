@@ -0,0 +1,426 @@
+"""
+WHAT THIS FILE DOES:
+    Persists Goals, Tasks and Results to SQLite (WAL mode): writes are queued and
+    committed in batches by a background thread; reads come back as the
+    core.task_models types, streamed in chunks for large scans.
+
+WHY IT EXISTS:
+    Goals, Tasks and Results otherwise live only in memory, so a restart loses them
+    and nothing can be queried afterwards. One transaction per row would cap the
+    swarm at a few hundred Results per second (each commit waits for the disk);
+    grouping rows into one transaction per batch, with WAL so readers never block
+    the writer, keeps persistence off the critical path at thousands per second.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - SwarmPipeline saves each Goal and its planned Tasks, then each judged Task and
+      Result, into `default_store` (CHIMERA_DB_PATH) or the store it is given.
+    - Rows are upserted by id, so a Task saved as pending is updated once judged.
+    - Anyone can read: get_* by id, iter_* to stream by goal/task/status/time.
+
+NOTE:
+    Saved rows become visible to readers once their batch is committed; call
+    `flush()` to wait for that. A batch that fails to commit is logged and counted
+    (chimera_store_failed_rows_total), never raised into the saver; `flush()`
+    reports it. `default_store` is closed at interpreter exit, so queued rows are
+    committed before the process ends.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from core.metrics import default_metrics
+from core.records import trusted_construct, _to_us, _from_us
+from core.task_models import Goal, Task, Result, TaskStatus
+
+DB_PATH = os.getenv("CHIMERA_DB_PATH", "")
+BATCH_SIZE = int(os.getenv("CHIMERA_DB_BATCH_SIZE", "1000"))
+FLUSH_INTERVAL = float(os.getenv("CHIMERA_DB_FLUSH_INTERVAL", "0.05"))  # seconds
+MAX_PENDING = int(os.getenv("CHIMERA_DB_MAX_PENDING", "100000"))  # rows queued before save_* blocks
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    goal_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    input_data TEXT NOT NULL,
+    depends_on TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    task_id TEXT NOT NULL,
+    output_data TEXT NOT NULL,
+    execution_time_ms REAL NOT NULL,
+    created_at INTEGER NOT NULL,
+    is_valid INTEGER,
+    validation_notes TEXT
+);
+CREATE INDEX IF NOT EXISTS goals_created_at ON goals (created_at);
+CREATE INDEX IF NOT EXISTS tasks_goal_id ON tasks (goal_id);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, created_at);
+CREATE INDEX IF NOT EXISTS tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS results_task_id ON results (task_id);
+CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at);
+"""
+
+_UPSERT = {
+    "goals": "INSERT OR REPLACE INTO goals VALUES (?, ?, ?, ?)",
+    "tasks": "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "results": "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+}
+
+flush_seconds = default_metrics.histogram(
+    "chimera_store_flush_seconds", "Time to commit one batch of rows to the SwarmStore.",
+)
+rows_total = default_metrics.counter(
+    "chimera_store_rows_total", "Rows committed to the SwarmStore, by table.", ("table",),
+)
+failed_rows_total = default_metrics.counter(
+    "chimera_store_failed_rows_total", "Rows the SwarmStore failed to save, by table.", ("table",),
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class SwarmStore:
+    """
+    ROLE IN SWARM:
+        The "Archive": every Goal, Task and Result the swarm has seen, queryable
+        after the fact and across restarts.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = MAX_PENDING,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: List[Tuple[str, tuple]] = []
+        self._queued = 0     # rows ever queued
+        self._committed = 0  # rows ever committed (or dropped by a failed batch)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._flushers = 0  # threads waiting in flush()
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+        writer = self._connect()
+        writer.executescript(SCHEMA)
+        writer.commit()
+        self._writer = threading.Thread(
+            target=self._write_loop, args=(writer,), name="chimera-store", daemon=True
+        )
+        self._writer.start()
+
+    # --- writing ---------------------------------------------------------
+
+    def save_goals(self, goals: Iterable[Goal]) -> None:
+        """
+        WHY: To persist Goals (and later updates to them).
+        WHEN: As Goals are accepted.
+        WHO CALLS: SwarmPipeline
+
+        Queues the rows and returns; they are committed with the next batch.
+        Blocks only when `max_pending` rows are already waiting.
+        """
+        self._enqueue([
+            ("goals", (g.id, g.description, _to_us(g.created_at), _dumps(g.metadata)))
+            for g in goals
+        ])
+
+    def save_tasks(self, tasks: Iterable[Task]) -> None:
+        """Queues Tasks (upserted by id, so status changes overwrite). See save_goals."""
+        self._enqueue([
+            ("tasks", (t.id, t.goal_id, t.type, t.description, _dumps(t.input_data),
+                       _dumps(t.depends_on), TaskStatus(t.status).value, _to_us(t.created_at)))
+            for t in tasks
+        ])
+
+    def save_results(self, results: Iterable[Result]) -> None:
+        """Queues Results (upserted by id). See save_goals."""
+        self._enqueue([
+            ("results", (r.id, r.task_id, _dumps(r.output_data), r.execution_time_ms,
+                         _to_us(r.created_at), None if r.is_valid is None else int(r.is_valid),
+                         r.validation_notes))
+            for r in results
+        ])
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        WHY: To make everything saved so far visible to readers (and durable).
+        WHEN: Before reading back your own writes, and at shutdown.
+        WHO CALLS: close, tests, batch jobs
+
+        Raises the error of a failed batch, if any, and TimeoutError on timeout.
+        """
+        with self._cond:
+            target = self._queued
+            self._flushers += 1
+            self._cond.notify_all()
+            try:
+                done = self._cond.wait_for(
+                    lambda: self._committed >= target or self._writer_dead(), timeout
+                )
+            finally:
+                self._flushers -= 1
+            if not done:
+                raise TimeoutError(f"SwarmStore flush did not finish within {timeout}s")
+            self._raise_error()
+
+    def close(self) -> None:
+        """
+        Commits what is queued and stops the writer thread. Failed batches were
+        already logged; they are not raised here. Safe to call more than once.
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+
+    def _enqueue(self, rows: List[Tuple[str, tuple]]) -> None:
+        if not rows:
+            return
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SwarmStore is closed")
+            # Backpressure: let the writer catch up instead of growing without bound.
+            self._cond.wait_for(
+                lambda: len(self._pending) < self.max_pending or self._writer_dead()
+            )
+            self._pending.extend(rows)
+            self._queued += len(rows)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _write_loop(self, connection: sqlite3.Connection) -> None:
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._pending or self._closed)
+                    # Give a partial batch up to flush_interval to fill, unless
+                    # someone is waiting on flush() or close().
+                    self._cond.wait_for(
+                        lambda: (
+                            len(self._pending) >= self.batch_size
+                            or self._closed
+                            or self._flushers
+                        ),
+                        self.flush_interval,
+                    )
+                    if not self._pending:
+                        return  # closed
+                    batch, self._pending = self._pending, []
+                    self._cond.notify_all()  # room for blocked savers
+                if batch:
+                    self._commit(connection, batch)
+        finally:
+            connection.close()
+
+    def _commit(self, connection: sqlite3.Connection, batch: List[Tuple[str, tuple]]) -> None:
+        by_table: Dict[str, List[tuple]] = {}
+        for table, row in batch:
+            by_table.setdefault(table, []).append(row)
+        error = None
+        with default_metrics.span(flush_seconds):
+            try:
+                with connection:  # one transaction for the whole batch
+                    for table, rows in by_table.items():
+                        connection.executemany(_UPSERT[table], rows)
+            except sqlite3.Error as e:
+                error = e
+        for table, rows in by_table.items():
+            (rows_total if error is None else failed_rows_total).inc(len(rows), table=table)
+        if error is not None:
+            logger.error("SwarmStore dropped a batch of %d rows: %s", len(batch), error)
+        with self._cond:
+            self._committed += len(batch)
+            if error is not None and self._error is None:
+                self._error = error
+            self._cond.notify_all()
+
+    def _writer_dead(self) -> bool:
+        return not self._writer.is_alive()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"SwarmStore batch failed: {error}") from error
+
+    # --- reading ---------------------------------------------------------
+
+    def get_goal(self, goal_id: str) -> Optional[Goal]:
+        row = self._reader().execute("SELECT * FROM goals WHERE id = ?", (goal_id,)).fetchone()
+        return _goal(row) if row else None
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        row = self._reader().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return _task(row) if row else None
+
+    def get_result(self, result_id: str) -> Optional[Result]:
+        row = self._reader().execute("SELECT * FROM results WHERE id = ?", (result_id,)).fetchone()
+        return _result(row) if row else None
+
+    def iter_goals(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                   chunk_size: int = 1000) -> Iterator[Goal]:
+        """Goals created in [since, until], oldest first, fetched `chunk_size` rows at a time."""
+        where, params = _time_filter("created_at", since, until)
+        sql = f"SELECT * FROM goals{_where(where)} ORDER BY created_at, id"
+        return (_goal(row) for row in self._stream(sql, params, chunk_size))
+
+    def iter_tasks(
+        self,
+        goal_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Task]:
+        """
+        WHY: To scan Tasks after the fact without loading them all.
+        WHEN: Reports, retries of failed Tasks, debugging a Goal.
+        WHO CALLS: Anyone holding a SwarmStore.
+
+        Filters combine (AND); each is served by an index. Oldest first.
+        """
+        where, params = _time_filter("created_at", since, until)
+        if goal_id is not None:
+            where.append("goal_id = ?")
+            params.append(goal_id)
+        if status is not None:
+            where.append("status = ?")
+            params.append(TaskStatus(status).value)
+        sql = f"SELECT * FROM tasks{_where(where)} ORDER BY created_at, id"
+        return (_task(row) for row in self._stream(sql, params, chunk_size))
+
+    def iter_results(
+        self,
+        task_id: Optional[str] = None,
+        goal_id: Optional[str] = None,
+        is_valid: Optional[bool] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Result]:
+        """Results, filtered like iter_tasks (`goal_id` via their Tasks). Oldest first."""
+        where, params = _time_filter("r.created_at", since, until)
+        if task_id is not None:
+            where.append("r.task_id = ?")
+            params.append(task_id)
+        if goal_id is not None:
+            where.append("r.task_id IN (SELECT id FROM tasks WHERE goal_id = ?)")
+            params.append(goal_id)
+        if is_valid is not None:
+            where.append("r.is_valid = ?")
+            params.append(int(is_valid))
+        sql = f"SELECT r.* FROM results r{_where(where)} ORDER BY r.created_at, r.id"
+        return (_result(row) for row in self._stream(sql, params, chunk_size))
+
+    def count_tasks(self, status: Optional[TaskStatus] = None) -> int:
+        if status is None:
+            return self._reader().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        return self._reader().execute(
+            "SELECT COUNT(*) FROM tasks WHERE status = ?", (TaskStatus(status).value,)
+        ).fetchone()[0]
+
+    def _stream(self, sql: str, params: Sequence[Any], chunk_size: int) -> Iterator[tuple]:
+        # Own cursor per scan; under WAL it reads one snapshot and never blocks the writer.
+        cursor = self._reader().execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints: a power cut can lose the last
+        # batches but never corrupts the database.
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA busy_timeout=30000")
+        return connection
+
+
+def _time_filter(
+    column: str, since: Optional[datetime], until: Optional[datetime]
+) -> Tuple[List[str], List[Any]]:
+    where: List[str] = []
+    params: List[Any] = []
+    if since is not None:
+        where.append(f"{column} >= ?")
+        params.append(_to_us(since))
+    if until is not None:
+        where.append(f"{column} <= ?")
+        params.append(_to_us(until))
+    return where, params
+
+
+def _where(clauses: List[str]) -> str:
+    return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+
+# Rows were validated when their models were built: convert back without re-validating.
+def _goal(row: tuple) -> Goal:
+    return trusted_construct(Goal, {
+        "id": row[0], "description": row[1], "created_at": _from_us(row[2]),
+        "metadata": json.loads(row[3]),
+    })
+
+
+def _task(row: tuple) -> Task:
+    return trusted_construct(Task, {
+        "id": row[0], "goal_id": row[1], "type": row[2], "description": row[3],
+        "input_data": json.loads(row[4]), "depends_on": json.loads(row[5]),
+        "status": TaskStatus(row[6]), "created_at": _from_us(row[7]),
+    })
+
+
+def _result(row: tuple) -> Result:
+    return trusted_construct(Result, {
+        "id": row[0], "task_id": row[1], "output_data": json.loads(row[2]),
+        "execution_time_ms": row[3], "created_at": _from_us(row[4]),
+        "is_valid": None if row[5] is None else bool(row[5]), "validation_notes": row[6],
+    })
+
+
+# Shared by every component in the process; None unless CHIMERA_DB_PATH is set.
+default_store = SwarmStore(DB_PATH) if DB_PATH else None
+if default_store is not None:
+    atexit.register(default_store.close)
@@ -50,6 +50,13 @@ class Task(BaseModel):
     type: str = Field(..., description="The type of task (e.g., 'fetch_trends', 'generate_content').")
     description: str = Field(..., description="Detailed instructions for the worker.")
     input_data: Dict[str, Any] = Field(default_factory=dict, description="Parameters required for execution.")
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description=(
+            "IDs of Tasks (same Goal) that must complete first; "
+            "their output_data feeds input_data."
+        ),
+    )
     status: TaskStatus = Field(default=TaskStatus.PENDING)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
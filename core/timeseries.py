@@ -0,0 +1,382 @@
+"""
+WHAT THIS FILE DOES:
+    Stores engagement_score samples per trend over time, as append-only column files
+    partitioned by UTC day, and computes windowed aggregates (moving average, rate of
+    change) over them through memory maps.
+
+WHY IT EXISTS:
+    A fetch only says how engaged a topic is right now. Whether it is rising or
+    fading needs history, and months of samples do not fit comfortably in RAM. Each
+    day is three flat arrays on disk (timestamp, trend id, score) that are appended
+    to without rewriting and read as np.memmap views, so a window query touches only
+    the days it covers and only holds one day's working set in memory at a time.
+
+HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
+    - skills.trend_fetcher records every fetched trend here (TREND_HISTORY_DIR) and
+      annotates trends with their `history` over the request's `timeframe`.
+    - skills.trend_analyzer ranks trends by that momentum.
+    - Safe for several writer processes (Worker PROCESS mode): appends and new trend
+      ids are taken under a file lock.
+
+LAYOUT:
+    <directory>/keys.jsonl               trend key of each id, one JSON string per line
+    <directory>/<YYYY-MM-DD>/ts.i8       int64 epoch microseconds
+    <directory>/<YYYY-MM-DD>/key.u4      uint32 trend id
+    <directory>/<YYYY-MM-DD>/score.f4    float32 engagement_score
+"""
+
+import contextlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+KEYS_NAME = "keys.jsonl"
+# column file -> dtype; a row is complete once all three have it
+COLUMNS = (("ts.i8", np.int64), ("key.u4", np.uint32), ("score.f4", np.float32))
+DAY_US = 86_400_000_000
+HOUR_US = 3_600_000_000
+
+_TIMEFRAME = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([mhdw])\s*$")
+_UNIT_US = {"m": 60_000_000, "h": HOUR_US, "d": DAY_US, "w": 7 * DAY_US}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_us(value: Any) -> int:
+    """Epoch microseconds for a datetime (naive = UTC), epoch seconds or ISO 8601 string."""
+    if isinstance(value, (int, float)):
+        return int(value * 1_000_000)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def parse_timeframe(timeframe: Optional[str], now_us: Optional[int] = None) -> Tuple[int, int]:
+    """
+    (since, until) in epoch microseconds for a `fetch_trends` timeframe: a trailing
+    window ("90m", "24h", "7d", "2w") or an ISO 8601 range "start/end".
+    Raises ValueError for anything else.
+    """
+    now_us = time.time_ns() // 1000 if now_us is None else now_us
+    match = _TIMEFRAME.match(timeframe or "")
+    if match:
+        return now_us - int(float(match.group(1)) * _UNIT_US[match.group(2)]), now_us
+    if timeframe and "/" in timeframe:
+        start, end = timeframe.split("/", 1)
+        try:
+            return to_us(start.strip()), to_us(end.strip())
+        except ValueError:
+            pass
+    raise ValueError(
+        f"Unsupported timeframe {timeframe!r}; use e.g. '24h', '7d' or 'start/end' (ISO 8601)"
+    )
+
+
+def trend_key(title: Any) -> str:
+    """History key of a trend: its title, case- and whitespace-insensitive."""
+    return " ".join(str(title or "").lower().split())
+
+
+class EngagementHistory:
+    """
+    ROLE IN SWARM:
+        The "Almanac": what every trend's engagement was, day by day, kept on disk
+        and read back one day at a time.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.keys_path = os.path.join(directory, KEYS_NAME)
+        self.lock_path = os.path.join(directory, ".lock")
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._keys_offset = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    # --- writing ---------------------------------------------------------
+
+    def append(
+        self, keys: Sequence[str], scores: Sequence[float], timestamps_us: Sequence[int]
+    ) -> int:
+        """
+        WHY: To record engagement samples.
+        WHEN: After every upstream fetch (one call per batch of trends).
+        WHO CALLS: record_trends, skills.trend_fetcher
+
+        Rows may arrive in any time order; each goes to the partition of its UTC day.
+        Returns the number of rows written.
+        """
+        if not len(keys):
+            return 0
+        ts = np.asarray(timestamps_us, dtype=np.int64)
+        score = np.asarray(scores, dtype=np.float32)
+        days = ts // DAY_US
+        with self._locked():
+            lookup = {key: self._id_for(key) for key in set(keys)}
+            ids = np.fromiter((lookup[key] for key in keys), dtype=np.uint32, count=len(keys))
+            for day in np.unique(days):
+                rows = days == day
+                self._write_partition(int(day), ts[rows], ids[rows], score[rows])
+        return len(keys)
+
+    def record_trends(self, trends: Iterable[Dict[str, Any]], at_us: Optional[int] = None) -> int:
+        """
+        Appends each trend's engagement_score, stamped with its `timestamp` or `at_us`
+        (default now).
+        """
+        now_us = time.time_ns() // 1000 if at_us is None else at_us
+        keys, scores, stamps = [], [], []
+        for trend in trends:
+            keys.append(trend_key(trend.get("title")))
+            scores.append(float(trend.get("engagement_score") or 0.0))
+            stamp = trend.get("timestamp")
+            stamps.append(now_us if stamp is None else to_us(stamp))
+        return self.append(keys, scores, stamps)
+
+    # --- reading ---------------------------------------------------------
+
+    def partitions(self) -> List[str]:
+        """Day partitions on disk, oldest first (YYYY-MM-DD)."""
+        return sorted(name for name in os.listdir(self.directory) if _is_day(name))
+
+    def window(
+        self, since_us: int, until_us: int, keys: Optional[Sequence[str]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        WHY: To summarize each trend's engagement over a time window.
+        WHEN: Per fetch (the request's timeframe) or for offline analysis.
+        WHO CALLS: skills.trend_fetcher, skills.trend_analyzer
+
+        Returns {key: stats} for keys with samples in [since_us, until_us]:
+        `samples`, `mean`, `min`, `max`, `first`, `last`, `change` (last - first),
+        `rate_per_hour` (least-squares slope of score over time; 0 with fewer than
+        two distinct times). Restrict to `keys` to skip everything else early.
+        """
+        self._refresh_keys()
+        n_keys = len(self._keys)
+        wanted = None
+        if keys is not None:
+            wanted = np.array([self._ids[k] for k in keys if k in self._ids], dtype=np.uint32)
+            if wanted.size == 0:
+                return {}
+
+        # Per key: count, sum(s), sum(t), sum(t^2), sum(t*s), with t in hours since `since_us`.
+        sums = np.zeros((5, n_keys))
+        lo = np.full(n_keys, np.inf)
+        hi = np.full(n_keys, -np.inf)
+        first_ts = np.full(n_keys, np.iinfo(np.int64).max)
+        last_ts = np.full(n_keys, np.iinfo(np.int64).min)
+        first = np.zeros(n_keys)
+        last = np.zeros(n_keys)
+
+        for ts, ids, score in self._scan(since_us, until_us, wanted):
+            t = (ts - since_us) / HOUR_US
+            s = score.astype(np.float64)
+            for row, weights in enumerate((None, s, t, t * t, t * s)):
+                sums[row] += np.bincount(ids, weights=weights, minlength=n_keys)
+            np.minimum.at(lo, ids, s)
+            np.maximum.at(hi, ids, s)
+            _update_edge(ids, ts, s, first_ts, first, np.minimum, np.less)
+            _update_edge(ids, ts, s, last_ts, last, np.maximum, np.greater)
+
+        count, sum_s, sum_t, sum_tt, sum_ts = sums
+        denominator = count * sum_tt - sum_t ** 2
+        slope = np.divide(count * sum_ts - sum_t * sum_s, denominator,
+                          out=np.zeros(n_keys), where=denominator > 1e-12)
+        return {
+            self._keys[i]: {
+                "samples": int(count[i]),
+                "mean": float(sum_s[i] / count[i]),
+                "min": float(lo[i]),
+                "max": float(hi[i]),
+                "first": float(first[i]),
+                "last": float(last[i]),
+                "change": float(last[i] - first[i]),
+                "rate_per_hour": float(slope[i]),
+            }
+            for i in np.flatnonzero(count)
+        }
+
+    def series(self, key: str, since_us: int, until_us: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps_us, scores) of one trend in the window, in time order."""
+        self._refresh_keys()
+        if key not in self._ids:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        wanted = np.array([self._ids[key]], dtype=np.uint32)
+        parts = [
+            (ts.copy(), score.copy()) for ts, _, score in self._scan(since_us, until_us, wanted)
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        ts = np.concatenate([p[0] for p in parts])
+        score = np.concatenate([p[1] for p in parts])
+        order = np.argsort(ts, kind="stable")
+        return ts[order], score[order]
+
+    def moving_average(
+        self, key: str, since_us: int, until_us: int, window_us: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Trailing moving average of one trend: at each sample time t, the mean of the
+        samples in (t - window_us, t]. Returns (timestamps_us, averages).
+        """
+        ts, score = self.series(key, since_us, until_us)
+        if ts.size == 0:
+            return ts, score.astype(np.float64)
+        cumulative = np.concatenate(([0.0], np.cumsum(score, dtype=np.float64)))
+        end = np.arange(1, ts.size + 1)
+        start = np.searchsorted(ts, ts - window_us, side="right")
+        return ts, (cumulative[end] - cumulative[start]) / (end - start)
+
+    # --- internals -------------------------------------------------------
+
+    def _scan(self, since_us: int, until_us: int,
+              wanted: Optional[np.ndarray]) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yields (ts, ids, score) per day partition, restricted to the window and `wanted` ids."""
+        first_day, last_day = _day_name(since_us // DAY_US), _day_name(until_us // DAY_US)
+        for name in self.partitions():
+            if not first_day <= name <= last_day:
+                continue
+            columns = self._open_partition(name)
+            if columns is None:
+                continue
+            ts, ids, score = columns
+            mask = None
+            day_start = _day_index(name) * DAY_US
+            if day_start < since_us or day_start + DAY_US - 1 > until_us:
+                mask = (ts >= since_us) & (ts <= until_us)
+            if wanted is not None:
+                in_keys = np.isin(ids, wanted)
+                mask = in_keys if mask is None else mask & in_keys
+            if mask is not None:
+                ts, ids, score = ts[mask], ids[mask], score[mask]
+            if ts.size:
+                yield ts, ids, score
+
+    def _open_partition(self, name: str) -> Optional[Tuple[np.ndarray, ...]]:
+        paths = [os.path.join(self.directory, name, column) for column, _ in COLUMNS]
+        try:
+            # A writer may be mid-append: only rows present in every column count.
+            rows = min(
+                os.path.getsize(path) // np.dtype(dtype).itemsize
+                for path, (_, dtype) in zip(paths, COLUMNS)
+            )
+        except FileNotFoundError:
+            return None
+        if rows == 0:
+            return None
+        return tuple(
+            np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+            for path, (_, dtype) in zip(paths, COLUMNS)
+        )
+
+    def _write_partition(
+        self, day: int, ts: np.ndarray, ids: np.ndarray, score: np.ndarray
+    ) -> None:
+        directory = os.path.join(self.directory, _day_name(day))
+        os.makedirs(directory, exist_ok=True)
+        paths = [os.path.join(directory, column) for column, _ in COLUMNS]
+        # Drop a torn tail (a writer died between columns) so the columns stay aligned.
+        rows = min(
+            _size(path) // np.dtype(dtype).itemsize for path, (_, dtype) in zip(paths, COLUMNS)
+        )
+        for path, (_, dtype), values in zip(paths, COLUMNS, (ts, ids, score)):
+            expected = rows * np.dtype(dtype).itemsize
+            if _size(path) != expected:
+                with open(path, "r+b") as f:
+                    f.truncate(expected)
+            _append_bytes(path, values.astype(dtype, copy=False).tobytes())
+
+    def _id_for(self, key: str) -> int:
+        # Called under the file lock: other processes may have added keys meanwhile.
+        if key not in self._ids:
+            self._refresh_keys()
+        if key not in self._ids:
+            line = json.dumps(key, ensure_ascii=False) + "\n"
+            _append_bytes(self.keys_path, line.encode("utf-8"))
+            self._refresh_keys()
+        return self._ids[key]
+
+    def _refresh_keys(self) -> None:
+        with self._lock:
+            try:
+                with open(self.keys_path, "rb") as f:
+                    f.seek(self._keys_offset)
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # being written
+                        self._keys_offset += len(line)
+                        key = json.loads(line)
+                        self._ids[key] = len(self._keys)
+                        self._keys.append(key)
+            except FileNotFoundError:
+                pass
+
+    @contextlib.contextmanager
+    def _locked(self):
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+def _update_edge(ids, ts, s, edge_ts, edge_values, reduce, better) -> None:
+    """Keeps, per id, the score at the earliest (or latest) timestamp seen so far."""
+    candidate_ts = edge_ts.copy()
+    reduce.at(candidate_ts, ids, ts)
+    improved = better(candidate_ts, edge_ts)
+    rows = np.flatnonzero(improved[ids] & (ts == candidate_ts[ids]))
+    edge_values[ids[rows]] = s[rows]
+    edge_ts[improved] = candidate_ts[improved]
+
+
+def _append_bytes(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _day_name(day: int) -> str:
+    return (_EPOCH + timedelta(days=day)).strftime("%Y-%m-%d")
+
+
+def _day_index(name: str) -> int:
+    return (datetime.strptime(name, "%Y-%m-%d").replace(tzinfo=timezone.utc) - _EPOCH).days
+
+
+def _is_day(name: str) -> bool:
+    return len(name) == 10 and name[4] == "-" and name[7] == "-" and name.replace("-", "").isdigit()
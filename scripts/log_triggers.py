@@ -1,30 +1,310 @@
+#!/usr/bin/env python3
+"""
+Local shim for trigger logging.
+
+Triggers go to an append-only JSON Lines log in .tenx_triggers/:
+
+    triggers.jsonl                      active segment, one entry per line
+    triggers-000001.jsonl[.gz]          rotated (sealed) segments
+    index.json                          time range and entry count of each sealed segment
+
+A write is one O_APPEND write of one line, so it costs the same however large the
+log is and concurrent writers cannot drop each other's entries. The active segment
+is sealed when it reaches TRIGGER_LOG_MAX_BYTES or, with TRIGGER_LOG_ROTATE set to
+hourly or daily, when the period changes; TRIGGER_LOG_COMPRESS=1 gzips sealed
+segments. Time-range queries (--query --since/--until) only open the segments whose
+range overlaps. A legacy logs.json is moved into the log on the first write. Everything in
+.tenx_triggers/ is local runtime data and git-ignored.
+"""
+
 import argparse
+import contextlib
+import datetime
+import glob
+import gzip
 import json
 import os
-import datetime
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOG_DIR = os.getenv("TRIGGER_LOG_DIR", ".tenx_triggers")
+MAX_BYTES = int(os.getenv("TRIGGER_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+ROTATE_EVERY = os.getenv("TRIGGER_LOG_ROTATE", "")  # "", "hourly" or "daily"
+COMPRESS = os.getenv("TRIGGER_LOG_COMPRESS", "").lower() not in ("", "0", "false", "no")
+
+ACTIVE_NAME = "triggers.jsonl"
+INDEX_NAME = "index.json"
+LEGACY_NAME = "logs.json"
+PERIODS = {"hourly": "%Y-%m-%dT%H", "daily": "%Y-%m-%d"}
+
+
+def parse_time(value):
+    """ISO 8601 string -> naive local datetime (how entries are stamped). None if invalid."""
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
 
-LOG_DIR = ".tenx_triggers"
-LOG_FILE = os.path.join(LOG_DIR, "logs.json")
 
-def ensure_log_dir():
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR)
+class TriggerLog:
+    """
+    Append-only, rotating trigger log in one directory. Safe to use from several
+    processes at once: appends share a lock, rotation takes it exclusively.
+    """
 
-def load_logs():
-    ensure_log_dir()
-    if os.path.exists(LOG_FILE):
+    def __init__(self, directory=LOG_DIR, max_bytes=MAX_BYTES, rotate_every=ROTATE_EVERY,
+                 compress=COMPRESS):
+        if rotate_every and rotate_every not in PERIODS:
+            raise ValueError(
+                f"rotate_every must be one of {', '.join(PERIODS)}, not {rotate_every!r}"
+            )
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rotate_every = rotate_every
+        self.compress = compress
+        self.active_path = os.path.join(directory, ACTIVE_NAME)
+        self.index_path = os.path.join(directory, INDEX_NAME)
+        self.legacy_path = os.path.join(directory, LEGACY_NAME)
+        self.lock_path = os.path.join(directory, ".lock")
+
+    def append(self, entry):
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        stamp = parse_time(entry.get("timestamp")) or datetime.datetime.now()
+        if os.path.exists(self.legacy_path):
+            self._migrate_legacy()
+
+        with self._locked(exclusive=False):
+            if not self._rotation_due(stamp):
+                self._write(line)
+                return
+        with self._locked(exclusive=True):
+            if self._rotation_due(stamp):
+                self._seal(self.active_path)
+            self._write(line)
+
+    def read(self, since=None, until=None, type=None):
+        """
+        Yields entries (oldest segment first) with since <= timestamp <= until.
+        Bounds are datetimes or ISO strings; entries without a valid timestamp are
+        only returned when no bounds are given.
+        """
+        since = parse_time(since) if isinstance(since, str) else since
+        until = parse_time(until) if isinstance(until, str) else until
+        # Snapshot under the lock: sealed segments never change afterwards, and the
+        # open handle keeps reading the active segment even if it is sealed meanwhile.
+        with self._locked(exclusive=False):
+            segments = self._load_index()["segments"]
+            try:
+                active = open(self.active_path, "rb")
+            except FileNotFoundError:
+                active = None
+
+        sources = []
+        for segment in segments:
+            first, last = parse_time(segment.get("first")), parse_time(segment.get("last"))
+            if first is not None and ((since and last < since) or (until and first > until)):
+                continue
+            sources.append(os.path.join(self.directory, segment["file"]))
+        if active is not None:
+            sources.append(active)
+
+        for source in sources:
+            for entry in self._entries(source):
+                if type is not None and entry.get("type") != type:
+                    continue
+                if since or until:
+                    stamp = parse_time(entry.get("timestamp"))
+                    if stamp is None or (since and stamp < since) or (until and stamp > until):
+                        continue
+                yield entry
+
+    def rotate(self):
+        """Seals the active segment now (e.g. from a scheduled job)."""
+        with self._locked(exclusive=True):
+            self._seal(self.active_path)
+
+    def rebuild_index(self):
+        """Recreates index.json from the segment files, e.g. after it was lost."""
+        with self._locked(exclusive=True):
+            return self._rebuild_index()
+
+    @contextlib.contextmanager
+    def _locked(self, exclusive):
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
         try:
-            with open(LOG_FILE, "r") as f:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                yield
+            else:
+                # msvcrt only has exclusive locks; it also keeps renames safe on Windows.
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def _write(self, line):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        fd = os.open(self.active_path, flags, 0o644)
+        try:
+            while line:
+                line = line[os.write(fd, line):]
+        finally:
+            os.close(fd)
+
+    def _rotation_due(self, stamp):
+        try:
+            size = os.path.getsize(self.active_path)
+        except FileNotFoundError:
+            return False
+        if size >= self.max_bytes:
+            return True
+        if self.rotate_every and size:
+            with open(self.active_path, "rb") as f:
+                try:
+                    first = parse_time(json.loads(f.readline()).get("timestamp"))
+                except (ValueError, AttributeError):
+                    first = None
+            period = PERIODS[self.rotate_every]
+            return first is not None and first.strftime(period) != stamp.strftime(period)
+        return False
+
+    def _seal(self, path):
+        """Turns `path` into the next numbered segment and records it in the index."""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        count, first, last = 0, None, None
+        for entry in self._entries(path):
+            count += 1
+            stamp = parse_time(entry.get("timestamp"))
+            if stamp is not None:
+                first = stamp if first is None or stamp < first else first
+                last = stamp if last is None or stamp > last else last
+
+        index = self._load_index()
+        name = self._next_segment_name()
+        target = os.path.join(self.directory, name)
+        os.replace(path, target)
+        if self.compress:
+            with open(target, "rb") as src, gzip.open(target + ".gz.tmp", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(target + ".gz.tmp", target + ".gz")
+            os.remove(target)
+            name, target = name + ".gz", target + ".gz"
+
+        index["segments"].append({
+            "file": name,
+            "first": first.isoformat() if first else None,
+            "last": last.isoformat() if last else None,
+            "count": count,
+            "bytes": os.path.getsize(target),
+        })
+        self._save_index(index)
+
+    def _next_segment_name(self):
+        # Numbered from the files on disk, not the index, which may be stale or lost;
+        # a name already taken (compressed or not) is never reused.
+        number = 0
+        for path in glob.glob(os.path.join(self.directory, "triggers-*.jsonl*")):
+            digits = os.path.basename(path)[len("triggers-"):].split(".", 1)[0]
+            if digits.isdigit():
+                number = max(number, int(digits))
+        while True:
+            number += 1
+            name = f"triggers-{number:06d}.jsonl"
+            if not glob.glob(os.path.join(self.directory, name + "*")):
+                return name
+
+    def _migrate_legacy(self):
+        with self._locked(exclusive=True):
+            if not os.path.exists(self.legacy_path):
+                return
+            try:
+                with open(self.legacy_path, "r") as f:
+                    entries = json.load(f)
+            except json.JSONDecodeError:
+                entries = []
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entry in entries if isinstance(entries, list) else []:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._seal(tmp)
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            os.replace(self.legacy_path, self.legacy_path + ".migrated")
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r") as f:
                 return json.load(f)
-        except json.JSONDecodeError:
-            return []
-    return []
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._rebuild_index()
+
+    def _save_index(self, index):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+    def _rebuild_index(self):
+        segments = []
+        for path in sorted(glob.glob(os.path.join(self.directory, "triggers-*.jsonl*"))):
+            if path.endswith(".tmp"):
+                continue
+            stamps = [parse_time(e.get("timestamp")) for e in self._entries(path)]
+            valid = [s for s in stamps if s is not None]
+            segments.append({
+                "file": os.path.basename(path),
+                "first": min(valid).isoformat() if valid else None,
+                "last": max(valid).isoformat() if valid else None,
+                "count": len(stamps),
+                "bytes": os.path.getsize(path),
+            })
+        index = {"segments": segments}
+        self._save_index(index)
+        return index
+
+    @staticmethod
+    def _entries(source):
+        """Entries of a segment path or open binary file. Skips torn or blank lines."""
+        if isinstance(source, str):
+            opener = gzip.open if source.endswith(".gz") else open
+            f = opener(source, "rb")
+        else:
+            f = source
+        with f:
+            for raw in f:
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    yield entry
+
+
+default_log = TriggerLog()
+
+
+def load_logs(since=None, until=None, type=None):
+    return list(default_log.read(since, until, type))
+
 
 def save_log(entry):
-    logs = load_logs()
-    logs.append(entry)
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
+    default_log.append(entry)
+
 
 def handle_passage(message):
     entry = {
@@ -43,7 +323,7 @@ def handle_performance(message, details):
         "details": details
     }
     save_log(entry)
-    
+
     print("\n*****************************************")
     print("Analysis Feedback:")
     print(f"Performance Alert: {message}")
@@ -52,12 +332,27 @@ def handle_performance(message, details):
 
 def main():
     parser = argparse.ArgumentParser(description="Local shim for trigger logging.")
-    parser.add_argument("--type", choices=["passage", "performance"], required=True)
-    parser.add_argument("--message", required=True)
+    parser.add_argument("--type", choices=["passage", "performance"])
+    parser.add_argument("--message")
     parser.add_argument("--details", default="")
-    
+    parser.add_argument("--query", action="store_true",
+                        help="Print logged entries as JSON lines "
+                             "(filtered by --type/--since/--until).")
+    parser.add_argument("--since", help="ISO timestamp; with --query, skip older entries.")
+    parser.add_argument("--until", help="ISO timestamp; with --query, skip newer entries.")
+
     args = parser.parse_args()
-    
+
+    if args.query:
+        for bound in (args.since, args.until):
+            if bound is not None and parse_time(bound) is None:
+                parser.error(f"not an ISO timestamp: {bound}")
+        for entry in default_log.read(args.since, args.until, args.type):
+            print(json.dumps(entry, ensure_ascii=False))
+        return
+    if args.type is None or args.message is None:
+        parser.error("--type and --message are required unless --query is given")
+
     if args.type == "passage":
         handle_passage(args.message)
     elif args.type == "performance":
@@ -15,6 +15,7 @@ HOW IT CONNECTS TO CHIMERA ARCHITECTURE:
 
 import sys
 import os
+import asyncio
 
 # Ensure project root is in path
 sys.path.append(os.getcwd())
@@ -23,6 +24,7 @@ from core.task_models import Goal
 from apps.planner.service import PlannerService
 from apps.worker.executor import WorkerExecutor
 from apps.judge.validator import JudgeValidator
+from apps.orchestrator.pipeline import SwarmPipeline
 
 def verify_swarm():
     print("🧪 Starting Swarm Verification...\n")
@@ -36,24 +38,20 @@ def verify_swarm():
     goal = Goal(description="Fetch and analyze latest TikTok trends in the US regarding AI Agents.")
     print(f"1️⃣  GOAL CREATED: {goal.description}")
 
-    # 3. Plan
-    tasks = planner.create_plan(goal)
-    print(f"2️⃣  PLANNER: Created {len(tasks)} tasks.")
-    
-    for task in tasks:
-        print(f"\n   👉 Processing Task: {task.type}")
-        
-        # 4. Work
-        result = worker.execute_task(task)
-        print(f"      3️⃣  WORKER: Executed in {result.execution_time_ms:.2f}ms")
-        
-        # 5. Judge
-        is_valid = judge.validate_result(result)
-        status = "✅ APPROVED" if is_valid else "❌ REJECTED"
+    # 3. Plan, 4. Work & 5. Judge, concurrently through the orchestrator
+    pipeline = SwarmPipeline(planner=planner, worker=worker, judge=judge)
+    outcomes = asyncio.run(pipeline.run([goal]))
+    print(f"2️⃣  PLANNER: Created {len(outcomes)} tasks.")
+
+    for outcome in outcomes:
+        print(f"\n   👉 Processed Task: {outcome.task.type}")
+        print(f"      3️⃣  WORKER: Executed in {outcome.result.execution_time_ms:.2f}ms")
+
+        status = "✅ APPROVED" if outcome.is_valid else "❌ REJECTED"
         print(f"      4️⃣  JUDGE: {status}")
-        
-        if not is_valid:
-            print(f"         Reason: {result.validation_notes}")
+
+        if not outcome.is_valid:
+            print(f"         Reason: {outcome.result.validation_notes}")
 
     print("\n✨ Verification Complete!")
 
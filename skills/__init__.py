@@ -1 +1,22 @@
 # Skills package
+#
+# Each skill is a sub-package whose __init__ stays cheap to import: it declares the
+# task types it serves in TASK_TYPES (plus, optionally, batch entry points in
+# BATCH_TASK_TYPES) and defers loading its `skill` module until an
+# attribute of it is first accessed. apps.worker.registry.SkillRegistry relies on
+# this to discover every skill without paying for their imports up front.
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_skill_module(package: str) -> Callable[[str], Any]:
+    """
+    Build a module-level ``__getattr__`` that imports ``<package>.skill`` on first access.
+    """
+    def __getattr__(name: str) -> Any:
+        if name == "skill":
+            return importlib.import_module(f"{package}.skill")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
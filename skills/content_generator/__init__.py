@@ -1 +1,8 @@
-from . import skill
+from skills import lazy_skill_module
+
+# task type -> callable in .skill that handles it
+TASK_TYPES = {"generate_content": "skill_content_generator"}
+# task type -> callable in .skill that handles many inputs in one call
+BATCH_TASK_TYPES = {"generate_content": "generate_content_batch"}
+
+__getattr__ = lazy_skill_module(__name__)
@@ -1,24 +1,213 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Protocol, Tuple
 from datetime import datetime
+import hashlib
+import os
 import uuid
 
+from core.cache import TTLCache, make_key
+
+FORMATS = ("markdown", "html", "plain")
+
+
+class GenerationBackend(Protocol):
+    """
+    A text generator that can serve several requests in one call.
+
+    `generate` takes normalized requests ({'prompt', 'format', 'tone', 'max_tokens'})
+    and returns, in the same order, one dict per request with 'content', 'summary',
+    'prompt_tokens' and 'completion_tokens'.
+    """
+    name: str
+    max_batch_size: int
+
+    def generate(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]: ...
+
+
+class MockBackend:
+    """
+    Deterministic local backend for development and tests. Counts its calls.
+    """
+    name = "mock"
+
+    def __init__(self, max_batch_size: int = 16):
+        self.max_batch_size = max_batch_size
+        self.calls: List[int] = []  # batch size of each call
+
+    def generate(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.calls.append(len(requests))
+        return [
+            {
+                "content": (
+                    f"# Generated Content\n\nBased on prompt: {r['prompt']}\n\n"
+                    "This is a mock generation."
+                ),
+                "summary": f"Content generated for: {r['prompt'][:30]}...",
+                "prompt_tokens": len(r["prompt"]),
+                "completion_tokens": 50,
+            }
+            for r in requests
+        ]
+
+
+_backend: GenerationBackend = MockBackend()
+
+# Shared by every caller in the process. CONTENT_CACHE_DIR enables the on-disk tier.
+content_cache = TTLCache(
+    maxsize=int(os.getenv("CONTENT_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("CONTENT_CACHE_TTL", "86400")),
+    disk_dir=os.getenv("CONTENT_CACHE_DIR") or None,
+)
+
+
+def set_backend(backend: GenerationBackend) -> None:
+    """Swap the generation backend (e.g. a real LLM client, or a mock in tests)."""
+    global _backend
+    _backend = backend
+
+
+def get_backend() -> GenerationBackend:
+    return _backend
+
+
+def normalize_request(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate an input and reduce it to the fields that determine the generation.
+
+    The prompt is kept exactly as given (case and spacing can change the output);
+    `format` and `tone` are case-insensitive and casefolded.
+
+    Raises:
+        ValueError: If `prompt` is missing/empty or `format` is not supported.
+    """
+    prompt = input_data.get("prompt")
+    if not isinstance(prompt, str) or not prompt.strip():
+        raise ValueError("prompt is required")
+    fmt = (input_data.get("format") or "markdown").strip().casefold()
+    if fmt not in FORMATS:
+        raise ValueError(f"unsupported format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return {
+        "prompt": prompt,
+        "format": fmt,
+        "tone": (input_data.get("tone") or "").strip().casefold() or None,
+        "max_tokens": input_data.get("max_tokens"),
+    }
+
+
+def content_cache_key(request: Dict[str, Any], backend_name: str) -> str:
+    """
+    Cache key for a normalized request: the exact prompt plus the casefolded format
+    and tone. `max_tokens` and the backend are part of the key because they change
+    the output.
+    """
+    raw = make_key(
+        backend_name, request["prompt"], request["format"], request["tone"], request["max_tokens"]
+    )
+    return "content:" + hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _output(
+    generation: Dict[str, Any], input_data: Dict[str, Any], cache_hit: bool
+) -> Dict[str, Any]:
+    spent = {"prompt": generation["prompt_tokens"], "completion": generation["completion_tokens"]}
+    if cache_hit:
+        tokens_used = {"prompt": 0, "completion": 0, "saved": spent["prompt"] + spent["completion"]}
+    else:
+        tokens_used = {**spent, "saved": 0}
+    return {
+        # Every call gets its own artifact id, cache hit or not.
+        "id": f"cg-{uuid.uuid4()}",
+        "content": generation["content"],
+        "summary": generation["summary"],
+        "tokens_used": tokens_used,
+        "metadata": {**(input_data.get("metadata") or {}),
+                     "generation_model": generation["model"], "cache_hit": cache_hit},
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def _stamp(generation: Dict[str, Any], backend: GenerationBackend) -> Dict[str, Any]:
+    return {**generation, "model": backend.name}
+
+
 def skill_content_generator(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate content from a prompt.
-    
+
+    Served from `content_cache` when an equivalent request (same prompt, same format,
+    tone and max_tokens) was generated before; concurrent identical requests share one
+    backend call. Each call returns a fresh artifact `id`.
+
     Args:
         input_data (dict): Contains 'prompt', 'format', 'tone', etc.
-        
+
     Returns:
-        dict: Generated content with metadata.
+        dict: Generated content with metadata. `tokens_used` has the tokens spent by
+        this call ('prompt', 'completion') and the tokens a cache hit avoided ('saved').
     """
-    # Mock implementation
-    prompt = input_data.get("prompt", "")
-    return {
-        "id": f"cg-{uuid.uuid4()}",
-        "content": f"# Generated Content\n\nBased on prompt: {prompt}\n\nThis is a mock generation.",
-        "summary": f"Content generated for: {prompt[:30]}...",
-        "tokens_used": {"prompt": len(prompt), "completion": 50},
-        "metadata": input_data.get("metadata", {}),
-        "generated_at": datetime.utcnow().isoformat() + "Z"
-    }
+    request = normalize_request(input_data)
+    backend = _backend
+    computed = False
+
+    def generate() -> Dict[str, Any]:
+        nonlocal computed
+        computed = True
+        return _stamp(backend.generate([request])[0], backend)
+
+    generation = content_cache.get_or_compute(content_cache_key(request, backend.name), generate)
+    return _output(generation, input_data, cache_hit=not computed)
+
+
+def generate_content_batch(inputs: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Generate content for many prompts with as few backend calls as possible.
+
+    Cached requests are answered without the backend; the remaining ones are
+    deduplicated and sent in chunks of the backend's `max_batch_size`. A failing
+    chunk (or an invalid input) only affects its own requests.
+
+    Args:
+        inputs (list): One `skill_content_generator` input object per request.
+
+    Returns:
+        list: One output dict (or the raised Exception) per input, in input order.
+    """
+    backend = _backend
+    outputs: List[Any] = [None] * len(inputs)
+    # key -> (normalized request, indexes of the inputs waiting on it)
+    missing: Dict[str, Tuple[Dict[str, Any], List[int]]] = {}
+
+    for i, input_data in enumerate(inputs):
+        try:
+            request = normalize_request(input_data)
+        except ValueError as e:
+            outputs[i] = e
+            continue
+        key = content_cache_key(request, backend.name)
+        if key in missing:
+            missing[key][1].append(i)
+            continue
+        found, generation = content_cache.lookup(key)
+        if found:
+            outputs[i] = _output(generation, input_data, cache_hit=True)
+        else:
+            missing[key] = (request, [i])
+
+    pending = list(missing.items())
+    size = max(1, backend.max_batch_size)
+    for start in range(0, len(pending), size):
+        chunk = pending[start:start + size]
+        try:
+            generations = backend.generate([request for _, (request, _) in chunk])
+        except Exception as e:
+            for _, (_, indexes) in chunk:
+                for i in indexes:
+                    outputs[i] = e
+            continue
+        for (key, (_, indexes)), generation in zip(chunk, generations):
+            generation = _stamp(generation, backend)
+            content_cache.put(key, generation)
+            first, *duplicates = indexes
+            outputs[first] = _output(generation, inputs[first], cache_hit=False)
+            for i in duplicates:
+                outputs[i] = _output(generation, inputs[i], cache_hit=True)
+    return outputs
@@ -1 +1,6 @@
-from . import skill
+from skills import lazy_skill_module
+
+# task type -> callable in .skill that handles it
+TASK_TYPES = {"publish_content": "skill_publisher"}
+
+__getattr__ = lazy_skill_module(__name__)
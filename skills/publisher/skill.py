@@ -1,32 +1,169 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
+import json
+import os
+import threading
+import time
 import uuid
 
+import httpx
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from core.clients import default_clients
+from core.rate_limit import RateLimiter
+
+# channel type -> delivery URL, used when a channel's config has no `url`.
+# Channels with neither are mocked (no network call), as before.
+CHANNEL_ENDPOINTS: Dict[str, str] = json.loads(os.getenv("PUBLISH_CHANNEL_URLS", "{}"))
+
+# channel type -> [requests per second, burst], e.g. {"twitter": [1, 3]}
+channel_limits = RateLimiter(
+    limits={k: tuple(v) for k, v in json.loads(os.getenv("PUBLISH_RATE_LIMITS", "{}")).items()},
+    default=(5.0, 5.0),
+)
+
+MAX_ATTEMPTS = int(os.getenv("PUBLISH_MAX_ATTEMPTS", "4"))
+BACKOFF_MULTIPLIER = float(os.getenv("PUBLISH_BACKOFF_MULTIPLIER", "0.5"))
+BACKOFF_MAX = float(os.getenv("PUBLISH_BACKOFF_MAX", "8"))
+RATE_LIMIT_TIMEOUT = float(os.getenv("PUBLISH_RATE_LIMIT_TIMEOUT", "30"))
+
+MAX_PARALLEL = int(os.getenv("PUBLISH_MAX_PARALLEL", "32"))
+
+# Created on first publish and shut down with default_clients.
+_fanout_pool: Optional[ThreadPoolExecutor] = None
+_fanout_lock = threading.Lock()
+
+
+def _get_fanout_pool() -> ThreadPoolExecutor:
+    global _fanout_pool
+    with _fanout_lock:
+        if _fanout_pool is None:
+            _fanout_pool = ThreadPoolExecutor(
+                max_workers=MAX_PARALLEL, thread_name_prefix="chimera-publish"
+            )
+            default_clients.register_shutdown_hook(_shutdown_fanout_pool)
+        return _fanout_pool
+
+
+def _shutdown_fanout_pool() -> None:
+    global _fanout_pool
+    with _fanout_lock:
+        pool, _fanout_pool = _fanout_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+class ChannelError(Exception):
+    """Delivery to a channel failed. `transient` errors are worth retrying."""
+
+    def __init__(self, message: str, transient: bool):
+        super().__init__(message)
+        self.transient = transient
+
+
+def _is_transient(error: BaseException) -> bool:
+    return isinstance(error, httpx.TransportError) or getattr(error, "transient", False)
+
+
+def _deliver(
+    channel_type: str, url: str, payload: Dict[str, Any], idempotency_key: str
+) -> Optional[str]:
+    """
+    One delivery attempt. Returns the platform's post id.
+
+    Every attempt for the same content and channel carries the same Idempotency-Key,
+    so a retry after a timeout or 5xx (when the first POST may have landed) cannot
+    publish twice on endpoints that honour the header.
+    """
+    channel_limits.acquire(channel_type, timeout=RATE_LIMIT_TIMEOUT)
+    response = default_clients.http(url).post(
+        url, json=payload, headers={"Idempotency-Key": idempotency_key}
+    )
+    if response.status_code == 429 or response.status_code >= 500:
+        raise ChannelError(f"HTTP {response.status_code}", transient=True)
+    if response.status_code >= 400:
+        raise ChannelError(f"HTTP {response.status_code}: {response.text[:200]}", transient=False)
+    body = response.json() if response.content else {}
+    return body.get("post_id") or body.get("id")
+
+
+def _channel_key(key_prefix: str, channel_type: str, url: str, config: Dict[str, Any]) -> str:
+    """
+    Idempotency-Key for one channel of one publish: "<content_id>:<type>:<identity>".
+    The identity hashes the delivery URL and the channel config (account, handle, ...),
+    so two channels of the same type never share a key, while the same channel keeps
+    its key across retries and re-publishes regardless of its position in the list.
+    """
+    identity = json.dumps({"url": url, "config": config}, sort_keys=True, default=str)
+    digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    return f"{key_prefix}:{channel_type}:{digest}"
+
+
+def _publish_channel(
+    channel: Dict[str, Any], payload: Dict[str, Any], key_prefix: str
+) -> Dict[str, Any]:
+    """
+    Publishes to one channel, retrying transient failures with jittered exponential
+    backoff. Never raises: failures are reported in the result entry.
+    """
+    channel_type = channel.get("type", "unknown")
+    config = channel.get("config") or {}
+    url = config.get("url") or CHANNEL_ENDPOINTS.get(channel_type)
+    if url is None:
+        # Mock implementation
+        return {"channel": channel_type, "status": "success", "post_id": f"post-{uuid.uuid4()}",
+                "error": None, "attempts": 1}
+
+    retrying = Retrying(
+        retry=retry_if_exception(_is_transient),
+        wait=wait_random_exponential(multiplier=BACKOFF_MULTIPLIER, max=BACKOFF_MAX),
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        reraise=True,
+    )
+    try:
+        idempotency_key = _channel_key(key_prefix, channel_type, url, config)
+        post_id = retrying(
+            _deliver, channel_type, url, {**payload, "channel": channel_type}, idempotency_key
+        )
+        status, error = "success", None
+    except Exception as e:
+        post_id, status, error = None, "failed", str(e) or type(e).__name__
+    return {"channel": channel_type, "status": status, "post_id": post_id, "error": error,
+            "attempts": retrying.statistics.get("attempt_number", 1)}
+
+
 def skill_publisher(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Publish content to external channels.
-    
+
+    All channels are published to at once, so the call takes about as long as the
+    slowest channel. Each channel type is paced by its own token bucket
+    (`PUBLISH_RATE_LIMITS`), transient failures (network errors, 429, 5xx) are
+    retried with jittered backoff under one `Idempotency-Key` header
+    ("<content_id>:<channel type>:<channel identity>"), and a failing channel only
+    fails its own entry.
+
     Args:
         input_data (dict): Contains 'content_id', 'channels', etc.
-        
+
     Returns:
-        dict: Publication results.
-    """
-    # Mock implementation
-    results = []
-    channels = input_data.get("channels", [])
-    
-    for channel in channels:
-        channel_type = channel.get("type", "unknown")
-        results.append({
-            "channel": channel_type,
-            "status": "success",
-            "post_id": f"post-{uuid.uuid4()}",
-            "error": None
-        })
-        
+        dict: Publication results, one entry per channel in input order.
+    """
+    channels: List[Dict[str, Any]] = input_data.get("channels", [])
+    payload = {k: input_data.get(k) for k in ("content_id", "content_body", "publish_options")}
+    # Content without an id still gets one key per publish, shared by its retries.
+    key_prefix = payload["content_id"] or f"publish-{uuid.uuid4()}"
+
+    start_time = time.time()
+    pool = _get_fanout_pool()
+    futures = [pool.submit(_publish_channel, channel, payload, key_prefix) for channel in channels]
+    results = [future.result() for future in futures]
+
     return {
         "publication_id": f"pub-{uuid.uuid4()}",
         "results": results,
-        "published_at": datetime.utcnow().isoformat() + "Z"
+        "published_at": datetime.utcnow().isoformat() + "Z",
+        "duration_ms": (time.time() - start_time) * 1000,
     }
@@ -0,0 +1,6 @@
+from skills import lazy_skill_module
+
+# task type -> callable in .skill that handles it
+TASK_TYPES = {"analyze_trends": "analyze_trends"}
+
+__getattr__ = lazy_skill_module(__name__)
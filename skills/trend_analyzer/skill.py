@@ -0,0 +1,479 @@
+from collections import Counter
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+# Bytes per trend held in the columnar form: float32 score + int32 source code + int64 timestamp.
+BYTES_PER_TREND = 4 + 4 + 8
+# Bytes per trend while a batch is analysed, on top of its source-name array (4 bytes per
+# character): the columns above, the int64 inverse from np.unique, the float64 squares,
+# z-scores and gathered means/stds, the match mask and the list slice holding the batch.
+WORKING_BYTES_PER_TREND = BYTES_PER_TREND + 8 + 8 * 4 + 1 + 8
+
+
+class TrendColumns:
+    """
+    Columnar view of a trend list: one NumPy array per field instead of one dict per trend.
+    Titles stay in the original list and are only looked up for the rows that are reported.
+    """
+
+    def __init__(self, trends: Sequence[Dict[str, Any]]):
+        n = len(trends)
+        self.trends = trends
+        self.scores = _scores(trends)
+        self.source_names, self.source_codes = np.unique(
+            np.array([t.get("source") or "unknown" for t in trends], dtype=str),
+            return_inverse=True,
+        )
+        self.source_codes = self.source_codes.astype(np.int32, copy=False)
+        self.timestamps = np.fromiter(
+            (_to_epoch(t.get("timestamp")) for t in trends), dtype=np.int64, count=n
+        )
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @property
+    def nbytes(self) -> int:
+        return self.scores.nbytes + self.source_codes.nbytes + self.timestamps.nbytes
+
+
+def analyze_trends(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute engagement statistics over a list of trends.
+
+    Args:
+        input_data (dict): Contains 'trends' (list of trend objects as produced by
+            fetch_trends), and optionally 'min_engagement', 'percentiles',
+            'zscore_threshold', 'top_k' and 'memory_budget_mb'. When the trends would
+            not fit 'memory_budget_mb' at once they are analysed in chunks that do.
+
+    Returns:
+        dict: Summary report, filter counts, percentiles, per-source aggregates,
+        z-score anomalies, the top trends above the engagement threshold and, for
+        trends carrying engagement `history` (see core.timeseries), the fastest
+        risers.
+    """
+    trends = input_data.get("trends") or []
+    min_engagement = float(input_data.get("min_engagement", 0.0))
+    percentiles = input_data.get("percentiles", DEFAULT_PERCENTILES)
+    zscore_threshold = float(input_data.get("zscore_threshold", 3.0))
+    top_k = int(input_data.get("top_k", 10))
+    memory_budget_mb = input_data.get("memory_budget_mb")
+
+    if not trends:
+        return {
+            "analysis_report": "No trends to analyze.",
+            "total_trends": 0,
+            "matching_trends": 0,
+            "percentiles": {},
+            "by_source": {},
+            "anomalies": [],
+            "top_trends": [],
+            "momentum": [],
+            "time_range": None,
+            "memory_bytes": 0,
+        }
+
+    rows = _chunk_rows(trends, memory_budget_mb)
+    if rows < len(trends):
+        return _analyze_in_chunks(
+            trends, rows, min_engagement, percentiles, zscore_threshold, top_k
+        )
+
+    cols = TrendColumns(trends)
+    mask = cols.scores >= min_engagement
+    matching = int(np.count_nonzero(mask))
+
+    by_source = _aggregate_by_source(cols)
+    anomalies = _zscore_anomalies(cols, zscore_threshold)
+    top = _top_k(cols, mask, top_k)
+
+    return _report(
+        total=len(cols),
+        matching=matching,
+        min_engagement=min_engagement,
+        percentiles=_percentiles(cols.scores[mask], percentiles),
+        by_source=by_source,
+        anomalies=anomalies,
+        top=top,
+        momentum=_momentum(trends, top_k),
+        time_range=_time_range(cols.timestamps),
+        memory_bytes=cols.nbytes,
+    )
+
+
+def _report(
+    total: int,
+    matching: int,
+    min_engagement: float,
+    percentiles: Dict[str, float],
+    by_source: Dict[str, Dict[str, float]],
+    anomalies: List[Dict[str, Any]],
+    top: List[Dict[str, Any]],
+    momentum: List[Dict[str, Any]],
+    time_range: Optional[Dict[str, str]],
+    memory_bytes: int,
+) -> Dict[str, Any]:
+    return {
+        "analysis_report": (
+            f"{matching} of {total} trends at or above engagement {min_engagement:g} "
+            f"across {len(by_source)} sources; {len(anomalies)} anomalies."
+        ),
+        "total_trends": total,
+        "matching_trends": matching,
+        "percentiles": percentiles,
+        "by_source": by_source,
+        "anomalies": anomalies,
+        "top_trends": top,
+        "momentum": momentum,
+        "time_range": time_range,
+        "memory_bytes": memory_bytes,
+    }
+
+
+def _chunk_rows(trends: Sequence[Dict[str, Any]], memory_budget_mb: Optional[float]) -> int:
+    """Trends per chunk so that a chunk's working set fits the budget; all of them without one."""
+    if memory_budget_mb is None:
+        return len(trends)
+    longest = max(len(t.get("source") or "unknown") for t in trends)
+    per_trend = WORKING_BYTES_PER_TREND + 4 * longest
+    return max(1, int(memory_budget_mb * 1024 * 1024) // per_trend)
+
+
+def _analyze_in_chunks(
+    trends: Sequence[Dict[str, Any]],
+    rows: int,
+    min_engagement: float,
+    percentiles: Sequence[float],
+    zscore_threshold: float,
+    top_k: int,
+) -> Dict[str, Any]:
+    """
+    Same report as the single-batch path, `rows` trends at a time. The first pass merges
+    per-source sums, the top trends, risers and time range; the second flags anomalies
+    against the merged per-source means and histograms the matching scores, which
+    `_chunked_percentiles` then resolves exactly with a third pass over the scores.
+    """
+    counts: Counter = Counter()
+    sums: Counter = Counter()
+    sq_sums: Counter = Counter()
+    maxes: Dict[str, float] = {}
+    matching, peak = 0, 0
+    lo, hi = np.inf, -np.inf
+    top: List[Tuple[float, int, float]] = []
+    risers: List[Tuple[float, int]] = []
+    start_ts, end_ts = None, None
+
+    for start in range(0, len(trends), rows):
+        chunk = trends[start:start + rows]
+        cols = TrendColumns(chunk)
+        peak = max(peak, cols.nbytes)
+        mask = cols.scores >= min_engagement
+        matching += int(np.count_nonzero(mask))
+        if mask.any():
+            lo = min(lo, float(cols.scores[mask].min()))
+            hi = max(hi, float(cols.scores[mask].max()))
+
+        chunk_counts, chunk_sums, chunk_sq_sums = _source_sums(cols)
+        chunk_maxes = _source_maxes(cols)
+        for i, name in enumerate(cols.source_names):
+            name = str(name)
+            counts[name] += int(chunk_counts[i])
+            sums[name] += float(chunk_sums[i])
+            sq_sums[name] += float(chunk_sq_sums[i])
+            maxes[name] = max(maxes.get(name, -np.inf), float(chunk_maxes[i]))
+
+        top.extend(
+            (-float(cols.scores[i]), start + int(i), float(cols.scores[i]))
+            for i in _top_k_indices(cols, mask, top_k)
+        )
+        idx, rates = _momentum_indices(chunk, top_k)
+        risers.extend((-float(rates[j]), start + idx[j]) for j in range(len(idx)))
+
+        known = cols.timestamps[cols.timestamps > 0]
+        if known.size:
+            first, last = int(known.min()), int(known.max())
+            start_ts = first if start_ts is None else min(start_ts, first)
+            end_ts = last if end_ts is None else max(end_ts, last)
+
+    names = sorted(counts)
+    means = {name: sums[name] / counts[name] for name in names}
+    stds = {
+        name: float(np.sqrt(max(sq_sums[name] / counts[name] - means[name] ** 2, 0.0)))
+        for name in names
+    }
+
+    nbins = rows
+    width = hi - lo if matching else 0.0
+    hist = np.zeros(nbins, dtype=np.int64)
+    flagged: List[Tuple[float, int, str, float, float]] = []
+    for start in range(0, len(trends), rows):
+        cols = TrendColumns(trends[start:start + rows])
+        chunk_names = [str(name) for name in cols.source_names]
+        z = _zscores(
+            cols,
+            np.array([means[name] for name in chunk_names]),
+            np.array([stds[name] for name in chunk_names]),
+        )
+        for i in np.flatnonzero(np.abs(z) > zscore_threshold):
+            flagged.append((
+                -abs(float(z[i])),
+                start + int(i),
+                chunk_names[cols.source_codes[i]],
+                float(cols.scores[i]),
+                float(z[i]),
+            ))
+        matched = cols.scores[cols.scores >= min_engagement]
+        hist += np.bincount(_bins(matched, lo, width, nbins), minlength=nbins)
+
+    top.sort()
+    flagged.sort()
+    risers.sort()
+    anomalies = [
+        _anomaly(trends[i].get("title"), source, score, z)
+        for _, i, source, score, z in flagged
+    ]
+    return _report(
+        total=len(trends),
+        matching=matching,
+        min_engagement=min_engagement,
+        percentiles=_chunked_percentiles(
+            trends, rows, min_engagement, percentiles, hist, lo, width
+        ),
+        by_source={
+            name: {
+                "count": counts[name],
+                "mean_score": round(means[name], 6),
+                "max_score": round(maxes[name], 6),
+            }
+            for name in names
+        },
+        anomalies=anomalies,
+        top=[
+            {"title": trends[i].get("title"), "engagement_score": round(score, 6)}
+            for _, i, score in top[:max(top_k, 0)]
+        ],
+        momentum=_momentum_rows(trends, [i for _, i in risers[:max(top_k, 0)]]),
+        time_range=None if start_ts is None else _format_range(start_ts, end_ts),
+        memory_bytes=peak,
+    )
+
+
+def _chunked_percentiles(
+    trends: Sequence[Dict[str, Any]],
+    rows: int,
+    min_engagement: float,
+    percentiles: Sequence[float],
+    hist: np.ndarray,
+    lo: float,
+    width: float,
+) -> Dict[str, float]:
+    """
+    Exact 'linear' percentiles from a histogram of the matching scores: only the values in
+    the bins holding the ranks that are interpolated between are collected.
+    """
+    n = int(hist.sum())
+    if n == 0:
+        return {}
+    positions = [(n - 1) * float(p) / 100 for p in percentiles]
+    ranks = sorted({r for h in positions for r in (int(h), min(int(h) + 1, n - 1))})
+    ends = np.cumsum(hist)
+    rank_bins = {r: int(np.searchsorted(ends, r, side="right")) for r in ranks}
+    wanted = np.array(sorted(set(rank_bins.values())))
+
+    values: Dict[int, Counter] = {int(b): Counter() for b in wanted}
+    for start in range(0, len(trends), rows):
+        scores = _scores(trends[start:start + rows])
+        scores = scores[scores >= min_engagement]
+        bins = _bins(scores, lo, width, len(hist))
+        for b in wanted:
+            found, occurrences = np.unique(scores[bins == b], return_counts=True)
+            values[int(b)].update(dict(zip(found.tolist(), occurrences.tolist())))
+
+    at = {r: _nth(values[b], r - int(ends[b] - hist[b])) for r, b in rank_bins.items()}
+    result = {}
+    for p, h in zip(percentiles, positions):
+        below, above = at[int(h)], at[min(int(h) + 1, n - 1)]
+        result[f"p{p:g}"] = round(below + (h - int(h)) * (above - below), 6)
+    return result
+
+
+def _bins(scores: np.ndarray, lo: float, width: float, nbins: int) -> np.ndarray:
+    if width <= 0:
+        return np.zeros(len(scores), dtype=np.int64)
+    bins = ((scores.astype(np.float64) - lo) / width * nbins).astype(np.int64)
+    return np.clip(bins, 0, nbins - 1)
+
+
+def _nth(counts: Counter, offset: int) -> float:
+    """The `offset`-th smallest value (0-based) of a value -> occurrences counter."""
+    for value in sorted(counts):
+        offset -= counts[value]
+        if offset < 0:
+            return value
+    raise IndexError(offset)
+
+
+def _percentiles(scores: np.ndarray, percentiles: Sequence[float]) -> Dict[str, float]:
+    if scores.size == 0:
+        return {}
+    values = np.percentile(scores, percentiles)
+    return {f"p{p:g}": round(float(v), 6) for p, v in zip(percentiles, values)}
+
+
+def _source_sums(cols: TrendColumns):
+    n_sources = len(cols.source_names)
+    counts = np.bincount(cols.source_codes, minlength=n_sources)
+    sums = np.bincount(cols.source_codes, weights=cols.scores, minlength=n_sources)
+    sq_sums = np.bincount(
+        cols.source_codes, weights=cols.scores.astype(np.float64) ** 2, minlength=n_sources
+    )
+    return counts, sums, sq_sums
+
+
+def _source_stats(cols: TrendColumns):
+    counts, sums, sq_sums = _source_sums(cols)
+    means = sums / counts
+    stds = np.sqrt(np.maximum(sq_sums / counts - means ** 2, 0.0))
+    return counts, means, stds
+
+
+def _source_maxes(cols: TrendColumns) -> np.ndarray:
+    maxes = np.full(len(cols.source_names), -np.inf, dtype=np.float32)
+    np.maximum.at(maxes, cols.source_codes, cols.scores)
+    return maxes
+
+
+def _aggregate_by_source(cols: TrendColumns) -> Dict[str, Dict[str, float]]:
+    counts, means, _ = _source_stats(cols)
+    maxes = _source_maxes(cols)
+    return {
+        str(name): {
+            "count": int(counts[i]),
+            "mean_score": round(float(means[i]), 6),
+            "max_score": round(float(maxes[i]), 6),
+        }
+        for i, name in enumerate(cols.source_names)
+    }
+
+
+def _zscores(cols: TrendColumns, means: np.ndarray, stds: np.ndarray) -> np.ndarray:
+    std = stds[cols.source_codes]
+    return np.divide(
+        cols.scores - means[cols.source_codes], std, out=np.zeros(len(cols)), where=std > 0
+    )
+
+
+def _zscore_anomalies(cols: TrendColumns, threshold: float) -> List[Dict[str, Any]]:
+    """
+    Flags trends whose score is more than `threshold` standard deviations from the
+    mean of their own source (sources score on different scales).
+    """
+    _, means, stds = _source_stats(cols)
+    z = _zscores(cols, means, stds)
+    flagged = np.flatnonzero(np.abs(z) > threshold)
+    flagged = flagged[np.argsort(-np.abs(z[flagged]), kind="stable")]
+    return [
+        _anomaly(
+            cols.trends[i].get("title"),
+            str(cols.source_names[cols.source_codes[i]]),
+            float(cols.scores[i]),
+            float(z[i]),
+        )
+        for i in flagged
+    ]
+
+
+def _anomaly(title: Any, source: str, score: float, z: float) -> Dict[str, Any]:
+    return {
+        "title": title,
+        "source": source,
+        "engagement_score": round(score, 6),
+        "z_score": round(z, 3),
+    }
+
+
+def _top_k_indices(cols: TrendColumns, mask: np.ndarray, k: int) -> np.ndarray:
+    idx = np.flatnonzero(mask)
+    if k <= 0 or idx.size == 0:
+        return idx[:0]
+    if idx.size > k:
+        idx = np.sort(idx[np.argpartition(-cols.scores[idx], k - 1)[:k]])
+    return idx[np.argsort(-cols.scores[idx], kind="stable")]
+
+
+def _top_k(cols: TrendColumns, mask: np.ndarray, k: int) -> List[Dict[str, Any]]:
+    return [
+        {"title": cols.trends[i].get("title"), "engagement_score": round(float(cols.scores[i]), 6)}
+        for i in _top_k_indices(cols, mask, k)
+    ]
+
+
+def _momentum_indices(trends: Sequence[Dict[str, Any]], k: int) -> Tuple[List[int], np.ndarray]:
+    """Indices of up to `k` trends with history and their rates, steepest rise first."""
+    idx = [i for i, t in enumerate(trends) if t.get("history")]
+    if k <= 0 or not idx:
+        return [], np.zeros(0)
+    rates = np.fromiter(
+        (trends[i]["history"].get("rate_per_hour", 0.0) for i in idx),
+        dtype=np.float64,
+        count=len(idx),
+    )
+    order = np.argsort(-rates, kind="stable")[:k]
+    return [idx[j] for j in order], rates[order]
+
+
+def _momentum_rows(trends: Sequence[Dict[str, Any]], idx: Sequence[int]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "title": trends[i].get("title"),
+            "rate_per_hour": round(float(trends[i]["history"].get("rate_per_hour", 0.0)), 6),
+            "change": round(float(trends[i]["history"].get("change", 0.0)), 6),
+            "samples": int(trends[i]["history"].get("samples", 0)),
+        }
+        for i in idx
+    ]
+
+
+def _momentum(trends: Sequence[Dict[str, Any]], k: int) -> List[Dict[str, Any]]:
+    """Trends with history, by least-squares engagement slope (per hour), steepest rise first."""
+    idx, _ = _momentum_indices(trends, k)
+    return _momentum_rows(trends, idx)
+
+
+def _time_range(timestamps: np.ndarray) -> Optional[Dict[str, str]]:
+    known = timestamps[timestamps > 0]
+    if known.size == 0:
+        return None
+    return _format_range(int(known.min()), int(known.max()))
+
+
+def _format_range(start: int, end: int) -> Dict[str, str]:
+    return {
+        "start": datetime.fromtimestamp(start, timezone.utc).isoformat().replace("+00:00", "Z"),
+        "end": datetime.fromtimestamp(end, timezone.utc).isoformat().replace("+00:00", "Z"),
+    }
+
+
+def _scores(trends: Sequence[Dict[str, Any]]) -> np.ndarray:
+    return np.fromiter(
+        (t.get("engagement_score", 0.0) for t in trends), dtype=np.float32, count=len(trends)
+    )
+
+
+def _to_epoch(value: Any) -> int:
+    """Epoch seconds for a numeric or ISO 8601 timestamp; 0 when missing or unparseable."""
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return 0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
@@ -1 +1,8 @@
-from . import skill
+from skills import lazy_skill_module
+
+# task type -> callable in .skill that handles it
+TASK_TYPES = {"fetch_trends": "fetch_trends_cached", "search_trends": "search_trends"}
+# task type -> callable in .skill that handles many inputs in one call
+BATCH_TASK_TYPES = {"fetch_trends": "fetch_trends_batch"}
+
+__getattr__ = lazy_skill_module(__name__)
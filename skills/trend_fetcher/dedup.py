@@ -0,0 +1,232 @@
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+import hashlib
+import os
+import re
+import unicodedata
+
+import numpy as np
+
+# Estimated Jaccard similarity at or above which two trends are the same topic.
+DEFAULT_THRESHOLD = float(os.getenv("TREND_DEDUP_THRESHOLD", "0.5"))
+DEFAULT_NUM_PERM = int(os.getenv("TREND_DEDUP_NUM_PERM", "128"))
+_SEED = 1729
+
+_WORD = re.compile(r"\w+")
+
+
+def shingles(trend: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+    """
+    Features compared between trends, kept apart so one long sample post cannot
+    outweigh the title: the words and word pairs of the normalized title, and the
+    word pairs of each of `sample_items`.
+
+    Args:
+        trend (dict): Normalized trend (see `normalize_trend`).
+
+    Returns:
+        tuple: (title shingles, sample shingles); either may be empty.
+    """
+    words = _words(trend.get("title"))
+    title = set(words) | _pairs(words)
+    samples: Set[str] = set()
+    for item in trend.get("sample_items") or []:
+        item_words = _words(item)
+        samples |= _pairs(item_words) if len(item_words) > 1 else set(item_words)
+    return title, samples
+
+
+def _words(text: Any) -> List[str]:
+    return _WORD.findall(unicodedata.normalize("NFKC", str(text or "")).lower())
+
+
+def _pairs(words: List[str]) -> Set[str]:
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Bands and rows per band for an LSH index over `num_perm` MinHash values.
+
+    Two signatures collide in some band with probability 1 - (1 - s^r)^b, an S-curve
+    in their similarity s whose steepest point is near (1/b)^(1/r). Picks the b, r
+    (b * r <= num_perm) that put it closest to `threshold`, preferring more bands
+    (fewer missed duplicates; candidates are verified anyway).
+    """
+    best = (1, num_perm)
+    best_gap = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        gap = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if gap < best_gap - 1e-9:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class TrendDeduper:
+    """
+    Incremental near-duplicate index over trends, using MinHash signatures in an
+    LSH (banded) index.
+
+    Titles and sample items get a signature each. An added trend joins the most
+    similar existing cluster if either its title or its sample items reach
+    `threshold` estimated Jaccard similarity with a member's, and starts a new
+    cluster otherwise. Only clusters sharing an LSH band with it are compared, so
+    adding a trend costs the same however many are indexed.
+
+    A cluster is the first trend seen (copied), updated in place as duplicates merge
+    into it:
+
+    - `engagement_score`: combined as 1 - prod(1 - score), so it stays in [0, 1]
+      and grows with every report of the topic.
+    - `sample_items`: the union, in arrival order.
+    - `sources` and `duplicates` (title, source, url and engagement_score of each
+      merged trend): added on the first merge; trends without duplicates are
+      returned unchanged.
+
+    Usage:
+        deduper = TrendDeduper(threshold=0.5)
+        for trend in trends:
+            cluster, is_new = deduper.add(trend)
+        deduper.clusters  # one merged trend per topic
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], not {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = np.random.default_rng(_SEED)
+        # Multiply-shift hash family: h -> (a * h + b) mod 2^64, top 32 bits.
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        # (title bands, sample bands): band key -> cluster ids
+        self._buckets: Tuple[List[Dict[bytes, Set[int]]], ...] = (
+            [{} for _ in range(self.bands)], [{} for _ in range(self.bands)],
+        )
+        # cluster -> (title signature, sample signature) of each member; None when empty
+        self._members: List[List[Tuple[Optional[np.ndarray], Optional[np.ndarray]]]] = []
+        self.clusters: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def signature(self, features: Iterable[str]) -> Optional[np.ndarray]:
+        """MinHash signature (num_perm uint32 values) of a shingle set; None if it is empty."""
+        hashes = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest(), "little")
+                for f in features
+            ),
+            dtype=np.uint64,
+        )
+        if hashes.size == 0:
+            return None
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def add(self, trend: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Index one trend.
+
+        Args:
+            trend (dict): Normalized trend. Not modified.
+
+        Returns:
+            tuple: (cluster, is_new). `cluster` is the merged trend it belongs to;
+            `is_new` is True if the trend started that cluster.
+        """
+        sigs = tuple(self.signature(features) for features in shingles(trend))
+        keys = tuple(self._band_keys(sig) for sig in sigs)
+
+        best, best_similarity = None, 0.0
+        for candidate in self._candidates(keys):
+            similarity = max(self._similarity(sigs, member) for member in self._members[candidate])
+            if similarity > best_similarity:
+                best, best_similarity = candidate, similarity
+
+        if best is not None and best_similarity >= self.threshold:
+            _merge(self.clusters[best], trend)
+            self._members[best].append(sigs)
+            self._index(best, keys)
+            return self.clusters[best], False
+
+        cluster_id = len(self.clusters)
+        cluster = dict(trend)
+        if "sample_items" in cluster:
+            cluster["sample_items"] = list(cluster["sample_items"])
+        self.clusters.append(cluster)
+        self._members.append([sigs])
+        self._index(cluster_id, keys)
+        return cluster, True
+
+    def _band_keys(self, sig: Optional[np.ndarray]) -> List[bytes]:
+        if sig is None:
+            return []
+        return [sig[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _candidates(self, keys: Tuple[List[bytes], ...]) -> Set[int]:
+        return {
+            cluster_id
+            for buckets, part_keys in zip(self._buckets, keys)
+            for band, key in zip(buckets, part_keys)
+            for cluster_id in band.get(key, ())
+        }
+
+    @staticmethod
+    def _similarity(sigs, member) -> float:
+        return max(
+            (
+                float(np.mean(a == b))
+                for a, b in zip(sigs, member)
+                if a is not None and b is not None
+            ),
+            default=0.0,
+        )
+
+    def _index(self, cluster_id: int, keys: Tuple[List[bytes], ...]) -> None:
+        for buckets, part_keys in zip(self._buckets, keys):
+            for band, key in zip(buckets, part_keys):
+                band.setdefault(key, set()).add(cluster_id)
+
+
+def _merge(cluster: Dict[str, Any], trend: Dict[str, Any]) -> None:
+    score = float(trend.get("engagement_score") or 0.0)
+    combined = 1.0 - (1.0 - float(cluster.get("engagement_score") or 0.0)) * (1.0 - score)
+    cluster["engagement_score"] = min(1.0, max(0.0, combined))
+    if "duplicates" not in cluster:
+        cluster["sources"] = [cluster["source"]] if cluster.get("source") else []
+        cluster["duplicates"] = []
+    source = trend.get("source")
+    if source and source not in cluster["sources"]:
+        cluster["sources"].append(source)
+    samples = cluster.setdefault("sample_items", [])
+    for item in trend.get("sample_items") or []:
+        if item not in samples:
+            samples.append(item)
+    cluster["duplicates"].append({
+        "title": trend.get("title"),
+        "source": source,
+        "url": trend.get("url"),
+        "engagement_score": score,
+    })
+
+
+def dedupe_trends(
+    trends: Iterable[Dict[str, Any]], threshold: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge near-duplicate trends (e.g. one topic reported by several sources).
+
+    Args:
+        trends (iterable): Normalized trends.
+        threshold (float, optional): Similarity at or above which trends merge.
+            Defaults to TREND_DEDUP_THRESHOLD (0.5).
+
+    Returns:
+        list: One merged trend per cluster, in order of first appearance.
+    """
+    deduper = TrendDeduper(DEFAULT_THRESHOLD if threshold is None else threshold)
+    for trend in trends:
+        deduper.add(trend)
+    return deduper.clusters
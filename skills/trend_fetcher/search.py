@@ -0,0 +1,355 @@
+from array import array
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import math
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+# Metadata indexed as exact-match `field:value` terms.
+FIELDS = ("source", "region", "language")
+# A title word counts this many times in term frequency and document length.
+TITLE_BOOST = 2
+# BM25 parameters: term-frequency saturation and document-length normalization.
+K1 = 1.2
+B = 0.75
+
+_WORD = re.compile(r"\w+")
+_TOKEN = re.compile(r'\(|\)|\w+:"[^"]*"|"[^"]*"|[^\s()]+')
+_OPERATORS = ("AND", "OR", "NOT")
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercased words of a text (Unicode-normalized), as indexed and queried."""
+    return _WORD.findall(unicodedata.normalize("NFKC", str(text or "")).lower())
+
+
+class QueryError(ValueError):
+    """Raised for a query that does not parse (e.g. an unclosed parenthesis)."""
+
+
+class TrendIndex:
+    """
+    In-memory inverted index over trends, built incrementally as they arrive.
+
+    Indexes the words of `title` (boosted) and `sample_items`, plus `source`
+    (and the `sources` of merged trends), `metadata.region` and
+    `metadata.language` as exact `field:value` terms. Postings are compact arrays
+    of document ids and term frequencies, so a query touches only the postings of
+    its terms instead of every trend.
+
+    Queries:
+        agentic ai                      bare words; joined by the default operator
+        agentic AND (ai OR ml)          AND, OR, NOT and parentheses
+        -crypto  /  NOT crypto          exclusion
+        "agentic ai"                    all of the words (no positions are kept)
+        source:twitter region:us        metadata filters (quote values with spaces)
+
+    `match` is a boolean filter (bare words must all match). `search` ranks with
+    BM25 and returns the top `limit` (bare words are alternatives, more matching
+    words rank higher; use AND for required words).
+
+    Re-adding a trend with the same source and title (case-insensitive) replaces
+    the old one. Past `max_docs` the oldest trends are dropped.
+
+    Usage:
+        index = TrendIndex()
+        index.add_many(trends)
+        index.search("agentic ai source:twitter", limit=10)  # [(trend, score), ...]
+    """
+
+    def __init__(self, trends: Iterable[Dict[str, Any]] = (), max_docs: Optional[int] = None):
+        self.max_docs = max_docs
+        self._lock = threading.RLock()
+        self._reset()
+        self.add_many(trends)
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def add(self, trend: Dict[str, Any]) -> int:
+        """
+        Index one trend (kept by reference; do not mutate it afterwards).
+
+        Returns:
+            int: Its document id.
+        """
+        with self._lock:
+            doc_id = self._add(trend)
+            self._enforce_limits()
+            return doc_id
+
+    def add_many(self, trends: Iterable[Dict[str, Any]]) -> None:
+        with self._lock:
+            for trend in trends:
+                self._add(trend)
+            self._enforce_limits()
+
+    def match(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Trends matching a boolean query, oldest first.
+
+        Raises:
+            QueryError: If the query does not parse.
+        """
+        with self._lock:
+            ids, _ = self._evaluate(query, "AND")
+            if limit is not None:
+                ids = ids[:max(limit, 0)]
+            return [self._docs[i] for i in ids]
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Top `limit` trends for a query by BM25 score, best first, as (trend, score).
+        Only words outside NOT contribute to the score; filters and exclusions just
+        narrow the candidates.
+
+        Raises:
+            QueryError: If the query does not parse.
+        """
+        with self._lock:
+            ids, terms = self._evaluate(query, "OR")
+            if ids.size == 0 or limit <= 0:
+                return []
+            scores = self._bm25(terms, ids)
+            if ids.size > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                ids, scores = ids[top], scores[top]
+            order = np.lexsort((ids, -scores))
+            return [(self._docs[ids[i]], float(scores[i])) for i in order]
+
+    def count(self, query: str) -> int:
+        """Number of trends matching a boolean query."""
+        with self._lock:
+            return int(self._evaluate(query, "AND")[0].size)
+
+    # --- indexing --------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._docs: List[Optional[Dict[str, Any]]] = []
+        self._live = bytearray()  # 1 per doc id still indexed
+        self._lengths = array("I")
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._by_identity: Dict[Tuple[str, str], int] = {}
+        self._total_length = 0
+        self._live_count = 0
+        self._oldest = 0  # first doc id that may still be live
+
+    def _add(self, trend: Dict[str, Any]) -> int:
+        identity = _identity(trend)
+        previous = self._by_identity.get(identity)
+        if previous is not None:
+            self._delete(previous)
+
+        doc_id = len(self._docs)
+        frequencies: Dict[str, int] = {}
+        title_words = tokenize(trend.get("title"))
+        for word in title_words:
+            frequencies[word] = frequencies.get(word, 0) + TITLE_BOOST
+        length = len(title_words) * TITLE_BOOST
+        for item in trend.get("sample_items") or []:
+            for word in tokenize(item):
+                frequencies[word] = frequencies.get(word, 0) + 1
+                length += 1
+        for term in _field_terms(trend):
+            frequencies.setdefault(term, 1)
+
+        for term, tf in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("I"))
+            postings[0].append(doc_id)
+            postings[1].append(tf)
+        self._docs.append(trend)
+        self._live.append(1)
+        self._lengths.append(length)
+        self._by_identity[identity] = doc_id
+        self._total_length += length
+        self._live_count += 1
+        return doc_id
+
+    def _delete(self, doc_id: int) -> None:
+        # Tombstone: postings keep the id until the next rebuild.
+        if self._docs[doc_id] is not None:
+            self._docs[doc_id] = None
+            self._live[doc_id] = 0
+            self._total_length -= self._lengths[doc_id]
+            self._live_count -= 1
+
+    def _enforce_limits(self) -> None:
+        if self.max_docs is not None:
+            while self._live_count > self.max_docs:
+                trend = self._docs[self._oldest]
+                if trend is not None:
+                    self._by_identity.pop(_identity(trend), None)
+                    self._delete(self._oldest)
+                self._oldest += 1
+        # Rebuild once tombstones outnumber live trends, so postings stay proportional.
+        if len(self._docs) > 2 * self._live_count + 1024:
+            live = [doc for doc in self._docs if doc is not None]
+            self._reset()
+            for trend in live:
+                self._add(trend)
+
+    # --- querying --------------------------------------------------------
+
+    def _evaluate(self, query: str, default_operator: str) -> Tuple[np.ndarray, List[str]]:
+        """(ids of live matching trends, ascending; scoring terms)."""
+        parser = _QueryParser(query, default_operator)
+        tree = parser.parse()
+        ids = self._run(tree) if tree is not None else self._all_ids()
+        if ids.size and self._live_count < len(self._docs):
+            ids = ids[np.frombuffer(self._live, dtype=bool)[ids]]
+        return ids, parser.scoring_terms
+
+    def _run(self, node) -> np.ndarray:
+        kind = node[0]
+        if kind in ("term", "field"):
+            postings = self._postings.get(node[1])
+            if not postings:
+                return np.empty(0, dtype=np.uint32)
+            return np.array(postings[0], dtype=np.uint32)
+        if kind == "not":
+            return np.setdiff1d(self._all_ids(), self._run(node[1]), assume_unique=True)
+        parts = [self._run(child) for child in node[1]]
+        if kind == "and":
+            parts.sort(key=len)  # intersect from the rarest term up
+            result = parts[0]
+            for part in parts[1:]:
+                if result.size == 0:
+                    break
+                result = np.intersect1d(result, part, assume_unique=True)
+            return result
+        return np.unique(np.concatenate(parts))
+
+    def _all_ids(self) -> np.ndarray:
+        return np.arange(self._oldest, len(self._docs), dtype=np.uint32)
+
+    def _bm25(self, terms: List[str], ids: np.ndarray) -> np.ndarray:
+        lengths = np.array(self._lengths, dtype=np.float64)
+        average = self._total_length / self._live_count if self._live_count else 0.0
+        norm = K1 * (1 - B + B * lengths / average) if average > 0 else np.full(lengths.size, K1)
+        live = np.frombuffer(self._live, dtype=bool)
+        scores = np.zeros(len(self._docs))
+        for term in dict.fromkeys(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            doc_ids = np.array(postings[0], dtype=np.intp)
+            tf = np.array(postings[1], dtype=np.float64)
+            df = int(np.count_nonzero(live[doc_ids]))  # postings keep tombstoned ids
+            idf = math.log(1 + (self._live_count - df + 0.5) / (df + 0.5))
+            scores[doc_ids] += idf * tf * (K1 + 1) / (tf + norm[doc_ids])
+        return scores[ids]
+
+
+def _identity(trend: Dict[str, Any]) -> Tuple[str, str]:
+    return (str(trend.get("source") or ""), " ".join(tokenize(trend.get("title"))))
+
+
+def _field_terms(trend: Dict[str, Any]) -> List[str]:
+    metadata = trend.get("metadata") or {}
+    sources = [trend.get("source")] + list(trend.get("sources") or [])
+    values = {
+        "source": sources,
+        "region": [metadata.get("region")],
+        "language": [metadata.get("language")],
+    }
+    return [
+        f"{field}:{_field_value(value)}"
+        for field in FIELDS
+        for value in values[field]
+        if value
+    ]
+
+
+def _field_value(value: Any) -> str:
+    return " ".join(str(value).lower().split())
+
+
+class _QueryParser:
+    """
+    Recursive-descent parser. Precedence, loosest first: juxtaposition, OR, AND,
+    NOT / "-". With default operator AND, juxtaposition means AND. With OR it joins
+    clauses the way a search box does: exclusions and field:value clauses become
+    required filters, the rest are alternatives.
+
+    Nodes: ("term", word), ("field", "field:value"), ("not", n), ("and", [n...]),
+    ("or", [n...]).
+    """
+
+    def __init__(self, query: str, default_operator: str):
+        # Lone punctuation (e.g. " - ") is not a term.
+        self.tokens = [t for t in _TOKEN.findall(query or "") if t in "()" or _WORD.search(t)]
+        self.position = 0
+        self.default_operator = default_operator
+        self.scoring_terms: List[str] = []
+        self._negated = 0
+
+    def parse(self):
+        if not self.tokens:
+            return None
+        node = self._expression()
+        if self.position < len(self.tokens):
+            raise QueryError(f"Unexpected {self.tokens[self.position]!r} in query")
+        return node
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _expression(self):
+        clauses = [self._or()]
+        while self._peek() not in (None, ")"):
+            clauses.append(self._or())
+        if self.default_operator == "AND":
+            return _combine("and", clauses)
+        filters = [c for c in clauses if c[0] in ("not", "field")]
+        optional = [c for c in clauses if c[0] not in ("not", "field")]
+        return _combine("and", ([_combine("or", optional)] if optional else []) + filters)
+
+    def _or(self):
+        children = [self._and()]
+        while self._peek() == "OR":
+            self.position += 1
+            children.append(self._and())
+        return _combine("or", children)
+
+    def _and(self):
+        children = [self._unary()]
+        while self._peek() == "AND":
+            self.position += 1
+            children.append(self._unary())
+        return _combine("and", children)
+
+    def _unary(self):
+        token = self._peek()
+        if token is None:
+            raise QueryError("Query ends where a term was expected")
+        self.position += 1
+        if token == "NOT" or (token.startswith("-") and len(token) > 1):
+            if token != "NOT":
+                self.tokens.insert(self.position, token[1:])
+            self._negated += 1
+            node = ("not", self._unary())
+            self._negated -= 1
+            return node
+        if token == "(":
+            node = self._expression()
+            if self._peek() != ")":
+                raise QueryError("Unclosed parenthesis in query")
+            self.position += 1
+            return node
+        if token in (")",) + _OPERATORS:
+            raise QueryError(f"Unexpected {token!r} in query")
+        field, _, value = token.partition(":")
+        if value and field.lower() in FIELDS:
+            return ("field", f"{field.lower()}:{_field_value(value.strip(chr(34)))}")
+        words = tokenize(token)
+        if not self._negated:
+            self.scoring_terms.extend(words)
+        return _combine("and", [("term", word) for word in words])
+
+
+def _combine(kind: str, children: list):
+    return children[0] if len(children) == 1 else (kind, children)
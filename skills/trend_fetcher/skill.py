@@ -1,38 +1,432 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
+import asyncio
+import json
+import os
+import time
 import uuid
 
+import httpx
+
+from core.cache import TTLCache, make_key
+from core.clients import default_clients
+from core.timeseries import EngagementHistory, parse_timeframe, trend_key
+from skills.trend_fetcher.dedup import DEFAULT_THRESHOLD, TrendDeduper, dedupe_trends
+from skills.trend_fetcher.search import TrendIndex
+
+# Shared by every caller in the process. TREND_CACHE_DIR enables the on-disk tier.
+trend_cache = TTLCache(
+    maxsize=int(os.getenv("TREND_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("TREND_CACHE_TTL", "300")),
+    disk_dir=os.getenv("TREND_CACHE_DIR") or None,
+)
+
+# Warm pool of recently fetched trends, searchable with `search_trends`.
+trend_pool = TrendIndex(max_docs=int(os.getenv("TREND_POOL_SIZE", "100000")))
+
+# TREND_HISTORY_DIR turns on engagement history; a request's `timeframe` then picks
+# the window each trend's `history` covers.
+trend_history = (
+    EngagementHistory(os.environ["TREND_HISTORY_DIR"]) if os.getenv("TREND_HISTORY_DIR") else None
+)
+DEFAULT_TIMEFRAME = os.getenv("TREND_DEFAULT_TIMEFRAME", "24h")
+
+def attach_history(
+    trends: List[Dict[str, Any]],
+    input_data: Dict[str, Any],
+    history: Optional[EngagementHistory] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Record the trends' engagement and annotate each with its history over the
+    request's timeframe. A no-op without a history store.
+
+    Args:
+        trends (list): Freshly fetched trends; annotated in place.
+        input_data (dict): The request; 'timeframe' is e.g. "24h", "7d" or an ISO
+            "start/end" range (default TREND_DEFAULT_TIMEFRAME).
+        history (EngagementHistory, optional): Defaults to `trend_history`.
+
+    Returns:
+        list: The same trends. Each gains `history`: samples, mean, min, max, first,
+        last, change and rate_per_hour (momentum); this fetch counts when the window
+        reaches the present.
+
+    Raises:
+        ValueError: If the timeframe is not understood.
+    """
+    history = history or trend_history
+    if history is None or not trends:
+        return trends
+    now_us = time.time_ns() // 1000
+    since, until = parse_timeframe(input_data.get("timeframe") or DEFAULT_TIMEFRAME, now_us)
+    history.record_trends(trends, at_us=now_us)
+    stats = history.window(since, until, keys=[trend_key(t.get("title")) for t in trends])
+    for trend in trends:
+        summary = stats.get(trend_key(trend.get("title")))
+        if summary is not None:
+            trend["history"] = summary
+    return trends
+
+def dedup_threshold(input_data: Dict[str, Any]) -> Optional[float]:
+    """
+    Similarity threshold for merging near-duplicate trends in this request, or None
+    when the request turns dedup off (`"dedup": false`).
+
+    Args:
+        input_data (dict): May contain 'dedup' (bool, default true) and
+            'dedup_threshold' (float in (0, 1], default TREND_DEDUP_THRESHOLD).
+    """
+    if input_data.get("dedup") is False:
+        return None
+    return float(input_data.get("dedup_threshold") or DEFAULT_THRESHOLD)
+
 def fetch_trends(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Fetch and normalize trending topics from multiple sources.
     
     Args:
-        input_data (dict): Contains 'query', 'sources', 'timeframe', 'limit'.
+        input_data (dict): Contains 'query', 'sources', 'timeframe', 'limit' and,
+            optionally, 'dedup' / 'dedup_threshold' (see `dedup_threshold`).
         
     Returns:
-        dict: Normalized trends data.
+        dict: Normalized trends data. Each trend carries both `url` (README contract)
+        and `source_url` (specs/schemas/trend.schema.json, checked by the Judge).
+        Near-duplicates are merged into one trend (see dedup.TrendDeduper).
+    """
+    return _respond(_fetch_upstream(input_data), input_data)
+
+def _fetch_upstream(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The part of a fetch `trend_cache` stores: trends from the sources, merged.
+    No side effects here, so cache hits do not skip any.
     """
     # Mock implementation
+    trends = [
+        {
+            "title": "Agentic AI",
+            "engagement_score": 0.95,
+            "source": "twitter",
+            "url": "https://twitter.com/search?q=agentic+ai",
+            "source_url": "https://twitter.com/search?q=agentic+ai",
+            "sample_items": ["Great tweet about agents"],
+            "metadata": {"region": "global", "language": "en"}
+        },
+        {
+            "title": "Python 3.14",
+            "engagement_score": 0.88,
+            "source": "newsapi",
+            "url": "https://python.org",
+            "source_url": "https://python.org",
+            "sample_items": ["Python 3.14 features announced"],
+            "metadata": {"region": "global", "language": "en"}
+        }
+    ]
+    threshold = dedup_threshold(input_data)
+    if threshold is not None:
+        trends = dedupe_trends(trends, threshold)
+    return {
+        "request_id": f"tf-{uuid.uuid4()}",
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "trends": trends,
+    }
+
+def _respond(fetched: Dict[str, Any], input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The per-call part of a fetch, run on cache hits too: records engagement and
+    attaches history (to copies, so cached trends stay as fetched) and feeds
+    `trend_pool`.
+    """
+    trends = fetched["trends"]
+    if trend_history is not None:
+        trends = attach_history([dict(trend) for trend in trends], input_data)
+    trend_pool.add_many(trends)
+    return {**fetched, "trends": trends}
+
+def trend_cache_key(input_data: Dict[str, Any]) -> str:
+    """
+    Normalize a request so equivalent ones share a cache entry: the query is
+    case/whitespace-insensitive and the order of `sources` does not matter.
+    """
+    normalized = dict(input_data)
+    if "query" in normalized and normalized["query"] is not None:
+        normalized["query"] = " ".join(str(normalized["query"]).lower().split())
+    if normalized.get("sources"):
+        normalized["sources"] = sorted(set(normalized["sources"]))
+    return make_key("fetch_trends", normalized)
+
+
+def fetch_trends_cached(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Same contract as `fetch_trends`, served from `trend_cache` when possible.
+    Concurrent identical requests share a single upstream fetch.
+
+    Args:
+        input_data (dict): Contains 'query', 'sources', 'timeframe', 'limit'.
+
+    Returns:
+        dict: Normalized trends data (shared between callers; do not mutate).
+    """
+    fetched = trend_cache.get_or_compute(
+        trend_cache_key(input_data), lambda: _fetch_upstream(input_data)
+    )
+    return _respond(fetched, input_data)
+
+def fetch_trends_batch(inputs: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Fetch trends for many requests at once (e.g. one query across many regions).
+
+    Equivalent requests are fetched once and share the response, and every request
+    goes through `trend_cache`. A failure affects only the requests it belongs to.
+
+    Args:
+        inputs (list): One `fetch_trends` input object per request.
+
+    Returns:
+        list: One output dict (or the raised Exception) per input, in input order.
+    """
+    by_key: Dict[str, Any] = {}
+    outputs: List[Any] = []
+    for input_data in inputs:
+        key = trend_cache_key(input_data)
+        if key not in by_key:
+            try:
+                fetched = trend_cache.get_or_compute(key, lambda: _fetch_upstream(input_data))
+                by_key[key] = _respond(fetched, input_data)
+            except Exception as e:
+                by_key[key] = e
+        outputs.append(by_key[key])
+    return outputs
+
+# --- Live, streaming fetch -------------------------------------------------
+
+# source -> endpoint URL, e.g. {"twitter": "https://trends.internal/twitter"}.
+SOURCE_ENDPOINTS: Dict[str, str] = json.loads(os.getenv("TREND_SOURCE_URLS", "{}"))
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv("TREND_SOURCE_TIMEOUT", "5"))
+
+def normalize_trend(source: str, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map one upstream item onto the trend contract.
+
+    Accepts the field names the sources actually use (`title`/`name`/`topic`,
+    `engagement_score`/`score`, `url`/`link`) and clamps the score to [0, 1].
+
+    Args:
+        source (str): Source the item came from.
+        raw (dict): Item as returned by the source.
+
+    Returns:
+        dict: Trend with `title`, `engagement_score`, `source`, `url`, `source_url`,
+        `sample_items` and `metadata`.
+    """
+    score = raw.get("engagement_score", raw.get("score", 0.0))
+    url = raw.get("url") or raw.get("link") or ""
+    return {
+        "title": str(raw.get("title") or raw.get("name") or raw.get("topic") or ""),
+        "engagement_score": min(1.0, max(0.0, float(score or 0.0))),
+        "source": source,
+        "url": url,
+        "source_url": url,
+        "sample_items": list(raw.get("sample_items", [])),
+        "metadata": dict(raw.get("metadata", {})),
+    }
+
+
+class TrendStream:
+    """
+    Async iterator over normalized trends from every requested source.
+
+    All sources are queried at once and trends are yielded as soon as their
+    source responds, so consumers can start on the first ones while slower
+    sources are still in flight. Each source has its own timeout; a source that
+    fails or times out yields nothing and is recorded in `errors` instead of
+    failing the whole stream.
+
+    Near-duplicates (the same topic from several sources) are merged. Yielded
+    dicts are never modified afterwards: when a later copy merges into a topic
+    already yielded, the merged topic is yielded again as a new dict with a
+    higher `revision` (1, 2, ...), superseding the earlier one with the same
+    `source` and `title`. `trends` holds the latest copy of each topic, in order
+    of first appearance. `"dedup": false` in the input yields every trend as is.
+    `limit` caps the number of topics (of trends without dedup) across all
+    sources. Requests go through the per-upstream pools of
+    `core.clients.default_clients` unless a `client` is passed in.
+
+    Usage:
+        stream = stream_trends({"query": "ai", "sources": ["twitter", "newsapi"]})
+        async for trend in stream:
+            ...
+        stream.errors  # {"newsapi": "timed out after 5.0s"}
+        stream.trends  # one trend per topic, merged
+    """
+
+    def __init__(
+        self,
+        input_data: Dict[str, Any],
+        client: Optional[httpx.AsyncClient] = None,
+        endpoints: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.input_data = input_data
+        self.client = client
+        self.endpoints = SOURCE_ENDPOINTS if endpoints is None else endpoints
+        self.timeout = DEFAULT_SOURCE_TIMEOUT if timeout is None else timeout
+        self.errors: Dict[str, str] = {}
+        self.trends: List[Dict[str, Any]] = []
+        # id(cluster) -> position in self.trends, for topics yielded so far.
+        self._slots: Dict[int, int] = {}
+        threshold = dedup_threshold(input_data)
+        self.deduper = None if threshold is None else TrendDeduper(threshold)
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self._iterate()
+
+    def _sources(self) -> List[str]:
+        return list(dict.fromkeys(self.input_data.get("sources") or self.endpoints))
+
+    def _timeout_for(self, source: str) -> float:
+        return float((self.input_data.get("timeouts") or {}).get(source, self.timeout))
+
+    async def _fetch_source(self, source: str) -> List[Dict[str, Any]]:
+        endpoint = self.endpoints.get(source)
+        if endpoint is None:
+            raise LookupError("no endpoint configured")
+        client = self.client or default_clients.http_async(endpoint)
+        params = {
+            k: self.input_data[k]
+            for k in ("query", "timeframe", "limit")
+            if self.input_data.get(k) is not None
+        }
+        response = await client.get(endpoint, params=params)
+        response.raise_for_status()
+        body = response.json()
+        items = body.get("trends", []) if isinstance(body, dict) else body
+        return [normalize_trend(source, item) for item in items]
+
+    async def _fetch_with_timeout(self, source: str):
+        timeout = self._timeout_for(source)
+        try:
+            return source, await asyncio.wait_for(self._fetch_source(source), timeout), None
+        except asyncio.TimeoutError:
+            return source, [], f"timed out after {timeout}s"
+        except Exception as e:
+            return source, [], str(e) or type(e).__name__
+
+    def _emit(self, trend: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        The dict to yield for a fetched trend, or None when it yields nothing (a
+        duplicate of a topic past `limit`, or any new topic once `limit` is reached).
+        """
+        limit = self.input_data.get("limit")
+        if self.deduper is None:
+            if limit is not None and len(self.trends) >= int(limit):
+                return None
+            self.trends.append(trend)
+            return trend
+        cluster, is_new = self.deduper.add(trend)
+        slot = self._slots.get(id(cluster))
+        if slot is None:
+            if not is_new or (limit is not None and len(self.trends) >= int(limit)):
+                return None
+            self._slots[id(cluster)] = len(self.trends)
+            self.trends.append(_snapshot(cluster))
+            return self.trends[-1]
+        revision = self.trends[slot].get("revision", 0) + 1
+        self.trends[slot] = {**_snapshot(cluster), "revision": revision}
+        return self.trends[slot]
+
+    async def _iterate(self) -> AsyncIterator[Dict[str, Any]]:
+        pending = [asyncio.ensure_future(self._fetch_with_timeout(s)) for s in self._sources()]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                source, trends, error = await next_done
+                if error is not None:
+                    self.errors[source] = error
+                for trend in trends:
+                    emitted = self._emit(trend)
+                    if emitted is not None:
+                        # Same source and title: replaces the superseded copy in the pool.
+                        trend_pool.add(emitted)
+                        yield emitted
+        finally:
+            # The consumer may stop early; don't leave requests running.
+            for task in pending:
+                task.cancel()
+
+
+def _snapshot(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a deduper cluster with its own lists, so later merges don't show through."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in cluster.items()}
+
+
+def stream_trends(input_data: Dict[str, Any], **kwargs: Any) -> TrendStream:
+    """
+    Stream normalized trends from every requested source as each one responds.
+
+    Args:
+        input_data (dict): Contains 'query', 'sources', 'timeframe', 'limit' and,
+            optionally, 'timeouts' (per-source seconds, overriding the default) and
+            'dedup' / 'dedup_threshold'.
+        **kwargs: `client`, `endpoints`, `timeout` (see TrendStream).
+
+    Returns:
+        TrendStream: Async iterator of trend dicts; failed sources end up in `.errors`.
+    """
+    return TrendStream(input_data, **kwargs)
+
+
+async def fetch_trends_async(input_data: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """
+    Same contract as `fetch_trends`, built from the live sources via `stream_trends`.
+
+    Args:
+        input_data (dict): Contains 'query', 'sources', 'timeframe', 'limit', 'timeouts'.
+
+    Returns:
+        dict: Normalized trends data, plus `errors` ({source: reason}) for sources
+        that failed or timed out.
+    """
+    stream = stream_trends(input_data, **kwargs)
+    async for _ in stream:
+        pass
+    trends = stream.trends
+    if trend_history is not None:
+        # Disk I/O: keep it off the event loop.
+        trends = await asyncio.to_thread(attach_history, trends, input_data)
     return {
         "request_id": f"tf-{uuid.uuid4()}",
         "generated_at": datetime.utcnow().isoformat() + "Z",
+        "trends": trends,
+        "errors": stream.errors,
+    }
+
+def search_trends(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Filter and rank trends against a query with an inverted index (see
+    search.TrendIndex for the query syntax), instead of scanning them.
+
+    Args:
+        input_data (dict): Contains 'query' and optionally 'limit' (default 20),
+            'mode' ("rank": BM25 top-k, the default; "match": boolean filter, oldest
+            first) and 'trends' (a list to search instead of the warm pool of
+            fetched trends).
+
+    Returns:
+        dict: `trends`, best first; in rank mode each carries its `relevance` score.
+
+    Raises:
+        ValueError: If the query does not parse or the mode is unknown.
+    """
+    query = input_data.get("query") or ""
+    limit = int(input_data.get("limit", 20))
+    mode = input_data.get("mode", "rank")
+    index = TrendIndex(input_data["trends"]) if input_data.get("trends") is not None else trend_pool
+    if mode == "match":
+        return {"trends": [dict(trend) for trend in index.match(query, limit)]}
+    if mode != "rank":
+        raise ValueError(f"Unknown search mode {mode!r}; use 'rank' or 'match'")
+    return {
         "trends": [
-            {
-                "title": "Agentic AI",
-                "engagement_score": 0.95,
-                "source": "twitter",
-                "url": "https://twitter.com/search?q=agentic+ai",
-                "sample_items": ["Great tweet about agents"],
-                "metadata": {"region": "global", "language": "en"}
-            },
-            {
-                "title": "Python 3.14",
-                "engagement_score": 0.88,
-                "source": "newsapi",
-                "url": "https://python.org",
-                "sample_items": ["Python 3.14 features announced"],
-                "metadata": {"region": "global", "language": "en"}
-            }
+            dict(trend, relevance=round(score, 6)) for trend, score in index.search(query, limit)
         ]
     }
 
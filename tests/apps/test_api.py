@@ -0,0 +1,157 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from apps.api.app import create_app
+from apps.orchestrator.pipeline import SwarmPipeline
+from apps.orchestrator.service import SwarmService
+from apps.worker.executor import WorkerExecutor
+from core.task_models import Result
+
+
+class GatedWorker(WorkerExecutor):
+    """Holds analyze_trends until the test opens the gate."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def execute_task(self, task):
+        if task.type == "analyze_trends":
+            self.gate.wait(5)
+        return super().execute_task(task)
+
+
+@pytest.fixture
+async def api():
+    async def make(**kwargs):
+        service = SwarmService(**kwargs)
+        await service.start()
+        services.append(service)
+        transport = httpx.ASGITransport(app=create_app(service))
+        client = httpx.AsyncClient(transport=transport, base_url="http://test")
+        clients.append(client)
+        return client
+
+    services, clients = [], []
+    yield make
+    for client in clients:
+        await client.aclose()
+    for service in services:
+        await service.stop()
+
+
+async def test_goals_stream_ndjson_outcomes(api):
+    client = await api()
+
+    response = await client.post(
+        "/goals", json={"goals": [{"description": "Find latest tiktok trends"}]}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["task"]["type"] for line in lines] == ["fetch_trends", "analyze_trends"]
+    assert {line["goal_id"] for line in lines} == {response.headers["x-goal-ids"]}
+    assert all(line["is_valid"] for line in lines)
+    assert [line["goal_complete"] for line in lines] == [False, True]
+    Result.model_validate(lines[0]["result"])
+
+
+async def test_goals_stream_each_result_before_the_goal_finishes():
+    # Driven through raw ASGI: httpx's ASGITransport buffers the whole body.
+    worker = GatedWorker()
+    service = SwarmService(SwarmPipeline(worker=worker))
+    await service.start()
+    sent: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+    body = json.dumps({"goals": [{"description": "Find tiktok trends"}]}).encode()
+    requests = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/goals", "raw_path": b"/goals", "query_string": b"",
+        "root_path": "", "headers": [(b"content-type", b"application/json")],
+        "server": ("test", 80), "client": ("test", 1),
+    }
+    app = asyncio.create_task(create_app(service)(scope, receive, sent.put))
+    try:
+        async def next_line():
+            while True:
+                message = await asyncio.wait_for(sent.get(), timeout=2)
+                if message["type"] == "http.response.body" and message["body"]:
+                    return json.loads(message["body"])
+
+        first = await next_line()  # arrives while analyze_trends is still held
+        assert first["task"]["type"] == "fetch_trends"
+        assert not first["goal_complete"]
+
+        worker.gate.set()
+        second = await next_line()
+        assert second["task"]["type"] == "analyze_trends"
+        assert second["goal_complete"]
+    finally:
+        worker.gate.set()
+        disconnected.set()
+        await asyncio.gather(app, return_exceptions=True)
+        await service.stop()
+
+
+async def test_goals_are_rejected_when_the_service_is_full(api):
+    client = await api(max_open_goals=1)
+
+    response = await client.post(
+        "/goals", json={"goals": [{"description": "a"}, {"description": "b"}]}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+async def test_goals_require_a_description(api):
+    client = await api()
+
+    response = await client.post("/goals", json={"goals": [{"description": ""}]})
+
+    assert response.status_code == 422
+
+
+async def test_trends_returns_the_contract_array(api):
+    client = await api()
+
+    response = await client.get("/trends", params={"platform": "twitter", "limit": 1})
+
+    assert response.status_code == 200
+    trends = response.json()
+    assert isinstance(trends, list) and len(trends) == 1
+    assert {"title", "engagement_score", "url"} <= set(trends[0])
+
+
+async def test_trends_query_filters_and_ranks(api):
+    client = await api()
+
+    response = await client.get("/trends", params={"query": "python -crypto", "limit": 5})
+    bad = await client.get("/trends", params={"query": "(python"})
+
+    assert [t["title"] for t in response.json()] == ["Python 3.14"]
+    assert bad.status_code == 422
+
+
+async def test_health_and_metrics(api):
+    client = await api()
+
+    health = await client.get("/health")
+    metrics = await client.get("/metrics")
+
+    assert health.json() == {"status": "ok", "open_goals": 0}
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "chimera_stage_duration_seconds" in metrics.text
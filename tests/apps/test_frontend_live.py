@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from apps.frontend.live import STAGES, BackgroundSwarm, run_step_by_step
+from apps.orchestrator.service import SwarmService
+from core.task_models import Goal, Result, Task
+
+
+@pytest.fixture
+def swarm():
+    swarms = []
+
+    def make(**kwargs):
+        swarms.append(BackgroundSwarm(SwarmService(**kwargs)))
+        return swarms[-1]
+
+    yield make
+    for s in swarms:
+        s.stop()
+
+
+def wait_for(run, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not run.done and time.monotonic() < deadline:
+        run.poll(timeout=0.05)
+    assert run.done
+
+
+def test_live_run_collects_outcomes_without_blocking_the_caller(swarm):
+    goals = [Goal(description="Find latest tiktok trends"), Goal(description="Write a poem")]
+
+    run = swarm().submit(goals)
+    assert not run.done  # submit returns before anything is judged
+    wait_for(run)
+
+    assert run.error is None
+    assert len(run.outcomes) == 3
+    assert run.goals_complete == 2
+    totals = run.stage_totals_ms()
+    assert set(totals) == set(STAGES)
+    assert totals["execute"] == pytest.approx(sum(o.result.execution_time_ms for o in run.outcomes))
+
+
+def test_live_run_reports_a_rejected_submission(swarm):
+    run = swarm(max_open_goals=1).submit([Goal(description="a"), Goal(description="b")])
+    wait_for(run)
+
+    assert "limit is 1" in str(run.error)
+    assert run.outcomes == []
+
+
+def test_step_by_step_runs_tasks_in_dependency_order_with_inputs_wired():
+    fetch = Task(goal_id="g", type="fetch_trends", description="fetch")
+    analyze = Task(goal_id="g", type="analyze_trends", description="analyze",
+                   depends_on=[fetch.id])
+    executed, shown = [], []
+
+    def execute_task(task):
+        executed.append((task.type, dict(task.input_data)))
+        output = {"trends": ["t1"]} if task.type == "fetch_trends" else {"n": 1}
+        return Result(task_id=task.id, output_data=output, execution_time_ms=1)
+
+    # Listed downstream first: the plan order must not decide the run order.
+    run_step_by_step([analyze, fetch], execute_task, lambda t, r: shown.append(t.type))
+
+    assert executed == [("fetch_trends", {}), ("analyze_trends", {"trends": ["t1"]})]
+    assert shown == ["fetch_trends", "analyze_trends"]
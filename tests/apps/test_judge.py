@@ -1,4 +1,5 @@
 import pytest
+from apps.judge.schemas import SchemaRegistry
 from apps.judge.validator import JudgeValidator
 from core.task_models import Result
 
@@ -45,3 +46,200 @@ def test_judge_validate_trends_empty():
     is_valid = judge.validate_result(result)
     assert is_valid is False
     assert "empty" in result.validation_notes
+
+def test_judge_selects_schema_by_task_type():
+    judge = JudgeValidator()
+    # No "trends" key, so only the task type can route this to the trend contract.
+    result = Result(task_id="t1", output_data={"items": []}, execution_time_ms=10)
+
+    assert judge.validate_result(result) is True
+    assert judge.validate_result(result, task_type="fetch_trends") is False
+    assert "Missing trends" in result.validation_notes
+
+def test_judge_full_report_lists_every_violation():
+    judge = JudgeValidator(full_report=True)
+    result = Result(
+        task_id="t1",
+        output_data={
+            "trends": [
+                {"title": "t1", "engagement_score": 1.5, "source_url": "u1"},
+                {"title": "t2", "engagement_score": 0.5},
+            ]
+        },
+        execution_time_ms=10
+    )
+
+    assert judge.validate_result(result, task_type="fetch_trends") is False
+    assert "trends[0].engagement_score 1.5 out of range" in result.validation_notes
+    assert "Missing source_url in trends[1]" in result.validation_notes
+
+def test_judge_fast_path_stops_at_first_violation():
+    judge = JudgeValidator()
+    result = Result(
+        task_id="t1",
+        output_data={
+            "trends": [
+                {"title": "t1", "engagement_score": 1.5, "source_url": "u1"},
+                {"title": "t2", "engagement_score": 0.5},
+            ]
+        },
+        execution_time_ms=10
+    )
+
+    assert judge.validate_result(result, task_type="fetch_trends") is False
+    assert "source_url" not in result.validation_notes
+
+def test_schema_registry_compiles_once():
+    registry = SchemaRegistry()
+
+    first = registry.for_task_type("fetch_trends")
+
+    assert registry.for_task_type("fetch_trends") is first
+    assert registry.get(first.schema_id, first.version) is first
+    assert registry.for_task_type("generic_research") is None
+
+def _burst():
+    trend = {"title": "t", "engagement_score": 0.5, "source_url": "u"}
+
+    def result(task_id, output_data):
+        return Result(task_id=task_id, output_data=output_data, execution_time_ms=1)
+
+    return [
+        (result("ok", {"trends": [trend]}), None),
+        (result("range", {"trends": [trend, dict(trend, engagement_score=1.5)]}), None),
+        (result("empty-list", {"trends": []}), None),
+        (result("missing-url", {"trends": [{"title": "t", "engagement_score": 0.1}]}), None),
+        (result("missing-key", {"items": []}), "fetch_trends"),
+        (result("worker-error", {"error": "boom"}), None),
+        (result("nothing", {}), None),
+        (result("generic", {"message": "done"}), "generic_research"),
+    ]
+
+def test_validate_many_matches_validate_result():
+    judge = JudgeValidator()
+    burst = _burst()
+
+    verdict = judge.validate_many([r for r, _ in burst], task_types=[t for _, t in burst])
+
+    expected = []
+    for result, task_type in _burst():
+        is_valid = judge.validate_result(result, task_type=task_type)
+        expected.append((is_valid, result.validation_notes))
+    assert verdict.valid.dtype == bool
+    assert list(verdict) == [ok for ok, _ in expected]
+    assert verdict.failures() == [1, 2, 3, 4, 5, 6]
+    assert verdict.notes == {i: note for i, (ok, note) in enumerate(expected) if not ok}
+    assert verdict.notes[1] == "trends[1].engagement_score 1.5 out of range [0,1]."
+    assert not verdict.all_valid
+
+def test_validate_many_only_marks_results_when_asked():
+    judge = JudgeValidator()
+    results = [r for r, _ in _burst()[:2]]
+
+    judge.validate_many(results)
+    assert all(r.is_valid is None for r in results)
+
+    judge.validate_many(results, mark=True)
+    assert [r.is_valid for r in results] == [True, False]
+    assert results[0].validation_notes == "Output matches chimera/trend v1.0.0."
+
+def test_validate_many_runs_full_checks_on_a_pool():
+    from concurrent.futures import ThreadPoolExecutor
+
+    trend = {"title": "t", "engagement_score": 0.5, "source_url": "u"}
+    results = [
+        Result(task_id=str(i), output_data={"trends": [trend] * 3}, execution_time_ms=1)
+        for i in range(40)
+    ]
+    bad_trend = {"title": 1, "engagement_score": 0.2, "source_url": "u"}
+    results[7].output_data = {"trends": [trend, bad_trend]}
+
+    # Full reports always need the full validator.
+    criteria = {"full_report": True}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        threaded = JudgeValidator().validate_many(results, criteria=criteria, executor=pool)
+    judge = JudgeValidator(max_workers=2, parallel_threshold=10)
+    try:
+        in_processes = judge.validate_many(results, criteria=criteria)
+    finally:
+        judge.shutdown()
+
+    for verdict in (threaded, in_processes):
+        assert verdict.failures() == [7]
+        assert verdict.notes[7].startswith("trends[1].title:")
+
+def test_validate_many_full_report_lists_every_violation():
+    judge = JudgeValidator()
+    result = Result(task_id="t", output_data={"trends": [
+        {"title": "a", "engagement_score": 2.0, "source_url": "u"},
+        {"title": "b", "engagement_score": -1.0},
+    ]}, execution_time_ms=1)
+
+    verdict = judge.validate_many([result], criteria={"full_report": True})
+
+    assert "trends[0].engagement_score 2.0 out of range" in verdict.notes[0]
+    assert "trends[1].engagement_score -1.0 out of range" in verdict.notes[0]
+    assert "Missing source_url in trends[1]." in verdict.notes[0]
+
+def test_fast_rules_give_the_first_error_jsonschema_gives():
+    from apps.judge.schemas import default_registry, describe_error
+
+    schema = default_registry.for_task_type("fetch_trends")
+    trend = {"title": "t", "engagement_score": 0.5, "source_url": "u"}
+    documents = [
+        {"trends": [trend]},
+        {"trends": "nope"},
+        {"trends": [trend, "x", dict(trend, engagement_score=9)]},
+        {"trends": [dict(trend, engagement_score=9), {"title": 1}]},
+        {"trends": [{"title": 1, "engagement_score": 9, "source_url": "u"}]},
+        {"trends": [dict(trend, engagement_score=True)]},
+        {"trends": [dict(trend, engagement_score=-0.5), dict(trend, title=None)]},
+        {"trends": [], "extra": 1},
+    ]
+
+    failed = schema.fast_rules.check(documents)
+
+    for i, document in enumerate(documents):
+        error = schema.first_error(document)
+        assert failed.get(i) == (describe_error(error) if error else None)
+
+def test_unsupported_schemas_fall_back_to_the_full_validator(tmp_path):
+    import json
+    from apps.judge.schemas import SchemaRegistry
+
+    (tmp_path / "slug.schema.json").write_text(json.dumps({
+        "$id": "test/slug", "version": "1", "type": "object",
+        "properties": {"slug": {"type": "string", "pattern": "^[a-z]+$"}},
+    }))
+    registry = SchemaRegistry(tmp_path, {"slugify": "slug.schema.json"})
+    assert registry.load("slug.schema.json").fast_rules is None
+
+    results = [Result(task_id=str(i), output_data={"slug": slug}, execution_time_ms=1)
+               for i, slug in enumerate(["ok", "Not OK"])]
+    verdict = JudgeValidator(registry).validate_many(results, task_types=["slugify"] * 2)
+
+    assert verdict.failures() == [1]
+    assert verdict.notes[1].startswith("slug:")
+
+
+def test_validate_many_compares_huge_ints_exactly():
+    from apps.judge.schemas import default_registry, describe_error
+
+    judge = JudgeValidator()
+    trend = {"title": "t", "engagement_score": 0.5, "source_url": "u"}
+    too_big_for_a_float = 10**400
+    outputs = [
+        {"trends": [dict(trend, engagement_score=too_big_for_a_float)]},
+        {"trends": [dict(trend, engagement_score=-too_big_for_a_float)]},
+        {"trends": [dict(trend, engagement_score=2**53 + 1)]},
+        {"trends": [dict(trend, engagement_score=1)]},
+    ]
+    results = [Result(task_id=f"r{i}", output_data=o, execution_time_ms=1)
+               for i, o in enumerate(outputs)]
+
+    verdict = judge.validate_many(results)
+
+    schema = default_registry.for_task_type("fetch_trends")
+    assert list(verdict) == [False, False, False, True]
+    for i, output in enumerate(outputs[:3]):
+        assert verdict.notes[i] == describe_error(schema.first_error(output))
@@ -0,0 +1,223 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import pytest
+from apps.orchestrator.pipeline import SwarmPipeline
+from apps.orchestrator.schemas import PipelineConfig
+from apps.planner.service import PlannerService
+from apps.worker.executor import WorkerExecutor
+from core.store import SwarmStore
+from core.task_models import Goal, TaskStatus
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class SlowWorker(WorkerExecutor):
+    def execute_task(self, task):
+        time.sleep(0.1)
+        return super().execute_task(task)
+
+class BrokenPlanner:
+    def create_plan(self, goal):
+        raise RuntimeError("planner down")
+
+async def test_pipeline_processes_every_task():
+    pipeline = SwarmPipeline()
+    goals = [Goal(description="Find latest tiktok trends") for _ in range(5)]
+
+    outcomes = await pipeline.run(goals)
+
+    assert len(outcomes) == 10
+    assert {o.goal_id for o in outcomes} == {g.id for g in goals}
+    assert all(o.is_valid for o in outcomes)
+    assert all(o.task.status == TaskStatus.COMPLETED for o in outcomes)
+
+async def test_pipeline_runs_tasks_concurrently():
+    pipeline = SwarmPipeline(
+        worker=SlowWorker(),
+        config=PipelineConfig(worker_concurrency=8, queue_size=4),
+    )
+    goals = [Goal(description="Write a poem") for _ in range(8)]
+
+    start = time.perf_counter()
+    outcomes = await pipeline.run(goals)
+    elapsed = time.perf_counter() - start
+
+    assert len(outcomes) == 8
+    # Sequential execution would take at least 0.8s.
+    assert elapsed < 0.5
+
+async def test_pipeline_surfaces_stage_errors():
+    pipeline = SwarmPipeline(planner=BrokenPlanner())
+
+    with pytest.raises(RuntimeError, match="planner down"):
+        await pipeline.run([Goal(description="Write a poem")])
+
+async def test_pipeline_feeds_fetched_trends_into_analysis():
+    pipeline = SwarmPipeline()
+
+    outcomes = await pipeline.run([Goal(description="Find latest tiktok trends")])
+
+    by_type = {o.task.type: o for o in outcomes}
+    fetch, analyze = by_type["fetch_trends"], by_type["analyze_trends"]
+    assert analyze.task.depends_on == [fetch.task.id]
+    assert analyze.task.input_data["trends"] is fetch.result.output_data["trends"]
+    assert analyze.result.output_data["total_trends"] == len(fetch.result.output_data["trends"])
+    assert analyze.result.output_data["matching_trends"] > 0
+
+async def test_pipeline_flags_the_last_outcome_of_each_goal():
+    goals = [Goal(description="Find latest tiktok trends"), Goal(description="Write a poem")]
+
+    outcomes = await SwarmPipeline().run(goals)
+
+    for goal in goals:
+        flags = [o.goal_complete for o in outcomes if o.goal_id == goal.id]
+        assert flags[-1] and not any(flags[:-1])
+
+async def test_pipeline_reports_measured_stage_timings():
+    outcomes = await SwarmPipeline().run([Goal(description="Write a poem")])
+
+    (outcome,) = outcomes
+    assert set(outcome.timings_ms) == {"plan", "queue_wait", "execute", "judge"}
+    assert outcome.timings_ms["execute"] == outcome.result.execution_time_ms
+    assert all(ms >= 0 for ms in outcome.timings_ms.values())
+
+async def test_pipeline_persists_goals_tasks_and_results(tmp_path):
+    store = SwarmStore(str(tmp_path / "swarm.db"))
+    goals = [Goal(description="Find latest tiktok trends") for _ in range(3)]
+
+    outcomes = await SwarmPipeline(store=store).run(goals)
+    store.flush()
+
+    assert store.get_goal(goals[0].id) == goals[0]
+    assert store.count_tasks(TaskStatus.COMPLETED) == len(outcomes) == 6
+    persisted = {r.id: r for r in store.iter_results(goal_id=goals[1].id)}
+    assert persisted == {o.result.id: o.result for o in outcomes if o.goal_id == goals[1].id}
+    store.close()
+
+async def test_pipeline_keeps_running_when_the_store_fails(tmp_path):
+    store = SwarmStore(str(tmp_path / "swarm.db"))
+    store.close()  # every save now raises
+
+    outcomes = await SwarmPipeline(store=store).run([Goal(description="Write a poem")])
+
+    assert len(outcomes) == 1 and outcomes[0].is_valid
+
+def test_default_store_is_committed_when_the_process_exits(tmp_path):
+    path = tmp_path / "swarm.db"
+    script = (
+        "import asyncio\n"
+        "from apps.orchestrator.pipeline import SwarmPipeline\n"
+        "from core.task_models import Goal\n"
+        "asyncio.run(SwarmPipeline().run([Goal(description='Write a poem')]))\n"
+    )
+    env = dict(os.environ, CHIMERA_DB_PATH=str(path), CHIMERA_DB_FLUSH_INTERVAL="5")
+    subprocess.run([sys.executable, "-c", script], env=env, cwd=ROOT, check=True, timeout=60)
+
+    store = SwarmStore(str(path))
+    try:
+        assert store.count_tasks(TaskStatus.COMPLETED) == 1
+        assert len(list(store.iter_goals())) == 1
+    finally:
+        store.close()
+
+async def test_swarm_service_routes_outcomes_of_concurrent_submissions():
+    from apps.orchestrator.service import ServiceBusy, SwarmService
+
+    service = SwarmService(max_open_goals=300)
+    await service.start()
+    try:
+        batches = [[Goal(description="Find latest tiktok trends")] for _ in range(200)]
+
+        async def collect(goals):
+            return [o async for o in service.submit(goals)]
+
+        results = await asyncio.gather(*(collect(goals) for goals in batches))
+
+        for goals, outcomes in zip(batches, results):
+            assert {o.goal_id for o in outcomes} == {goals[0].id}
+            assert [o.task.type for o in outcomes] == ["fetch_trends", "analyze_trends"]
+        assert service.open_goals == 0
+        with pytest.raises(ServiceBusy):
+            service.submit([Goal(description="x") for _ in range(301)])
+    finally:
+        await service.stop()
+
+async def test_swarm_service_survives_stage_failures():
+    from apps.orchestrator.service import SwarmService
+
+    class FlakyPlanner(PlannerService):
+        def create_plan(self, goal):
+            if goal.description == "boom":
+                raise RuntimeError("planner down")
+            return super().create_plan(goal)
+
+    service = SwarmService(SwarmPipeline(planner=FlakyPlanner()))
+    await service.start()
+    try:
+        with pytest.raises(RuntimeError, match="planner down"):
+            [o async for o in service.submit([Goal(description="boom")])]
+        outcomes = [o async for o in service.submit([Goal(description="Write a poem")])]
+        assert len(outcomes) == 1 and outcomes[0].is_valid
+    finally:
+        await service.stop()
+
+async def test_swarm_service_fails_goals_queued_behind_a_stage_failure():
+    from apps.orchestrator.service import SwarmService
+
+    planned = []
+
+    class FlakyPlanner(PlannerService):
+        def create_plan(self, goal):
+            planned.append(goal.description)
+            if goal.description == "boom":
+                raise RuntimeError("planner down")
+            return super().create_plan(goal)
+
+    config = PipelineConfig(planner_concurrency=1, queue_size=1)
+    service = SwarmService(SwarmPipeline(planner=FlakyPlanner(), config=config))
+    await service.start()
+    try:
+        # Submitted before the runner pulls anything, so "queued" waits in the inbox.
+        failing = service.submit([Goal(description="boom")])
+        queued = service.submit([Goal(description="queued") for _ in range(50)])
+        for outcomes in (failing, queued):
+            with pytest.raises(RuntimeError, match="planner down"):
+                await asyncio.wait_for(_collect(outcomes), timeout=5)
+        assert service.open_goals == 0 and service._inbox.empty()
+
+        outcomes = [o async for o in service.submit([Goal(description="Write a poem")])]
+        assert len(outcomes) == 1 and outcomes[0].is_valid
+        # The failed pipeline's accepted Goals are dropped, not re-run for nobody.
+        assert planned == ["boom", "Write a poem"]
+    finally:
+        await service.stop()
+
+async def test_swarm_service_fails_dependents_of_a_task_that_raises():
+    from apps.orchestrator.service import SwarmService
+
+    class CrashingWorker(WorkerExecutor):
+        def execute_task(self, task):
+            if task.type == "fetch_trends":
+                raise RuntimeError("worker crashed")
+            return super().execute_task(task)
+
+        async def execute_task_async(self, task):
+            return self.execute_task(task)
+
+    service = SwarmService(SwarmPipeline(worker=CrashingWorker()))
+    await service.start()
+    try:
+        goals = [Goal(description="Find latest tiktok trends")]
+        outcomes = await asyncio.wait_for(_collect(service.submit(goals)), timeout=5)
+    finally:
+        await service.stop()
+
+    assert [o.task.type for o in outcomes] == ["fetch_trends", "analyze_trends"]
+    assert all(o.task.status == TaskStatus.FAILED for o in outcomes)
+    assert outcomes[0].result.output_data["error"] == "RuntimeError: worker crashed"
+    assert outcomes[-1].goal_complete
+
+async def _collect(outcomes):
+    return [o async for o in outcomes]
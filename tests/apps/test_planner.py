@@ -22,3 +22,68 @@ def test_planner_create_plan_generic():
     assert len(tasks) == 1
     assert tasks[0].type == "generic_research"
     assert tasks[0].goal_id == goal.id
+
+def test_goal_signature_lifts_platform_and_region():
+    from apps.planner.service import goal_signature
+
+    a = goal_signature(Goal(description="Fetch latest TikTok trends in the US."))
+    b = goal_signature(Goal(description="fetch latest instagram trends in the UK"))
+    c = goal_signature(Goal(description="Help us find youtube trends"))
+
+    assert a.key == b.key == "fetch latest {platform} trends in the {region}"
+    assert a.params == {"platform": "tiktok", "region": "US"}
+    assert b.params == {"platform": "instagram", "region": "UK"}
+    assert c.params == {"platform": "youtube"}
+
+def test_recurring_goals_reuse_the_compiled_plan(monkeypatch):
+    planner = PlannerService()
+    calls = []
+    original = planner._plan
+    monkeypatch.setattr(
+        planner, "_plan", lambda goal, params: calls.append(goal) or original(goal, params)
+    )
+
+    first = planner.create_plan(Goal(description="Fetch TikTok trends in the US"))
+    goal = Goal(description="Fetch Instagram trends in the UK")
+    second = planner.create_plan(goal)
+
+    assert len(calls) == 1
+    assert [t.type for t in second] == ["fetch_trends", "analyze_trends"]
+    assert second[0].input_data == {"platform": "instagram", "region": "UK"}
+    assert second[1].input_data == {"min_engagement": 0.5}
+    assert all(t.goal_id == goal.id for t in second)
+    assert {t.id for t in first}.isdisjoint(t.id for t in second)
+    assert planner.cache_stats().hits == 1
+
+def test_cached_generic_plan_uses_each_goals_wording():
+    planner = PlannerService()
+
+    planner.create_plan(Goal(description="Write a poem"))
+    [task] = planner.create_plan(Goal(description="write a POEM!"))
+
+    assert task.description == "Research: write a POEM!"
+
+def test_plan_cache_invalidation_and_ttl():
+    from core.cache import TTLCache
+
+    now = [0.0]
+    planner = PlannerService(plan_cache=TTLCache(ttl=60, clock=lambda: now[0]))
+    goal = Goal(description="Fetch TikTok trends")
+
+    planner.create_plan(goal)
+    planner.create_plan(goal)
+    planner.invalidate(goal)
+    planner.create_plan(goal)
+    now[0] += 61
+    planner.create_plan(goal)
+
+    stats = planner.cache_stats()
+    assert (stats.hits, stats.misses, stats.expirations) == (1, 3, 1)
+
+def test_trend_plan_links_analysis_to_fetch_in_every_instance():
+    planner = PlannerService()
+
+    for goal in (Goal(description="Fetch TikTok trends"), Goal(description="Fetch Twitter trends")):
+        fetch, analyze = planner.create_plan(goal)
+        assert fetch.depends_on == []
+        assert analyze.depends_on == [fetch.id]
@@ -0,0 +1,42 @@
+from apps.worker.executor import WorkerExecutor
+from apps.worker.registry import SkillRegistry
+from core.task_models import Task, TaskStatus
+
+def test_registry_discovers_skills_without_loading_them():
+    registry = SkillRegistry()
+    registry.discover()
+
+    assert {"fetch_trends", "generate_content", "publish_content"} <= set(registry.task_types())
+    assert all(not status.loaded for status in registry.report())
+
+def test_registry_loads_only_the_requested_skill():
+    registry = SkillRegistry()
+    registry.discover()
+
+    handler = registry.get("publish_content")
+
+    assert handler.__name__ == "skill_publisher"
+    loaded = {s.module: s for s in registry.report() if s.loaded}
+    assert list(loaded) == ["skills.publisher.skill"]
+    assert loaded["skills.publisher.skill"].import_time_ms >= 0
+
+def test_registry_unknown_type_returns_none():
+    registry = SkillRegistry()
+    registry.discover()
+
+    assert registry.get("unknown_type") is None
+    assert "unknown_type" not in registry
+
+def test_worker_dispatches_to_registered_skill():
+    worker = WorkerExecutor()
+    task = Task(
+        goal_id="g1",
+        type="generate_content",
+        description="write",
+        input_data={"prompt": "Agentic AI"}
+    )
+
+    result = worker.execute_task(task)
+
+    assert task.status == TaskStatus.COMPLETED
+    assert "Agentic AI" in result.output_data["content"]
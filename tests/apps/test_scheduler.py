@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+
+from apps.orchestrator.scheduler import DagScheduler, TaskGraph
+from core.task_models import Result, Task, TaskStatus
+
+
+def make_task(name, depends_on=(), **input_data):
+    return Task(id=name, goal_id="g1", type=name, description=name,
+                input_data=input_data, depends_on=list(depends_on))
+
+
+def recording_executor(delay=0.05, fail=()):
+    log = []
+
+    async def execute(task):
+        log.append(("start", task.id, time.perf_counter()))
+        await asyncio.sleep(delay)
+        log.append(("end", task.id, time.perf_counter()))
+        if task.id in fail:
+            task.status = TaskStatus.FAILED
+            return Result(task_id=task.id, output_data={"error": "boom"}, execution_time_ms=0)
+        task.status = TaskStatus.COMPLETED
+        output = {f"{task.id}_out": [task.id]}
+        return Result(task_id=task.id, output_data=output, execution_time_ms=0)
+
+    return execute, log
+
+
+def test_graph_rejects_unknown_dependencies_and_cycles():
+    with pytest.raises(ValueError, match="unknown"):
+        TaskGraph([make_task("a", ["missing"])])
+    with pytest.raises(ValueError, match="cycle"):
+        TaskGraph([make_task("a", ["b"]), make_task("b", ["a"])])
+
+
+async def test_independent_branches_run_in_parallel():
+    # a -> (b, c) -> d
+    tasks = [
+        make_task("a"), make_task("b", ["a"]), make_task("c", ["a"]), make_task("d", ["b", "c"])
+    ]
+    execute, log = recording_executor(delay=0.1)
+
+    start = time.perf_counter()
+    completed = await DagScheduler(execute, max_concurrency=4).run(tasks)
+    elapsed = time.perf_counter() - start
+
+    order = [task.id for task, _ in completed]
+    assert order[0] == "a" and order[-1] == "d" and set(order[1:3]) == {"b", "c"}
+    assert elapsed < 0.38  # critical path is 3 steps; sequential would be 4
+    starts = {name: t for kind, name, t in log if kind == "start"}
+    ends = {name: t for kind, name, t in log if kind == "end"}
+    assert starts["b"] >= ends["a"] and starts["d"] >= max(ends["b"], ends["c"])
+
+
+async def test_upstream_outputs_are_passed_by_reference():
+    tasks = [make_task("fetch"), make_task("analyze", ["fetch"], fetch_out="explicit wins"),
+             make_task("report", ["fetch"])]
+    execute, _ = recording_executor(delay=0)
+
+    results = {task.id: result for task, result in await DagScheduler(execute, 2).run(tasks)}
+
+    assert tasks[1].input_data["fetch_out"] == "explicit wins"
+    assert tasks[2].input_data["fetch_out"] is results["fetch"].output_data["fetch_out"]
+
+
+async def test_failed_task_skips_everything_downstream():
+    tasks = [make_task("a"), make_task("b", ["a"]), make_task("c", ["b"]), make_task("x")]
+    execute, log = recording_executor(delay=0, fail={"a"})
+
+    results = {task.id: result for task, result in await DagScheduler(execute, 2).run(tasks)}
+
+    assert {name for kind, name, _ in log if kind == "start"} == {"a", "x"}
+    assert tasks[2].status == TaskStatus.FAILED
+    assert results["c"].output_data["error"] == "Skipped: dependency b failed"
+    assert tasks[3].status == TaskStatus.COMPLETED
+
+
+async def test_concurrency_limit_is_respected():
+    tasks = [make_task(f"t{i}") for i in range(6)]
+    running, peak = 0, 0
+
+    async def execute(task):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return Result(task_id=task.id, output_data={}, execution_time_ms=0)
+
+    await DagScheduler(execute, max_concurrency=2).run(tasks)
+
+    assert peak == 2
+
+
+async def test_executor_errors_fail_the_task_and_skip_its_dependents():
+    tasks = [make_task("a"), make_task("b", ["a"]), make_task("x")]
+
+    async def execute(task):
+        if task.id == "a":
+            raise RuntimeError("executor down")
+        task.status = TaskStatus.COMPLETED
+        return Result(task_id=task.id, output_data={}, execution_time_ms=0)
+
+    results = {task.id: result for task, result in await DagScheduler(execute, 2).run(tasks)}
+
+    assert results["a"].output_data["error"] == "RuntimeError: executor down"
+    assert results["b"].output_data["error"] == "Skipped: dependency a failed"
+    assert tasks[1].status == TaskStatus.FAILED
+    assert tasks[2].status == TaskStatus.COMPLETED
+
+
+async def test_watch_raises_scheduler_errors_without_drain():
+    async def on_result(task, result):
+        raise RuntimeError("sink down")
+
+    execute, _ = recording_executor(delay=0)
+    scheduler = DagScheduler(execute, 2, on_result=on_result)
+    await scheduler.submit(TaskGraph([make_task("a")]))
+
+    with pytest.raises(RuntimeError, match="sink down"):
+        await asyncio.wait_for(scheduler.watch(asyncio.Event().wait()), timeout=1)
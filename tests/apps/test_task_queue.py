@@ -0,0 +1,177 @@
+import fakeredis
+import pytest
+
+from apps.worker.queue import TaskQueue, InMemoryQueueBackend, RedisQueueBackend
+from core.task_models import Task, Result
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_tasks(n):
+    return [Task(goal_id="g1", type="fetch_trends", description=f"t{i}") for i in range(n)]
+
+@pytest.fixture
+def redis_backend():
+    # fakeredis runs the claim script with a real Lua interpreter (lupa).
+    return RedisQueueBackend(fakeredis.FakeRedis(decode_responses=True), namespace="test")
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "redis":
+        return request.getfixturevalue("redis_backend")
+    return InMemoryQueueBackend()
+
+def test_queue_claims_in_batches(backend):
+    queue = TaskQueue(backend)
+    tasks = make_tasks(5)
+    queue.enqueue(tasks)
+
+    first = queue.claim(batch_size=3)
+    second = queue.claim(batch_size=3)
+
+    assert [t.id for t in first] == [t.id for t in tasks[:3]]
+    assert [t.id for t in second] == [t.id for t in tasks[3:]]
+    assert queue.claim(batch_size=3) == []
+
+def test_queue_round_trips_task_fields(backend):
+    queue = TaskQueue(backend)
+    task = Task(goal_id="g1", type="fetch_trends", description="d", input_data={"region": "US"})
+    queue.enqueue([task])
+
+    claimed = queue.claim()[0]
+
+    assert claimed.id == task.id
+    assert claimed.input_data == {"region": "US"}
+    assert claimed.created_at == task.created_at
+
+def test_acked_tasks_are_not_redelivered(backend):
+    clock = FakeClock()
+    queue = TaskQueue(backend, visibility_timeout=10, clock=clock)
+    queue.enqueue(make_tasks(2))
+
+    claimed = queue.claim(batch_size=2)
+    assert queue.ack(claimed) == 2
+
+    clock.now += 60
+    assert queue.claim(batch_size=2) == []
+
+def test_expired_tasks_are_redelivered(backend):
+    clock = FakeClock()
+    queue = TaskQueue(backend, visibility_timeout=10, clock=clock)
+    tasks = make_tasks(2)
+    queue.enqueue(tasks)
+
+    queue.claim(batch_size=2)  # worker dies without acking
+    clock.now += 5
+    assert queue.claim(batch_size=2) == []
+
+    clock.now += 10
+    redelivered = queue.claim(batch_size=2)
+    assert {t.id for t in redelivered} == {t.id for t in tasks}
+
+def test_results_are_published_and_collected(backend):
+    queue = TaskQueue(backend)
+    results = [
+        Result(task_id=f"t{i}", output_data={"i": i}, execution_time_ms=1.0) for i in range(3)
+    ]
+
+    queue.publish_results(results)
+    collected = queue.collect_results(batch_size=10)
+
+    assert [r.task_id for r in collected] == ["t0", "t1", "t2"]
+    assert queue.collect_results() == []
+
+def test_claim_records_feed_the_worker_directly():
+    from apps.worker.executor import WorkerExecutor
+    from core.task_models import TaskStatus
+
+    queue = TaskQueue()
+    queue.enqueue(make_tasks(3))
+
+    records = queue.claim_records(batch_size=3)
+    results = WorkerExecutor().execute_batch(records)
+
+    assert [r.task_id for r in results] == [t.id for t in records]
+    assert all(t.status == TaskStatus.COMPLETED for t in records)
+    assert queue.ack(records) == 3
+
+def test_result_records_go_from_worker_to_judge_without_models():
+    from apps.worker.executor import WorkerExecutor
+    from core.records import ResultRecord
+
+    queue = TaskQueue()
+    queue.enqueue(make_tasks(2))
+
+    records = WorkerExecutor().execute_batch_records(queue.claim_records(batch_size=2))
+    queue.publish_results(records)
+    collected = queue.collect_result_records(batch_size=10)
+
+    assert all(isinstance(r, ResultRecord) for r in records + collected)
+    assert [r.id for r in collected] == [r.id for r in records]
+
+def test_redis_push_stores_payloads_and_queues_ids_in_order(redis_backend):
+    redis_backend.push([("a", "pa"), ("b", "pb")])
+    redis_backend.push([])
+
+    client = redis_backend.client
+    assert client.lrange("test:pending", 0, -1) == ["a", "b"]
+    assert client.hgetall("test:payload") == {"a": "pa", "b": "pb"}
+    assert redis_backend.pending_count() == 2
+
+def test_redis_claim_script_marks_claimed_ids_in_flight_until_the_deadline(redis_backend):
+    redis_backend.push([("a", "pa"), ("b", "pb"), ("c", "pc")])
+
+    assert redis_backend.claim(2, now=100.0, deadline=130.0) == [("a", "pa"), ("b", "pb")]
+
+    client = redis_backend.client
+    assert client.zrange("test:inflight", 0, -1, withscores=True) == [("a", 130.0), ("b", 130.0)]
+    assert client.lrange("test:pending", 0, -1) == ["c"]
+    # Not yet expired: only what is still pending is handed out.
+    assert redis_backend.claim(5, now=129.0, deadline=159.0) == [("c", "pc")]
+    assert redis_backend.claim(5, now=129.0, deadline=159.0) == []
+
+def test_redis_claim_script_redelivers_expired_ids_first(redis_backend):
+    redis_backend.push([("a", "pa"), ("b", "pb")])
+    redis_backend.claim(1, now=100.0, deadline=110.0)
+
+    assert redis_backend.claim(2, now=110.0, deadline=140.0) == [("a", "pa"), ("b", "pb")]
+    assert redis_backend.client.zscore("test:inflight", "a") == 140.0
+
+def test_redis_claim_script_drops_ids_acked_after_redelivery(redis_backend):
+    redis_backend.push([("a", "pa"), ("b", "pb")])
+    redis_backend.claim(2, now=100.0, deadline=110.0)
+    # Both expire and go back on the queue; a second worker takes one of them ("b")...
+    assert redis_backend.claim(1, now=111.0, deadline=141.0) == [("b", "pb")]
+    # ...while the first worker finally acks "a", which is queued again by now.
+    assert redis_backend.ack(["a"]) == 0
+    assert redis_backend.client.lrange("test:pending", 0, -1) == ["a"]
+
+    assert redis_backend.claim(5, now=120.0, deadline=150.0) == []
+    assert redis_backend.pending_count() == 0
+
+def test_redis_ack_removes_in_flight_ids_and_payloads_in_one_pipeline(redis_backend):
+    redis_backend.push([("a", "pa"), ("b", "pb"), ("c", "pc")])
+    redis_backend.claim(2, now=100.0, deadline=130.0)
+
+    assert redis_backend.ack(["a", "b", "c", "missing"]) == 2  # only a and b were in flight
+    assert redis_backend.ack([]) == 0
+
+    client = redis_backend.client
+    assert client.zcard("test:inflight") == 0
+    assert client.hgetall("test:payload") == {}
+    # "c" is still queued, but without a payload it is never handed out.
+    assert redis_backend.claim(5, now=200.0, deadline=230.0) == []
+
+def test_redis_pop_results_returns_at_most_count_in_order(redis_backend):
+    assert redis_backend.pop_results(5) == []
+
+    redis_backend.push_results(["r0", "r1", "r2"])
+    redis_backend.push_results([])
+
+    assert redis_backend.pop_results(2) == ["r0", "r1"]
+    assert redis_backend.pop_results(5) == ["r2"]
+    assert redis_backend.pop_results(5) == []
@@ -1,5 +1,7 @@
 import pytest
 from apps.worker.executor import WorkerExecutor
+from apps.worker.registry import SkillRegistry
+from apps.worker.schemas import ExecutionMode
 from core.task_models import Task, TaskStatus
 
 def test_worker_execute_fetch_trends():
@@ -30,3 +32,216 @@ def test_worker_execute_generic():
     
     assert task.status == TaskStatus.COMPLETED
     assert "message" in result.output_data
+
+def test_worker_runs_task_types_in_configured_pools():
+    worker = WorkerExecutor(
+        execution_modes={
+            "analyze_trends": ExecutionMode.PROCESS,
+            "fetch_trends": ExecutionMode.THREAD,
+        },
+        max_processes=2,
+    )
+    tasks = [
+        Task(goal_id="g1", type="analyze_trends", description="analyze"),
+        Task(goal_id="g1", type="fetch_trends", description="fetch"),
+        Task(goal_id="g1", type="unknown_type", description="inline"),
+    ]
+
+    with worker:
+        results = [f.result(timeout=30) for f in [worker.submit(t) for t in tasks]]
+
+    assert "analysis_report" in results[0].output_data
+    assert "trends" in results[1].output_data
+    assert "message" in results[2].output_data
+    assert [r.task_id for r in results] == [t.id for t in tasks]
+    assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+def test_worker_reports_failures_from_pooled_handlers():
+    def failing_skill(input_data):
+        raise ValueError("upstream unavailable")
+
+    registry = SkillRegistry()
+    registry.register("fetch_trends", failing_skill)
+    worker = WorkerExecutor(
+        execution_modes={"fetch_trends": ExecutionMode.THREAD}, registry=registry
+    )
+    task = Task(goal_id="g1", type="fetch_trends", description="fetch")
+
+    with worker:
+        result = worker.submit(task).result(timeout=30)
+
+    assert task.status == TaskStatus.FAILED
+    assert result.output_data == {"error": "upstream unavailable"}
+
+def test_worker_execute_batch_preserves_order_and_uses_batch_form():
+    calls = []
+
+    def fetch_batch(inputs):
+        calls.append(len(inputs))
+        return [{"trends": [{"region": i["region"]}]} for i in inputs]
+
+    registry = SkillRegistry()
+    registry.register("fetch_trends", lambda i: pytest.fail("batch form should be used"))
+    registry.register_batch("fetch_trends", fetch_batch)
+    worker = WorkerExecutor(registry=registry)
+    tasks = [
+        Task(goal_id="g1", type="fetch_trends", description="f", input_data={"region": "US"}),
+        Task(goal_id="g1", type="unknown_type", description="generic"),
+        Task(goal_id="g1", type="fetch_trends", description="f", input_data={"region": "EU"}),
+    ]
+
+    results = worker.execute_batch(tasks)
+
+    assert calls == [2]
+    assert [r.task_id for r in results] == [t.id for t in tasks]
+    assert results[0].output_data["trends"][0]["region"] == "US"
+    assert results[2].output_data["trends"][0]["region"] == "EU"
+    assert "message" in results[1].output_data
+    assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+def test_worker_execute_batch_isolates_item_failures():
+    registry = SkillRegistry()
+    registry.register_batch(
+        "fetch_trends",
+        lambda inputs: [
+            ValueError("bad region") if i.get("region") == "XX" else {"trends": []}
+            for i in inputs
+        ],
+    )
+    worker = WorkerExecutor(registry=registry)
+    tasks = [
+        Task(goal_id="g1", type="fetch_trends", description="f", input_data={"region": "XX"}),
+        Task(goal_id="g1", type="fetch_trends", description="f", input_data={"region": "US"}),
+    ]
+
+    results = worker.execute_batch(tasks)
+
+    assert results[0].output_data == {"error": "bad region"}
+    assert tasks[0].status == TaskStatus.FAILED
+    assert tasks[1].status == TaskStatus.COMPLETED
+
+def custom_skill(input_data):
+    return {"custom": input_data.get("n", 0) * 2}
+
+def test_worker_process_mode_runs_the_parent_registry_handler():
+    registry = SkillRegistry()
+    registry.register("custom", custom_skill)
+    registry.register_lazy("missing", "skills.no_such_skill", "run")
+    worker = WorkerExecutor(
+        execution_modes={"custom": ExecutionMode.PROCESS, "missing": ExecutionMode.PROCESS},
+        max_processes=1,
+        registry=registry,
+    )
+    custom = Task(goal_id="g1", type="custom", description="custom", input_data={"n": 21})
+    missing = Task(goal_id="g1", type="missing", description="missing")
+
+    with worker:
+        results = [worker.submit(t).result(timeout=30) for t in (custom, missing)]
+
+    assert results[0].output_data == {"custom": 42}
+    assert custom.status == TaskStatus.COMPLETED
+    assert missing.status == TaskStatus.FAILED
+    assert "no_such_skill" in results[1].output_data["error"]
+
+def test_worker_process_mode_rejects_handlers_it_cannot_import():
+    registry = SkillRegistry()
+    registry.register("custom", lambda input_data: {})
+    worker = WorkerExecutor(execution_modes={"custom": ExecutionMode.PROCESS}, registry=registry)
+
+    with pytest.raises(ValueError, match="PROCESS mode"):
+        worker.submit(Task(goal_id="g1", type="custom", description="custom"))
+
+def test_worker_execute_batch_sends_pooled_types_to_their_pools():
+    import threading
+
+    threads = []
+
+    def record_thread(input_data):
+        threads.append(threading.current_thread().name)
+        return {"ok": True}
+
+    registry = SkillRegistry()
+    registry.register("io_skill", record_thread)
+    registry.register("custom", custom_skill)
+    worker = WorkerExecutor(
+        execution_modes={"io_skill": ExecutionMode.THREAD, "custom": ExecutionMode.PROCESS},
+        max_processes=1,
+        registry=registry,
+    )
+    tasks = [
+        Task(goal_id="g1", type="io_skill", description="io"),
+        Task(goal_id="g1", type="custom", description="cpu", input_data={"n": 2}),
+        Task(goal_id="g1", type="unknown_type", description="generic"),
+    ]
+
+    with worker:
+        results = worker.execute_batch(tasks)
+
+    assert [r.task_id for r in results] == [t.id for t in tasks]
+    assert threads and threads[0].startswith("chimera-worker")
+    assert results[1].output_data == {"custom": 4}
+    assert "message" in results[2].output_data
+    assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+def custom_batch(inputs):
+    import os
+    import threading
+
+    where = {"pid": os.getpid(), "thread": threading.current_thread().name}
+    return [{"custom": i.get("n", 0) * 2, **where} for i in inputs]
+
+def test_worker_execute_batch_runs_batch_forms_in_their_types_pool():
+    import os
+
+    registry = SkillRegistry()
+    for task_type in ("io_skill", "cpu_skill"):
+        registry.register(task_type, lambda i: pytest.fail("batch form should be used"))
+        registry.register_batch(task_type, custom_batch)
+    worker = WorkerExecutor(
+        execution_modes={"io_skill": ExecutionMode.THREAD, "cpu_skill": ExecutionMode.PROCESS},
+        max_processes=1,
+        registry=registry,
+    )
+    tasks = [
+        Task(goal_id="g1", type=task_type, description="d", input_data={"n": n})
+        for task_type in ("io_skill", "cpu_skill") for n in (1, 2)
+    ]
+
+    with worker:
+        results = worker.execute_batch(tasks)
+
+    outputs = [r.output_data for r in results]
+    assert [o["custom"] for o in outputs] == [2, 4, 2, 4]
+    assert all(o["thread"].startswith("chimera-worker") for o in outputs[:2])
+    assert all(o["pid"] == os.getpid() for o in outputs[:2])
+    assert all(o["pid"] != os.getpid() for o in outputs[2:])
+    assert outputs[2]["pid"] == outputs[3]["pid"]  # one call for the group
+    assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+def test_worker_polls_with_backoff_until_stopped():
+    import threading
+    from apps.worker.main import poll
+    from apps.worker.queue import TaskQueue
+
+    queue = TaskQueue()
+
+    class StopAfterWaits(threading.Event):
+        def __init__(self):
+            super().__init__()
+            self.waits = []
+
+        def wait(self, timeout=None):
+            self.waits.append(timeout)
+            if len(self.waits) == 3:
+                # Work shows up while idle: the next poll takes it, the wait resets.
+                queue.enqueue([Task(goal_id="g1", type="generic_research", description="d")])
+            if len(self.waits) == 5:
+                self.set()
+            return self.is_set()
+
+    stop = StopAfterWaits()
+    processed = poll(WorkerExecutor(), queue, stop, min_wait=0.1, max_wait=0.3)
+
+    assert processed == 1
+    assert stop.waits == [0.1, 0.2, 0.3, 0.1, 0.2]
+    assert queue.pending_count() == 0
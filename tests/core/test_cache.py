@@ -0,0 +1,129 @@
+import threading
+import time
+import pytest
+from core.cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_cache_hits_after_first_compute():
+    cache = TTLCache()
+    calls = []
+
+    for _ in range(3):
+        value = cache.get_or_compute("k", lambda: calls.append(1) or "v")
+
+    assert value == "v"
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats.misses, stats.hits, stats.size) == (1, 2, 1)
+
+def test_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.get_or_compute("k", lambda: "old")
+
+    clock.now += 11
+    value = cache.get_or_compute("k", lambda: "new")
+
+    assert value == "new"
+    assert cache.stats().expirations == 1
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)  # touch "a" so "b" is the LRU entry
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+    assert cache.stats().evictions == 2
+
+def test_cache_coalesces_concurrent_requests():
+    cache = TTLCache()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"trends": []}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("k", slow_fetch)))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert len(results) == 10
+    assert cache.stats().coalesced == 9
+
+def test_cache_does_not_store_failures():
+    cache = TTLCache()
+
+    def failing():
+        raise RuntimeError("rate limited")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("k", failing)
+
+    assert cache.get_or_compute("k", lambda: "ok") == "ok"
+
+def test_disk_tier_survives_restart(tmp_path):
+    first = TTLCache(disk_dir=tmp_path)
+    first.get_or_compute("k", lambda: {"trends": [1, 2]})
+
+    second = TTLCache(disk_dir=tmp_path)
+    value = second.get_or_compute("k", lambda: pytest.fail("should be served from disk"))
+
+    assert value == {"trends": [1, 2]}
+    assert second.stats().disk_hits == 1
+
+
+def test_lookup_and_put_share_entries_with_get_or_compute(tmp_path):
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, disk_dir=tmp_path, clock=clock)
+
+    assert cache.lookup("k") == (False, None)
+    cache.put("k", {"v": 1})
+    assert cache.lookup("k") == (True, {"v": 1})
+    assert cache.get_or_compute("k", lambda: {"v": 2}) == {"v": 1}
+
+    restarted = TTLCache(maxsize=4, ttl=10, disk_dir=tmp_path, clock=clock)
+    assert restarted.lookup("k") == (True, {"v": 1})
+    assert restarted.stats().disk_hits == 1
+
+    clock.now += 11
+    assert restarted.lookup("k") == (False, None)
+
+
+@pytest.mark.parametrize("drop", ["invalidate", "clear"])
+def test_invalidate_during_a_fetch_keeps_the_stale_value_out(tmp_path, drop):
+    cache = TTLCache(disk_dir=tmp_path)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(5)
+        return "stale"
+
+    results = []
+    fetch = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", slow_fetch)))
+    fetch.start()
+    started.wait(5)
+    cache.invalidate("k") if drop == "invalidate" else cache.clear()
+    release.set()
+    fetch.join()
+
+    assert results == ["stale"]  # the caller that asked before still gets its answer
+    assert cache.lookup("k") == (False, None)
+    assert cache.get_or_compute("k", lambda: "fresh") == "fresh"
+    assert TTLCache(disk_dir=tmp_path).lookup("k") == (True, "fresh")
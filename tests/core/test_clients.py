@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.clients import ClientManager, PoolLimits, upstream_key
+
+
+@pytest.fixture
+def stub_server():
+    """Local HTTP server that answers every GET after 50ms."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(0.05)
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_upstream_key_ignores_path_and_fills_default_port():
+    assert upstream_key("https://api.example.com/v1/trends?q=1") == "https://api.example.com:443"
+    assert upstream_key("http://localhost:8080/x") == "http://localhost:8080"
+    with pytest.raises(ValueError):
+        upstream_key("/relative")
+
+
+def test_clients_are_shared_per_upstream(stub_server):
+    manager = ClientManager()
+    try:
+        a = manager.http(f"{stub_server}/twitter")
+        b = manager.http(f"{stub_server}/newsapi")
+        c = manager.http("http://other.invalid/")
+        assert a is b
+        assert a is not c
+    finally:
+        manager.shutdown()
+
+
+def test_sync_pool_reuses_connections_and_reports_counts(stub_server):
+    manager = ClientManager(PoolLimits(max_connections=2))
+    try:
+        client = manager.http(stub_server)
+        for _ in range(3):
+            assert client.get(f"{stub_server}/ping").text == "ok"
+
+        [stats] = manager.stats()
+        assert stats.kind == "http"
+        assert stats.acquired == 3
+        assert stats.active == 0
+        assert stats.idle == 1  # one kept-alive connection served all three calls
+    finally:
+        manager.shutdown()
+
+
+async def test_async_pool_limits_concurrency_and_measures_wait(stub_server):
+    manager = ClientManager(PoolLimits(max_connections=2))
+    try:
+        client = manager.http_async(stub_server)
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.get(f"{stub_server}/{i}") for i in range(6)))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.status_code == 200 for r in responses)
+        assert elapsed >= 0.14  # 6 requests, 2 at a time, 50ms each
+        [stats] = manager.stats()
+        assert stats.kind == "http-async"
+        assert stats.acquired == 6
+        assert stats.waited >= 4
+        assert stats.wait_ms_max >= 40
+        assert stats.active == 0
+        assert stats.idle == 2
+    finally:
+        await manager.ashutdown()
+
+
+def test_evict_idle_closes_unused_pools(stub_server):
+    manager = ClientManager(PoolLimits(idle_timeout=0.05))
+    try:
+        client = manager.http(stub_server)
+        client.get(stub_server)
+        assert manager.evict_idle() == 0
+
+        time.sleep(0.1)
+        assert manager.evict_idle() == 1
+        assert client.is_closed
+        assert manager.stats() == []
+        assert manager.http(stub_server) is not client
+    finally:
+        manager.shutdown()
+
+
+def test_shutdown_closes_clients_and_runs_hooks(stub_server):
+    manager = ClientManager()
+    calls = []
+    manager.register_shutdown_hook(lambda: calls.append("closed"))
+    client = manager.http(stub_server)
+
+    manager.shutdown()
+    manager.shutdown()
+
+    assert client.is_closed
+    assert calls == ["closed"]
+    with pytest.raises(RuntimeError):
+        manager.http(stub_server)
+
+    manager.reset()
+    assert not manager.http(stub_server).is_closed
+    manager.shutdown()
+
+
+async def test_shutdown_from_a_running_loop_closes_clients_of_stopped_loops(stub_server):
+    manager = ClientManager()
+    other = asyncio.new_event_loop()
+    try:
+        # A client created on a loop that has since stopped (but is not closed).
+        client = await asyncio.to_thread(
+            lambda: other.run_until_complete(_open_async_client(manager, stub_server))
+        )
+
+        manager.shutdown()  # inside this test's running loop
+        await asyncio.sleep(0.05)
+
+        assert client.is_closed
+    finally:
+        other.close()
+
+
+async def _open_async_client(manager, url):
+    return manager.http_async(url)
+
+
+def test_async_clients_close_with_their_event_loop(stub_server):
+    manager = ClientManager()
+
+    async def call():
+        client = manager.http_async(stub_server)
+        await client.get(stub_server)
+        return client
+
+    clients = [asyncio.run(call()) for _ in range(3)]
+
+    assert all(client.is_closed for client in clients)
+    assert len({id(client) for client in clients}) == 3
+    assert [s for s in manager.stats() if s.kind == "http-async"] == []
+    assert manager._loop_watchers == {}
+    manager.shutdown()
+
+
+def test_clients_of_loops_closed_without_shutdown_are_dropped(stub_server):
+    manager = ClientManager()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(_open_async_client(manager, stub_server))
+    loop.close()  # no shutdown_asyncgens(): the client could not be closed
+
+    async def call():
+        manager.http_async(stub_server)
+        return [s.name for s in manager.stats() if s.kind == "http-async"]
+
+    assert asyncio.run(call()) == [f"http-async:{upstream_key(stub_server)}"]
+    assert manager._loop_watchers == {}
+    manager.shutdown()
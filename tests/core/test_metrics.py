@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from core.metrics import (
+    MetricsRegistry, default_metrics, stage_seconds, start_metrics_server, verdicts_total
+)
+
+
+def test_render_uses_prometheus_text_format():
+    registry = MetricsRegistry()
+    hits = registry.counter("demo_hits_total", "Hits.", ("path",))
+    latency = registry.histogram("demo_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+
+    hits.inc(path='/a"b')
+    hits.inc(2, path='/a"b')
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, stage="plan")
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_hits_total Hits.",
+        "# TYPE demo_hits_total counter",
+        'demo_hits_total{path="/a\\"b"} 3',
+        "# HELP demo_seconds Latency.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{stage="plan",le="0.1"} 1',
+        'demo_seconds_bucket{stage="plan",le="1"} 2',
+        'demo_seconds_bucket{stage="plan",le="+Inf"} 3',
+        'demo_seconds_sum{stage="plan"} 5.55',
+        'demo_seconds_count{stage="plan"} 3',
+    ]
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    latency = registry.histogram("demo_seconds", "Latency.", ("stage",))
+
+    first, second = registry.span(latency, stage="a"), registry.span(latency, stage="b")
+    with first:
+        pass
+    latency.observe(1.0, stage="a")
+
+    assert first is second  # one shared no-op object, nothing allocated per call
+    assert latency.totals() == {}
+
+
+def test_metric_names_cannot_be_reused_with_other_labels():
+    registry = MetricsRegistry()
+    registry.counter("demo_total", "Demo.", ("a",))
+
+    with pytest.raises(ValueError):
+        registry.counter("demo_total", "Demo.", ("b",))
+
+
+async def test_pipeline_records_every_stage():
+    from apps.orchestrator.pipeline import SwarmPipeline
+    from core.task_models import Goal
+
+    default_metrics.reset()
+    await SwarmPipeline().run([Goal(description="Find latest tiktok trends") for _ in range(3)])
+
+    totals = stage_seconds.totals()
+    for stage, task_type in [("plan", ""), ("queue_wait", "fetch_trends"),
+                             ("execute", "fetch_trends"), ("execute", "analyze_trends"),
+                             ("judge", "fetch_trends")]:
+        count, seconds = totals[(stage, task_type)]
+        assert count == 3 and seconds >= 0
+    assert verdicts_total.value(task_type="fetch_trends", verdict="valid") == 3
+
+
+def test_queue_wait_is_measured_across_enqueue_and_claim():
+    from apps.worker.queue import TaskQueue
+    from core.task_models import Task
+
+    class FakeClock:
+        now = 1000.0
+
+        def __call__(self):
+            return self.now
+
+    clock = FakeClock()
+    queue = TaskQueue(clock=clock)
+    default_metrics.reset()
+
+    queue.enqueue([Task(goal_id="g", type="publish", description="d")])
+    clock.now += 2.5
+    queue.claim_records(1)
+
+    assert stage_seconds.totals()[("queue_wait", "publish")] == (1, pytest.approx(2.5))
+
+
+def test_metrics_server_serves_the_registry():
+    registry = MetricsRegistry()
+    registry.counter("demo_total", "Demo.").inc()
+    server = start_metrics_server(0, registry, host="127.0.0.1")
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        response = httpx.get(f"{base}/metrics")
+        missing = httpx.get(f"{base}/other")
+    finally:
+        server.shutdown()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "demo_total 1" in response.text
+    assert missing.status_code == 404
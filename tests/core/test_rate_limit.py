@@ -0,0 +1,55 @@
+import pytest
+
+from core.rate_limit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_bucket_allows_burst_then_paces_to_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1)
+    assert waits[4] == pytest.approx(0.1)
+    assert clock.now == pytest.approx(0.2)
+
+
+def test_bucket_refills_up_to_capacity_only():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == pytest.approx(0.1)
+
+
+def test_acquire_times_out():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+
+    with pytest.raises(TimeoutError):
+        bucket.acquire(timeout=0.5)
+
+
+def test_rate_limiter_keeps_one_bucket_per_key():
+    limiter = RateLimiter(limits={"twitter": (1, 2)}, default=(5, 5))
+
+    assert limiter.bucket("twitter") is limiter.bucket("twitter")
+    assert limiter.bucket("twitter").capacity == 2
+    assert limiter.bucket("cms").rate == 5
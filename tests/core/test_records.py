@@ -0,0 +1,73 @@
+import json
+from benchmarks import bench_records
+from core.records import TaskRecord, ResultRecord, trusted_construct
+from core.task_models import Task, Result, TaskStatus
+
+def test_task_record_generates_id_lazily():
+    record = TaskRecord("g1", "fetch_trends", "d")
+
+    assert record._id is None
+    first = record.id
+    assert record.id == first
+    assert len(first) == 36
+
+def test_task_record_round_trips_through_wire_and_model():
+    task = Task(goal_id="g1", type="fetch_trends", description="d", input_data={"region": "US"},
+                depends_on=["upstream-1"])
+
+    wire = json.loads(json.dumps(TaskRecord.from_model(task).to_wire()))
+    rebuilt = TaskRecord.from_wire(wire).to_model()
+
+    assert rebuilt == task
+    assert rebuilt.status is TaskStatus.PENDING
+    assert rebuilt.depends_on == ["upstream-1"]
+
+def test_task_record_reads_wire_payloads_without_depends_on():
+    record = TaskRecord.from_wire(["t1", "g1", "fetch_trends", "d", {}, "pending", 0])
+
+    assert record.depends_on == []
+    assert record.to_model().depends_on == []
+
+def test_result_record_supports_judge_marks():
+    record = ResultRecord("t1", {"out": 1}, 5.0)
+
+    record.mark_invalid("Bad")
+    model = record.to_model()
+
+    assert isinstance(model, Result)
+    assert model.is_valid is False
+    assert model.validation_notes == "Bad"
+    assert model.created_at == record.created_at
+
+def test_trusted_model_behaves_like_validated_model():
+    result = ResultRecord("t1", {"out": 1}, 5.0).to_model()
+
+    result.mark_valid("Good")
+
+    assert Result.model_validate_json(result.model_dump_json()) == result
+    assert result.model_fields_set == set(Result.model_fields)
+
+def test_trusted_construct_matches_pydantic_internals():
+    # trusted_construct writes BaseModel's private slots directly. If pydantic adds,
+    # renames or changes the meaning of one, this fails before the records go wrong.
+    import pickle
+
+    from pydantic import BaseModel
+
+    assert BaseModel.__slots__ == (
+        "__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__"
+    )
+    record = TaskRecord("g", "fetch_trends", "d", {"region": "US"}, depends_on=["t0"])
+    values = dict(record.to_model().__dict__)
+    trusted = trusted_construct(Task, dict(values))
+    constructed = Task.model_construct(**values)
+
+    assert trusted.__getstate__() == constructed.__getstate__()
+    assert trusted == constructed == Task.model_validate(values)
+    assert pickle.loads(pickle.dumps(trusted)) == trusted
+    assert trusted.model_copy(update={"type": "x"}).type == "x"
+
+def test_records_keep_their_benchmark_gains():
+    results = bench_records.run(count=500)
+
+    assert bench_records.check(results) == []
@@ -0,0 +1,102 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.store import SwarmStore
+from core.task_models import Goal, Task, Result, TaskStatus
+
+START = datetime(2026, 3, 1)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SwarmStore(str(tmp_path / "swarm.db"), batch_size=100, flush_interval=0.01)
+    yield store
+    store.close()
+
+
+def test_round_trips_goals_tasks_and_results(store):
+    goal = Goal(description="Find latest tiktok trends", metadata={"region": "us"})
+    task = Task(goal_id=goal.id, type="fetch_trends", description="fetch",
+                input_data={"platform": "tiktok"})
+    result = Result(task_id=task.id, output_data={"trends": [{"title": "a"}]},
+                    execution_time_ms=1.5)
+    result.mark_valid("ok")
+
+    store.save_goals([goal])
+    store.save_tasks([task])
+    store.save_results([result])
+    store.flush()
+
+    assert store.get_goal(goal.id) == goal
+    assert store.get_task(task.id) == task
+    assert store.get_result(result.id) == result
+    assert store.get_task("missing") is None
+
+    # Upserted by id: a later save of the same Task replaces its status.
+    task.status = TaskStatus.COMPLETED
+    store.save_tasks([task])
+    store.flush()
+    assert store.get_task(task.id).status == TaskStatus.COMPLETED
+    assert store.count_tasks() == 1
+
+
+def test_iterators_filter_by_goal_status_validity_and_time(store):
+    goals = [Goal(description=f"goal {i}", created_at=START + timedelta(hours=i)) for i in range(3)]
+    tasks = [
+        Task(goal_id=goal.id, type="write", description="w",
+             created_at=goal.created_at + timedelta(minutes=m),
+             status=TaskStatus.COMPLETED if m else TaskStatus.FAILED)
+        for goal in goals for m in range(4)
+    ]
+    results = [
+        Result(task_id=t.id, output_data={}, execution_time_ms=1.0, created_at=t.created_at,
+               is_valid=t.status == TaskStatus.COMPLETED)
+        for t in tasks
+    ]
+    store.save_goals(goals)
+    store.save_tasks(tasks)
+    store.save_results(results)
+    store.flush()
+
+    later = store.iter_goals(since=START + timedelta(hours=1))
+    assert [g.id for g in later] == [g.id for g in goals[1:]]
+    first_goal = store.iter_tasks(goal_id=goals[0].id, chunk_size=3)
+    assert [t.id for t in first_goal] == [t.id for t in tasks[:4]]
+    assert len(list(store.iter_tasks(status=TaskStatus.FAILED))) == 3
+    assert store.count_tasks(TaskStatus.COMPLETED) == 9
+    invalid = store.iter_results(goal_id=goals[2].id, is_valid=False)
+    assert [r.id for r in invalid] == [results[8].id]
+    window = list(store.iter_results(
+        since=START + timedelta(hours=1), until=START + timedelta(hours=1, minutes=1)
+    ))
+    assert [r.task_id for r in window] == [t.id for t in tasks[4:6]]
+
+
+def test_concurrent_saves_are_batched_and_all_committed(tmp_path):
+    store = SwarmStore(
+        str(tmp_path / "swarm.db"), batch_size=500, flush_interval=0.05, max_pending=2000
+    )
+    task_id = "t"
+
+    def save(n):
+        for _ in range(n // 50):
+            store.save_results([
+                Result(task_id=task_id, output_data={"n": 1}, execution_time_ms=0.1)
+                for _ in range(50)
+            ])
+
+    threads = [threading.Thread(target=save, args=(2500,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    reopened = SwarmStore(str(tmp_path / "swarm.db"))
+    try:
+        assert sum(1 for _ in reopened.iter_results(task_id=task_id)) == 10000
+        assert reopened._reader().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        reopened.close()
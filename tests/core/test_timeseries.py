@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+from core.timeseries import DAY_US, HOUR_US, EngagementHistory, parse_timeframe, to_us
+
+START = to_us("2026-03-01T00:00:00Z")
+
+
+@pytest.fixture
+def history(tmp_path):
+    return EngagementHistory(str(tmp_path / "history"))
+
+
+def test_samples_are_partitioned_by_day_and_aggregated_per_window(history):
+    # "rising" gains 0.01/hour for three days; "flat" stays at 0.5.
+    hours = np.arange(72)
+    history.append(["rising"] * 72, 0.1 + 0.01 * hours, START + hours * HOUR_US)
+    history.append(["flat"] * 72, [0.5] * 72, START + hours * HOUR_US)
+
+    assert history.partitions() == ["2026-03-01", "2026-03-02", "2026-03-03"]
+
+    stats = history.window(START, START + 3 * DAY_US)
+    assert stats["rising"]["samples"] == 72
+    assert stats["rising"]["rate_per_hour"] == pytest.approx(0.01, rel=1e-4)
+    assert stats["rising"]["first"] == pytest.approx(0.1)
+    assert stats["rising"]["last"] == pytest.approx(0.81)
+    assert stats["rising"]["change"] == pytest.approx(0.71, rel=1e-5)
+    assert stats["flat"]["rate_per_hour"] == pytest.approx(0.0, abs=1e-9)
+
+    # A window inside one day only counts that day's samples.
+    day_two = history.window(START + DAY_US, START + DAY_US + 5 * HOUR_US, keys=["rising"])
+    assert set(day_two) == {"rising"}
+    assert day_two["rising"]["samples"] == 6
+    assert day_two["rising"]["first"] == pytest.approx(0.34)
+
+
+def test_moving_average_is_trailing_and_time_based(history):
+    # Out of time order on purpose.
+    history.append(
+        ["a"] * 4,
+        [0.4, 0.1, 0.3, 0.2],
+        [START + 3 * HOUR_US, START, START + 2 * HOUR_US, START + HOUR_US],
+    )
+
+    ts, averages = history.moving_average("a", START, START + DAY_US, window_us=2 * HOUR_US)
+
+    assert list(ts) == [START + i * HOUR_US for i in range(4)]
+    assert averages == pytest.approx([0.1, 0.15, 0.25, 0.35])
+
+
+def test_a_torn_append_is_ignored_and_repaired(history):
+    history.append(["a"], [0.5], [START])
+    day = os.path.join(history.directory, "2026-03-01")
+    with open(os.path.join(day, "ts.i8"), "ab") as f:
+        f.write(np.int64(START + 1).tobytes())  # a writer died after one column
+
+    assert history.window(START, START + DAY_US)["a"]["samples"] == 1
+
+    history.append(["a"], [0.7], [START + HOUR_US])
+    reopened = EngagementHistory(history.directory)
+    ts, scores = reopened.series("a", START, START + DAY_US)
+    assert list(ts) == [START, START + HOUR_US]
+    assert scores == pytest.approx([0.5, 0.7])
+
+
+def test_parse_timeframe():
+    now = START + 10 * DAY_US
+    assert parse_timeframe("7d", now) == (now - 7 * DAY_US, now)
+    assert parse_timeframe("90m", now) == (now - 90 * 60_000_000, now)
+    assert parse_timeframe("2026-03-01T00:00:00Z/2026-03-02T00:00:00Z") == (START, START + DAY_US)
+    with pytest.raises(ValueError, match="timeframe"):
+        parse_timeframe("last week")
@@ -0,0 +1,34 @@
+from benchmarks.harness import BenchResult, compare, measure, percentile
+
+
+def _result(ops, p95, **params):
+    return BenchResult(name="case", params=params, iterations=10, ops_per_sec=ops,
+                       p50_ms=1.0, p95_ms=p95, p99_ms=p95, peak_memory_kb=1.0)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+
+def test_measure_reports_all_metrics():
+    result = measure("noop", lambda: sum(range(100)), iterations=20, params={"n": 100})
+    assert result.key == "noop[n=100]"
+    assert result.iterations == 20
+    assert result.ops_per_sec > 0
+    assert result.p50_ms <= result.p95_ms <= result.p99_ms
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = [_result(1000, 2.0, size=1), _result(1000, 2.0, size=2)]
+    current = [_result(900, 2.2, size=1), _result(500, 4.0, size=2), _result(1, 99.0, size=3)]
+
+    regressions = compare(current, baseline, tolerance=0.2)
+
+    assert {(r.key, r.metric) for r in regressions} == {
+        ("case[size=2]", "ops_per_sec"),
+        ("case[size=2]", "p95_ms"),
+    }
@@ -0,0 +1,107 @@
+import pytest
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """Fresh mock backend and an empty memory + disk cache for each test."""
+    from core.cache import TTLCache
+    from skills.content_generator import skill
+
+    mock = skill.MockBackend(max_batch_size=2)
+    monkeypatch.setattr(skill, "_backend", mock)
+    monkeypatch.setattr(skill, "content_cache", TTLCache(maxsize=8, disk_dir=tmp_path))
+    return mock
+
+
+def test_cache_key_keeps_the_prompt_exact_and_ignores_case_of_format_and_tone():
+    from skills.content_generator import skill
+
+    a = skill.normalize_request({"prompt": "Write about Agentic AI", "tone": "Casual "})
+    b = skill.normalize_request(
+        {"prompt": "Write about Agentic AI", "tone": "casual", "format": "Markdown"}
+    )
+    c = skill.normalize_request(
+        {"prompt": "Write about Agentic AI", "tone": "casual", "format": "html"}
+    )
+    lower = skill.normalize_request({"prompt": "write about agentic ai", "tone": "casual"})
+    spaced = skill.normalize_request({"prompt": "Write about  Agentic AI", "tone": "casual"})
+
+    assert a["prompt"] == "Write about Agentic AI"
+    assert skill.content_cache_key(a, "mock") == skill.content_cache_key(b, "mock")
+    assert skill.content_cache_key(a, "mock") != skill.content_cache_key(c, "mock")
+    assert skill.content_cache_key(a, "mock") != skill.content_cache_key(lower, "mock")
+    assert skill.content_cache_key(a, "mock") != skill.content_cache_key(spaced, "mock")
+    assert skill.content_cache_key(a, "mock") != skill.content_cache_key(a, "other")
+
+
+def test_repeated_prompt_is_served_from_cache_and_counts_saved_tokens(backend):
+    from skills.content_generator import skill
+
+    first = skill.skill_content_generator({"prompt": "Agentic AI", "metadata": {"lang": "en"}})
+    second = skill.skill_content_generator({"prompt": "Agentic AI", "metadata": {"lang": "fr"}})
+
+    assert backend.calls == [1]
+    assert first["tokens_used"] == {"prompt": 10, "completion": 50, "saved": 0}
+    assert second["tokens_used"] == {"prompt": 0, "completion": 0, "saved": 60}
+    assert second["content"] == first["content"]
+    assert second["id"] != first["id"]  # one artifact per call, even from the cache
+    assert second["metadata"] == {"lang": "fr", "generation_model": "mock", "cache_hit": True}
+
+
+def test_metadata_may_be_null(backend):
+    from skills.content_generator import skill
+
+    output = skill.skill_content_generator({"prompt": "Agentic AI", "metadata": None})
+
+    assert output["metadata"] == {"generation_model": "mock", "cache_hit": False}
+
+
+def test_batch_groups_misses_into_few_backend_calls(backend):
+    from skills.content_generator import skill
+
+    skill.skill_content_generator({"prompt": "cached"})
+    outputs = skill.generate_content_batch([
+        {"prompt": "one"},
+        {"prompt": "cached"},
+        {"prompt": "two"},
+        {"prompt": "one"},
+        {"prompt": "three"},
+        {"format": "pdf", "prompt": "four"},
+    ])
+
+    assert backend.calls == [1, 2, 1]  # single call, then 3 unique misses in chunks of 2
+    assert [o["metadata"]["cache_hit"] for o in outputs[:5]] == [False, True, False, True, False]
+    assert outputs[3]["content"] == outputs[0]["content"]
+    assert outputs[3]["id"] != outputs[0]["id"]
+    assert outputs[3]["tokens_used"]["saved"] == outputs[0]["tokens_used"]["prompt"] + 50
+    assert isinstance(outputs[5], ValueError)
+
+
+def test_batch_failure_only_affects_its_chunk(backend, monkeypatch):
+    from skills.content_generator import skill
+
+    original = backend.generate
+
+    def flaky(requests):
+        if any(r["prompt"] == "boom" for r in requests):
+            raise RuntimeError("backend unavailable")
+        return original(requests)
+
+    monkeypatch.setattr(backend, "generate", flaky)
+    outputs = skill.generate_content_batch([{"prompt": "a"}, {"prompt": "b"}, {"prompt": "boom"}])
+
+    assert "content" in outputs[0] and "content" in outputs[1]
+    assert isinstance(outputs[2], RuntimeError)
+
+
+def test_generations_survive_restart_via_disk_tier(backend, tmp_path, monkeypatch):
+    from core.cache import TTLCache
+    from skills.content_generator import skill
+
+    skill.generate_content_batch([{"prompt": "persist me"}])
+    monkeypatch.setattr(skill, "content_cache", TTLCache(maxsize=8, disk_dir=tmp_path))
+
+    [output] = skill.generate_content_batch([{"prompt": "persist me"}])
+
+    assert backend.calls == [1]
+    assert output["metadata"]["cache_hit"] is True
@@ -0,0 +1,92 @@
+import importlib.util
+import json
+import os
+import threading
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "log_triggers", Path(__file__).resolve().parents[1] / "scripts" / "log_triggers.py"
+)
+log_triggers = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(log_triggers)
+
+
+def test_concurrent_appends_keep_every_entry_across_rotations(tmp_path):
+    log = log_triggers.TriggerLog(tmp_path, max_bytes=2_000)
+
+    def write(worker):
+        for i in range(50):
+            log.append(
+                {"timestamp": "2026-01-01T12:00:00", "type": "passage", "message": f"{worker}-{i}"}
+            )
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    messages = [e["message"] for e in log.read()]
+    assert sorted(messages) == sorted(f"{w}-{i}" for w in range(4) for i in range(50))
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert len(index["segments"]) > 1
+    active = len(list(log._entries(log.active_path)))
+    assert sum(s["count"] for s in index["segments"]) + active == 200
+
+def test_time_rotation_compression_and_range_queries(tmp_path):
+    log = log_triggers.TriggerLog(tmp_path, rotate_every="daily", compress=True)
+    for day in (1, 2, 3):
+        for hour in (9, 17):
+            timestamp = f"2026-01-0{day}T{hour:02d}:00:00"
+            log.append({"timestamp": timestamp, "type": "passage", "message": f"{day}/{hour}"})
+    log.append({
+        "timestamp": "2026-01-03T18:00:00", "type": "performance", "message": "slow", "details": "",
+    })
+
+    assert sorted(os.listdir(tmp_path / "")) == [
+        ".lock", "index.json", "triggers-000001.jsonl.gz", "triggers-000002.jsonl.gz",
+        "triggers.jsonl",
+    ]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [(s["first"], s["last"]) for s in index["segments"]] == [
+        ("2026-01-01T09:00:00", "2026-01-01T17:00:00"),
+        ("2026-01-02T09:00:00", "2026-01-02T17:00:00"),
+    ]
+
+    in_range = [
+        e["message"] for e in log.read(since="2026-01-01T12:00:00", until="2026-01-03T10:00:00")
+    ]
+    assert in_range == ["1/17", "2/9", "2/17", "3/9"]
+    assert [e["message"] for e in log.read(type="performance")] == ["slow"]
+
+    # Segments outside the range are not opened at all.
+    (tmp_path / "triggers-000001.jsonl.gz").write_bytes(b"not gzip")
+    since_day_2 = [e["message"] for e in log.read(since="2026-01-02T00:00:00")]
+    assert since_day_2 == ["2/9", "2/17", "3/9", "3/17", "slow"]
+
+def test_legacy_json_log_is_migrated_on_first_write(tmp_path):
+    legacy = [{"timestamp": "2025-12-31T23:00:00", "type": "passage", "message": "old"}]
+    (tmp_path / "logs.json").write_text(json.dumps(legacy))
+    log = log_triggers.TriggerLog(tmp_path)
+
+    log.append({"timestamp": "2026-01-01T00:00:00", "type": "passage", "message": "new"})
+
+    assert [e["message"] for e in log.read()] == ["old", "new"]
+    assert not (tmp_path / "logs.json").exists()
+    assert (tmp_path / "logs.json.migrated").exists()
+
+
+def test_rotation_after_the_index_is_lost_keeps_sealed_segments(tmp_path):
+    log = log_triggers.TriggerLog(tmp_path)
+    log.append({"timestamp": "2026-01-01T12:00:00", "type": "passage", "message": "first"})
+    log.rotate()
+    (tmp_path / "index.json").unlink()
+
+    log.append({"timestamp": "2026-01-01T13:00:00", "type": "passage", "message": "second"})
+    log.rotate()
+
+    segments = ["triggers-000001.jsonl", "triggers-000002.jsonl"]
+    assert sorted(p.name for p in tmp_path.glob("triggers-*")) == segments
+    assert [e["message"] for e in log.read()] == ["first", "second"]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [s["file"] for s in index["segments"]] == segments
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def channel_server():
+    """
+    Local stand-in for the channel APIs:
+      /slow/<ms>  accepts the post after <ms> milliseconds
+      /flaky      answers 503 twice, then accepts
+      /limited    answers 429 every time
+      /rejects    answers 400
+    Yields (base url, hits per path, Idempotency-Key headers per path).
+    """
+    hits = {}
+    keys = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                hits[self.path] = hits.get(self.path, 0) + 1
+                keys.setdefault(self.path, []).append(self.headers.get("Idempotency-Key"))
+                count = hits[self.path]
+
+            status = 200
+            if self.path.startswith("/slow/"):
+                time.sleep(int(self.path.rsplit("/", 1)[1]) / 1000)
+            elif self.path == "/flaky" and count <= 2:
+                status = 503
+            elif self.path == "/limited":
+                status = 429
+            elif self.path == "/rejects":
+                status = 400
+
+            reply = {"post_id": f"{body['channel']}-{count}"} if status == 200 else {}
+            payload = json.dumps(reply).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits, keys
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    from skills.publisher import skill
+
+    monkeypatch.setattr(skill, "BACKOFF_MULTIPLIER", 0.01)
+    monkeypatch.setattr(skill, "BACKOFF_MAX", 0.02)
+
+
+def test_publishes_to_all_channels_concurrently(channel_server):
+    from skills.publisher import skill
+
+    base, _, _ = channel_server
+    channels = [{"type": f"site{i}", "config": {"url": f"{base}/slow/200"}} for i in range(5)]
+
+    start = time.perf_counter()
+    output = skill.skill_publisher({"content_id": "c-1", "channels": channels})
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # ~ the slowest channel, not 5 x 200ms
+    assert [r["channel"] for r in output["results"]] == [f"site{i}" for i in range(5)]
+    assert all(r["status"] == "success" and r["post_id"].startswith(f"site{i}-")
+               for i, r in enumerate(output["results"]))
+
+
+def test_transient_failures_are_retried(channel_server, fast_backoff):
+    from skills.publisher import skill
+
+    base, hits, _ = channel_server
+    channels = [{"type": "cms", "config": {"url": f"{base}/flaky"}}]
+    output = skill.skill_publisher({"channels": channels})
+
+    [result] = output["results"]
+    assert result == {
+        "channel": "cms", "status": "success", "post_id": "cms-3", "error": None, "attempts": 3,
+    }
+    assert hits["/flaky"] == 3
+
+
+def test_retries_reuse_one_idempotency_key(channel_server, fast_backoff):
+    from skills.publisher import skill
+
+    base, _, keys = channel_server
+    channels = [{"type": "cms", "config": {"url": f"{base}/flaky"}}]
+    skill.skill_publisher({"content_id": "c-7", "channels": channels})
+
+    [key] = set(keys["/flaky"])
+    assert key.startswith("c-7:cms:")
+    assert keys["/flaky"] == [key] * 3
+
+
+def test_channels_of_the_same_type_get_distinct_idempotency_keys(channel_server):
+    from skills.publisher import skill
+
+    base, hits, keys = channel_server
+    channels = [
+        {"type": "twitter", "config": {"url": f"{base}/slow/0", "account": "@brand"}},
+        {"type": "twitter", "config": {"url": f"{base}/slow/0", "account": "@brand_support"}},
+    ]
+    skill.skill_publisher({"content_id": "c-9", "channels": channels})
+    first = set(keys["/slow/0"])
+    # Re-publishing with the channels reordered reuses each channel's own key.
+    skill.skill_publisher({"content_id": "c-9", "channels": channels[::-1]})
+
+    assert hits["/slow/0"] == 4
+    assert len(first) == 2 and all(k.startswith("c-9:twitter:") for k in first)
+    assert set(keys["/slow/0"]) == first
+
+
+def test_failing_channels_do_not_block_the_others(channel_server, fast_backoff):
+    from skills.publisher import skill
+
+    base, hits, _ = channel_server
+    output = skill.skill_publisher({"channels": [
+        {"type": "twitter", "config": {"url": f"{base}/limited"}},
+        {"type": "webhook", "config": {"url": f"{base}/rejects"}},
+        {"type": "rss", "config": {"url": f"{base}/slow/10"}},
+        {"type": "mastodon"},
+    ]})
+
+    limited, rejected, ok, mocked = output["results"]
+    assert limited["status"] == "failed" and limited["error"] == "HTTP 429"
+    assert limited["attempts"] == skill.MAX_ATTEMPTS
+    assert rejected["status"] == "failed" and rejected["attempts"] == 1
+    assert hits["/rejects"] == 1
+    assert ok["status"] == "success"
+    assert mocked["status"] == "success" and mocked["post_id"].startswith("post-")
+
+
+def test_fanout_pool_is_created_lazily_and_shut_down_with_the_clients():
+    from core.clients import default_clients
+    from skills.publisher import skill
+
+    skill.skill_publisher({"content_id": "c-8", "channels": [{"type": "mock"}]})
+    assert skill._fanout_pool is not None
+
+    default_clients.reset()
+
+    assert skill._fanout_pool is None
@@ -0,0 +1,114 @@
+import time
+import numpy as np
+import pytest
+
+
+def make_trends(n, seed=0):
+    rng = np.random.default_rng(seed)
+    sources = ["twitter", "newsapi", "tiktok"]
+    scores = rng.uniform(0, 1, n)
+    return [
+        {
+            "title": f"trend-{i}",
+            "engagement_score": float(scores[i]),
+            "source": sources[i % 3],
+            "timestamp": 1_700_000_000 + i,
+        }
+        for i in range(n)
+    ]
+
+
+def test_analyze_trends_filters_and_aggregates():
+    from skills.trend_analyzer import skill
+
+    trends = [
+        {"title": "a", "engagement_score": 0.9, "source": "twitter"},
+        {"title": "b", "engagement_score": 0.3, "source": "twitter"},
+        {"title": "c", "engagement_score": 0.7, "source": "newsapi"},
+    ]
+
+    report = skill.analyze_trends({"trends": trends, "min_engagement": 0.5})
+
+    assert report["total_trends"] == 3
+    assert report["matching_trends"] == 2
+    assert [t["title"] for t in report["top_trends"]] == ["a", "c"]
+    assert report["by_source"]["twitter"]["count"] == 2
+    assert report["by_source"]["twitter"]["mean_score"] == pytest.approx(0.6)
+    assert report["by_source"]["newsapi"]["max_score"] == pytest.approx(0.7)
+    assert report["percentiles"]["p50"] == pytest.approx(0.8)
+
+
+def test_analyze_trends_flags_zscore_anomalies():
+    from skills.trend_analyzer import skill
+
+    trends = [{"title": f"t{i}", "engagement_score": 0.5, "source": "twitter"} for i in range(50)]
+    trends.append({"title": "spike", "engagement_score": 1.0, "source": "twitter"})
+
+    report = skill.analyze_trends({"trends": trends, "zscore_threshold": 3})
+
+    assert [a["title"] for a in report["anomalies"]] == ["spike"]
+    assert report["anomalies"][0]["z_score"] > 3
+
+
+def test_analyze_trends_handles_empty_input():
+    from skills.trend_analyzer import skill
+
+    report = skill.analyze_trends({"min_engagement": 0.5})
+
+    assert report["total_trends"] == 0
+    assert report["analysis_report"] == "No trends to analyze."
+
+
+def test_analyze_trends_chunks_inputs_over_the_memory_budget():
+    from skills.trend_analyzer import skill
+
+    trends = make_trends(100_000)
+    for i in range(0, len(trends), 9_000):
+        trends[i]["engagement_score"] = 5.0
+    for i in range(0, len(trends), 7):
+        trends[i]["history"] = {"samples": 3, "change": 0.1, "rate_per_hour": (i % 97) / 97}
+    options = {"min_engagement": 0.3, "percentiles": [0, 25, 50, 99, 100], "top_k": 20}
+
+    whole = skill.analyze_trends({"trends": trends, **options})
+    chunked = skill.analyze_trends({"trends": trends, "memory_budget_mb": 1, **options})
+
+    assert chunked["memory_bytes"] < 1024 * 1024 < whole["memory_bytes"]
+    assert len(chunked["anomalies"]) == 12
+    for key in whole:
+        if key != "memory_bytes":
+            assert chunked[key] == whole[key], key
+
+
+def test_analyze_trends_scales_to_100k():
+    from skills.trend_analyzer import skill
+
+    trends = make_trends(100_000)
+
+    start = time.perf_counter()
+    report = skill.analyze_trends({"trends": trends, "min_engagement": 0.5, "top_k": 5})
+    elapsed = time.perf_counter() - start
+
+    assert report["total_trends"] == 100_000
+    assert len(report["top_trends"]) == 5
+    assert report["memory_bytes"] == 100_000 * 16
+    assert report["time_range"]["start"] < report["time_range"]["end"]
+    assert elapsed < 2.0
+
+
+def test_analyze_trends_ranks_momentum_from_history():
+    from skills.trend_analyzer import skill
+
+    trends = [
+        {"title": "fading", "engagement_score": 0.9, "source": "twitter",
+         "history": {"samples": 5, "change": -0.3, "rate_per_hour": -0.05}},
+        {"title": "rising", "engagement_score": 0.4, "source": "twitter",
+         "history": {"samples": 5, "change": 0.3, "rate_per_hour": 0.05}},
+        {"title": "new", "engagement_score": 0.6, "source": "newsapi"},
+    ]
+
+    report = skill.analyze_trends({"trends": trends})
+
+    assert [m["title"] for m in report["momentum"]] == ["rising", "fading"]
+    assert report["momentum"][0] == {
+        "title": "rising", "rate_per_hour": 0.05, "change": 0.3, "samples": 5
+    }
@@ -27,3 +27,385 @@ def test_trend_output_structure():
     assert isinstance(item.get("title"), str)
     assert isinstance(item.get("engagement_score"), float)
     assert isinstance(item.get("url"), str)
+
+
+def test_trend_cache_key_normalizes_equivalent_requests():
+    from skills.trend_fetcher import skill
+
+    a = skill.trend_cache_key(
+        {"query": "Agentic  AI", "sources": ["twitter", "newsapi"], "limit": 10}
+    )
+    b = skill.trend_cache_key(
+        {"limit": 10, "sources": ["newsapi", "twitter"], "query": "agentic ai"}
+    )
+    c = skill.trend_cache_key({"query": "agentic ai", "sources": ["twitter"], "limit": 10})
+
+    assert a == b
+    assert a != c
+
+
+def test_fetch_trends_cached_reuses_response():
+    from skills.trend_fetcher import skill
+
+    payload = {"query": "cache-test", "sources": ["twitter"], "timeframe": "24h", "limit": 5}
+
+    first = skill.fetch_trends_cached(payload)
+    second = skill.fetch_trends_cached(dict(payload))
+
+    assert first["request_id"] == second["request_id"]
+
+
+def test_cache_hits_still_record_history_and_feed_the_pool(tmp_path, monkeypatch):
+    from core.cache import TTLCache
+    from core.timeseries import EngagementHistory
+    from skills.trend_fetcher import skill
+    from skills.trend_fetcher.search import TrendIndex
+
+    monkeypatch.setattr(skill, "trend_cache", TTLCache())
+    monkeypatch.setattr(skill, "trend_history", EngagementHistory(str(tmp_path)))
+    payload = {"query": "side-effects", "timeframe": "24h"}
+
+    first = skill.fetch_trends_cached(payload)
+    monkeypatch.setattr(skill, "trend_pool", TrendIndex())
+    second = skill.fetch_trends_cached(dict(payload))  # cache hit
+
+    assert skill.trend_cache.stats().hits == 1
+    assert [t["history"]["samples"] for t in first["trends"]] == [1, 1]
+    assert [t["history"]["samples"] for t in second["trends"]] == [2, 2]
+    assert len(skill.trend_pool) == len(second["trends"])
+    # What the cache holds stays as fetched.
+    found, cached = skill.trend_cache.lookup(skill.trend_cache_key(payload))
+    assert found and all("history" not in t for t in cached["trends"])
+
+
+def test_fetch_trends_batch_dedupes_equivalent_requests():
+    from skills.trend_fetcher import skill
+
+    outputs = skill.fetch_trends_batch([
+        {"query": "batch-test", "region": "US"},
+        {"query": "Batch-Test", "region": "US"},
+        {"query": "batch-test", "region": "EU"},
+    ])
+
+    assert len(outputs) == 3
+    assert outputs[0] is outputs[1]
+    assert outputs[0]["request_id"] != outputs[2]["request_id"]
+
+
+@pytest.fixture
+def stub_trend_server():
+    """Local stand-in for the trend APIs: /<source>?delay=<s> answers after `delay` seconds."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            source = url.path.strip("/")
+            if source == "broken":
+                self.send_response(500)
+                self.end_headers()
+                return
+            params = parse_qs(url.query)
+            time.sleep(DELAYS.get(source, 0.0))
+            body = {"trends": [
+                {"name": f"{source}-{i}", "score": 0.5 + i / 10, "link": f"https://{source}.example/{i}"}
+                for i in range(3)
+            ], "query": params.get("query", [""])[0]}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    DELAYS = {"twitter": 0.0, "newsapi": 0.2, "tiktok": 2.0}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield {name: f"{base}/{name}" for name in ("twitter", "newsapi", "tiktok", "broken")}
+    server.shutdown()
+    server.server_close()
+
+
+async def test_stream_trends_yields_in_response_order(stub_trend_server):
+    from skills.trend_fetcher import skill
+
+    stream = skill.stream_trends(
+        {"query": "ai", "sources": ["newsapi", "twitter"], "limit": 4},
+        endpoints=stub_trend_server,
+    )
+    trends = [trend async for trend in stream]
+
+    assert [t["source"] for t in trends] == ["twitter", "twitter", "twitter", "newsapi"]
+    assert trends[0] == {
+        "title": "twitter-0",
+        "engagement_score": 0.5,
+        "source": "twitter",
+        "url": "https://twitter.example/0",
+        "source_url": "https://twitter.example/0",
+        "sample_items": [],
+        "metadata": {},
+    }
+    assert trends[-1]["title"] == "newsapi-0"
+    assert stream.errors == {}
+
+
+async def test_slow_and_failing_sources_do_not_hold_up_the_stream(stub_trend_server):
+    import time
+    from skills.trend_fetcher import skill
+
+    start = time.perf_counter()
+    result = await skill.fetch_trends_async(
+        {"sources": ["tiktok", "twitter", "broken", "unknown"], "timeouts": {"tiktok": 0.3}},
+        endpoints=stub_trend_server,
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert {t["source"] for t in result["trends"]} == {"twitter"}
+    assert set(result["errors"]) == {"tiktok", "broken", "unknown"}
+    assert "timed out" in result["errors"]["tiktok"]
+    assert result["trends"][2]["engagement_score"] == 0.7
+
+
+async def test_first_trend_arrives_before_slowest_source(stub_trend_server):
+    import time
+    from skills.trend_fetcher import skill
+
+    start = time.perf_counter()
+    stream = skill.stream_trends(
+        {"sources": ["tiktok", "twitter"]}, endpoints=stub_trend_server, timeout=0.5
+    )
+    async for trend in stream:
+        first_at = time.perf_counter() - start
+        break
+
+    assert trend["source"] == "twitter"
+    assert first_at < 0.3
+
+
+def _trend(title, source, score, samples=()):
+    return {"title": title, "engagement_score": score, "source": source,
+            "url": f"https://{source}.example", "sample_items": list(samples), "metadata": {}}
+
+
+def test_dedupe_merges_the_same_topic_across_sources():
+    from skills.trend_fetcher.dedup import dedupe_trends
+
+    trends = [
+        _trend("Agentic AI", "twitter", 0.9, ["Great tweet about agents"]),
+        _trend("Python 3.14", "newsapi", 0.8, ["Python 3.14 features announced"]),
+        _trend("agentic  AI", "newsapi", 0.5, ["Companies adopt agentic AI"]),
+        _trend("Python 3.13", "reddit", 0.4),
+        _trend("New GPT model", "reddit", 0.3, ["OpenAI launches a GPT model today in the US"]),
+        _trend(
+            "OpenAI ships GPT", "newsapi", 0.2,
+            ["OpenAI launches a GPT model today in the US market"],
+        ),
+    ]
+
+    clusters = dedupe_trends(trends, threshold=0.5)
+
+    titles = [c["title"] for c in clusters]
+    assert titles == ["Agentic AI", "Python 3.14", "Python 3.13", "New GPT model"]
+    agentic = clusters[0]
+    assert agentic["engagement_score"] == pytest.approx(1 - 0.1 * 0.5)
+    assert agentic["sources"] == ["twitter", "newsapi"]
+    assert agentic["sample_items"] == ["Great tweet about agents", "Companies adopt agentic AI"]
+    assert agentic["duplicates"] == [
+        {
+            "title": "agentic  AI",
+            "source": "newsapi",
+            "url": "https://newsapi.example",
+            "engagement_score": 0.5,
+        }
+    ]
+    # Matched on sample items alone; trends without duplicates are unchanged.
+    assert clusters[3]["sources"] == ["reddit", "newsapi"]
+    assert clusters[1] == trends[1]
+    assert trends[0]["sample_items"] == ["Great tweet about agents"]
+
+
+def test_dedup_threshold_is_a_request_setting():
+    from skills.trend_fetcher import skill
+
+    trends = [_trend("Agentic AI", "twitter", 0.9), _trend("Agentic AI agents", "newsapi", 0.5)]
+
+    assert len(skill.dedupe_trends(trends, threshold=0.5)) == 1
+    assert len(skill.dedupe_trends(trends, threshold=0.9)) == 2
+    assert skill.dedup_threshold({"dedup_threshold": 0.9}) == 0.9
+    assert skill.dedup_threshold({"dedup": False}) is None
+
+
+async def test_stream_yields_each_topic_once_and_merges_later_copies():
+    import httpx
+    from skills.trend_fetcher import skill
+
+    def handler(request):
+        source = request.url.path.strip("/")
+        return httpx.Response(200, json={"trends": [
+            {"title": "Agentic AI", "score": 0.5},
+            {"title": f"{source} only"},
+        ]})
+
+    endpoints = {name: f"http://stub/{name}" for name in ("twitter", "newsapi")}
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        stream = skill.stream_trends(
+            {"sources": ["twitter", "newsapi"]}, client=client, endpoints=endpoints
+        )
+        trends = [trend async for trend in stream]
+        raw = skill.stream_trends(
+            {"sources": ["twitter", "newsapi"], "dedup": False}, client=client, endpoints=endpoints
+        )
+        raw_trends = [trend async for trend in raw]
+
+    titles = sorted(t["title"] for t in stream.trends)
+    assert titles == ["Agentic AI", "newsapi only", "twitter only"]
+    first, merged = [t for t in trends if t["title"] == "Agentic AI"]
+    assert first["engagement_score"] == 0.5 and "sources" not in first
+    assert merged["engagement_score"] == 0.75 and merged["revision"] == 1
+    assert sorted(merged["sources"]) == ["newsapi", "twitter"]
+    assert merged in stream.trends
+    assert len(raw_trends) == 4
+
+
+async def test_stream_limit_caps_the_merged_topics():
+    import httpx
+    from skills.trend_fetcher import skill
+
+    def handler(request):
+        source = request.url.path.strip("/")
+        return httpx.Response(200, json={"trends": [
+            {"title": "Agentic AI", "score": 0.5},
+            {"title": f"{source} first"},
+            {"title": f"{source} second"},
+        ]})
+
+    endpoints = {name: f"http://stub/{name}" for name in ("twitter", "newsapi")}
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        stream = skill.stream_trends(
+            {"sources": ["twitter", "newsapi"], "limit": 2}, client=client, endpoints=endpoints
+        )
+        trends = [trend async for trend in stream]
+
+    assert len(stream.trends) == 2
+    assert stream.trends[0]["title"] == "Agentic AI"
+    assert stream.trends[0]["engagement_score"] == 0.75
+    assert {t["title"] for t in trends} == {t["title"] for t in stream.trends}
+
+
+def test_fetch_annotates_trends_with_their_engagement_history(tmp_path):
+    import time
+    from core.timeseries import HOUR_US, EngagementHistory
+    from skills.trend_fetcher import skill
+
+    history = EngagementHistory(str(tmp_path))
+    now = time.time_ns() // 1000
+    history.append(["agentic ai", "agentic ai"], [0.55, 0.75], [now - 2 * HOUR_US, now - HOUR_US])
+
+    trends = skill.attach_history(
+        [_trend("Agentic AI", "twitter", 0.95), _trend("Python 3.14", "newsapi", 0.8)],
+        {"timeframe": "24h"},
+        history=history,
+    )
+
+    agentic, python = trends
+    assert agentic["history"]["samples"] == 3
+    assert agentic["history"]["rate_per_hour"] > 0.15
+    assert python["history"]["samples"] == 1
+    with pytest.raises(ValueError, match="timeframe"):
+        skill.attach_history(
+            [_trend("x", "twitter", 0.1)], {"timeframe": "recently"}, history=history
+        )
+
+
+def _indexed_trends():
+    return [
+        {
+            **_trend("Agentic AI", "twitter", 0.9, ["Agents everywhere"]),
+            "metadata": {"region": "us", "language": "en"},
+        },
+        {
+            **_trend("Python 3.14", "newsapi", 0.8, ["Python release notes"]),
+            "metadata": {"region": "us", "language": "en"},
+        },
+        {
+            **_trend("AI crypto agents", "twitter", 0.7, ["crypto trading bots"]),
+            "metadata": {"region": "eu", "language": "de"},
+        },
+        {
+            **_trend("AI regulation", "newsapi", 0.6, ["EU AI act"]),
+            "metadata": {"region": "eu", "language": "en"},
+        },
+    ]
+
+
+def test_trend_index_answers_boolean_queries():
+    from skills.trend_fetcher.search import QueryError, TrendIndex
+
+    index = TrendIndex(_indexed_trends())
+
+    def titles(query):
+        return [t["title"] for t in index.match(query)]
+
+    assert titles("ai") == ["Agentic AI", "AI crypto agents", "AI regulation"]
+    assert titles("ai agents") == ["Agentic AI", "AI crypto agents"]
+    assert titles("ai -crypto source:twitter") == ["Agentic AI"]
+    assert titles("python OR (regulation AND region:eu)") == ["Python 3.14", "AI regulation"]
+    assert titles('language:de OR region:"us"') == ["Agentic AI", "Python 3.14", "AI crypto agents"]
+    assert index.count("NOT ai") == 1
+    with pytest.raises(QueryError):
+        index.match("(ai OR python")
+
+
+def test_trend_index_ranks_top_k_with_bm25():
+    from skills.trend_fetcher.search import TrendIndex
+
+    index = TrendIndex(_indexed_trends())
+
+    ranked = index.search("agentic ai agents", limit=2)
+
+    # Matching more (and rarer) words ranks higher; title words count double.
+    assert [t["title"] for t, _ in ranked] == ["Agentic AI", "AI crypto agents"]
+    assert ranked[0][1] > ranked[1][1] > 0
+    # Bare words are alternatives; filters and exclusions still apply.
+    assert [t["title"] for t, _ in index.search("python regulation region:eu")] == ["AI regulation"]
+    assert [t["title"] for t, _ in index.search("ai -agents", limit=5)] == ["AI regulation"]
+
+
+def test_trend_index_replaces_refetched_trends_and_caps_its_size():
+    from skills.trend_fetcher.search import TrendIndex
+
+    index = TrendIndex(max_docs=3)
+    index.add_many(_indexed_trends())
+    assert len(index) == 3
+    assert index.count("python") == 1 and index.count("agentic") == 0  # oldest dropped
+
+    index.add({**_trend("Python 3.14", "newsapi", 0.95, ["Free-threaded build"])})
+    assert len(index) == 3
+    (python,) = index.match("python")
+    assert python["engagement_score"] == 0.95
+    assert index.match("notes") == []
+
+
+def test_search_trends_queries_the_pool_of_fetched_trends():
+    from skills.trend_fetcher import skill
+
+    skill.fetch_trends({"query": "pool-test"})
+
+    ranked = skill.search_trends({"query": "python release", "limit": 1})["trends"]
+    assert [t["title"] for t in ranked] == ["Python 3.14"]
+    assert ranked[0]["relevance"] > 0
+    matched = skill.search_trends({"query": "agentic source:twitter", "mode": "match"})["trends"]
+    assert {t["title"] for t in matched} == {"Agentic AI"}
+    given = skill.search_trends({"query": "crypto", "trends": _indexed_trends()})["trends"]
+    assert [t["title"] for t in given] == ["AI crypto agents"]